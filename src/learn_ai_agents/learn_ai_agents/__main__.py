@@ -3,30 +3,45 @@
 This module provides the CLI runner for starting the development server.
 """
 
-import logging
+from __future__ import annotations
 
-import uvicorn
+import os
+import sys
 
 from learn_ai_agents.logging import get_logger, setup_logging
 
-# Initialize logging first thing
-setup_logging(level=logging.INFO, use_colors=True)
 logger = get_logger(__name__)
 
+# Set LEARN_AI_AGENTS_RELOAD=1 to enable hot-reload during development
+RELOAD_ENV = "LEARN_AI_AGENTS_RELOAD"
+
 
 def run() -> None:
     """Run the FastAPI application server.
 
-    Starts the Uvicorn server with hot-reload enabled for development.
-    The server runs on all interfaces (0.0.0.0) on port 8000.
+    Starts the Uvicorn server on all interfaces (0.0.0.0) on port 8000.
+    Hot-reload (and its file watcher) is only enabled when LEARN_AI_AGENTS_RELOAD=1.
+    The uvloop event loop and httptools parser are selected explicitly instead of
+    being probed at startup (uvloop is not available on Windows).
+
+    Logging setup and the uvicorn import happen here rather than at module
+    import time, so importing this module stays cheap.
     """
-    logger.info("Starting server on http://0.0.0.0:8000")
+    import uvicorn
+
+    setup_logging(level="INFO", use_colors=True)
+
+    reload = os.getenv(RELOAD_ENV, "0") == "1"
+
+    logger.info(f"Starting server on http://0.0.0.0:8000 (reload={'on' if reload else 'off'})")
     # Run by module path so --reload works
     uvicorn.run(
         "learn_ai_agents.asgi:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
@@ -4,23 +4,39 @@ This module provides the application factory function for creating
 FastAPI app instances with dependency injection.
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
 import importlib
+import os
+import sys
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
 
 from learn_ai_agents.infrastructure.bootstrap.app_container import AppContainer
-from learn_ai_agents.infrastructure.inbound.controllers.discovery.discovery import router as discovery_router
 from learn_ai_agents.logging import get_logger
-from learn_ai_agents.settings import AppSettings
+from learn_ai_agents.settings import AppSettings, UseCaseConfig
 
 logger = get_logger(__name__)
 
+# Set EAGER_ROUTERS=1 to import every router factory at startup (e.g. in CI, to catch broken import paths).
+# Routers are also imported at startup whenever the OpenAPI schema is enabled, so it lists every endpoint.
+EAGER_ROUTERS_ENV = "EAGER_ROUTERS"
+
 
+@functools.cache
 def load_callable(import_path: str) -> Callable:
     """Dynamically load a callable from an import path.
 
+    Results are memoized, and already-imported modules are taken straight
+    from ``sys.modules`` without going through the import machinery.
+
     Args:
         import_path: Import path in format 'module.path:function_name'
             e.g., 'learn_ai_agents.infrastructure.inbound.controllers.agents.basic_answer:get_router'
@@ -33,14 +49,155 @@ def load_callable(import_path: str) -> Callable:
         ImportError: If module cannot be imported.
         AttributeError: If function not found in module.
     """
-    if ":" not in import_path:
+    module_path, _, function_name = import_path.rpartition(":")
+    if not module_path:
         raise ValueError(f"Invalid import path '{import_path}'. Expected format 'module:function'")
 
-    module_path, function_name = import_path.rsplit(":", 1)
-    module = importlib.import_module(module_path)
+    module = sys.modules.get(module_path) or importlib.import_module(module_path)
     return getattr(module, function_name)
 
 
+class LazyUseCaseRoute(BaseRoute):
+    """Placeholder route that imports a use case router on its first request.
+
+    Matches every HTTP request under the use case path prefix. The router factory
+    (and everything its controller module imports) is only loaded when the first
+    matching request arrives; the built router is cached and handles all requests.
+    The import runs in a worker thread, once, however many first requests arrive
+    together.
+
+    Lazy routes are never part of the OpenAPI schema, so they are only used when
+    the schema is disabled.
+
+    Attributes:
+        use_case_name: Name of the use case in settings.
+        use_case_config: Configuration passed to the router factory.
+        default_response_class: Response class for routes that do not set one
+            (the app's default, as include_router would apply).
+    """
+
+    def __init__(
+        self,
+        use_case_name: str,
+        use_case_config: UseCaseConfig,
+        default_response_class: type[Response] = ORJSONResponse,
+    ) -> None:
+        self.use_case_name = use_case_name
+        self.use_case_config = use_case_config
+        self.default_response_class = default_response_class
+        self.path_prefix = use_case_config.info.path_prefix.rstrip("/")
+        if not self.path_prefix:
+            # An empty prefix would match every path and shadow all other routes
+            raise ValueError(f"Use case '{use_case_name}' needs a non-empty path_prefix to be loaded lazily")
+        self._router: APIRouter | None = None
+        self._lock = asyncio.Lock()
+
+    def _build_router(self) -> APIRouter:
+        """Import the router factory and build the router."""
+        logger.info(f"🔌 Loading router for use case: {self.use_case_name}")
+        get_router = load_callable(self.use_case_config.info.router_factory)  # type: ignore[arg-type]
+        router = APIRouter(default_response_class=self.default_response_class)
+        router.include_router(get_router(self.use_case_config))
+        return router
+
+    async def _resolve_router(self) -> APIRouter:
+        """Build the router on first use, without blocking the event loop."""
+        if self._router is None:
+            async with self._lock:
+                if self._router is None:
+                    self._router = await asyncio.to_thread(self._build_router)
+        return self._router
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        if path == self.path_prefix or path.startswith(self.path_prefix + "/"):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: str):
+        if self._router is None:
+            raise NoMatchFound(name, path_params)
+        return self._router.url_path_for(name, **path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = await self._resolve_router()
+        await router(scope, receive, send)
+
+
+def register_lazy_router(app: FastAPI, use_case_name: str, use_case_config: UseCaseConfig) -> None:
+    """Register a use case router that is imported on its first request.
+
+    Args:
+        app: The FastAPI application.
+        use_case_name: Name of the use case in settings.
+        use_case_config: Configuration of the use case (must define router_factory).
+    """
+    app.router.routes.append(
+        LazyUseCaseRoute(use_case_name, use_case_config, default_response_class=app.router.default_response_class)
+    )
+
+
+def _register_routers(app: FastAPI, app_settings: AppSettings) -> None:
+    """Register the use case routers and the discovery router on the app.
+
+    Lazy routers only add a placeholder route here; their controller modules
+    are imported on the first request that hits their path prefix. Routers are
+    registered eagerly when EAGER_ROUTERS=1 or the OpenAPI schema is enabled.
+
+    Args:
+        app: The FastAPI application.
+        app_settings: Application settings with the use case configurations.
+    """
+    # Dynamically register routers from settings
+    # The OpenAPI schema only lists routes included in the app, so serving it needs every router
+    eager_routers = os.getenv(EAGER_ROUTERS_ENV) == "1" or app_settings.enable_openapi
+    logger.info(f"🔌 Registering routers ({'eager' if eager_routers else 'lazy'})...")
+
+    specs: list[tuple[str, str, UseCaseConfig]] = []
+    for use_case_name, use_case_cfg in app_settings.use_cases.items():
+        # Skip if no router_factory defined
+        if not use_case_cfg.info.router_factory:
+            logger.debug(f"⏭️  Skipping {use_case_name} (no router_factory defined)")
+            continue
+        cfg = app_settings.resolve_ref(use_case_name, "use_case")
+        specs.append((use_case_name, use_case_cfg.info.router_factory, cfg))
+
+    if not eager_routers:
+        for use_case_name, _, cfg in specs:
+            # Defer the controller import until the first request hits this prefix
+            register_lazy_router(app, use_case_name, cfg)
+            logger.info(f"✅ Registered lazy router for use case: {use_case_name}")
+    else:
+        # Import every router factory up front and report all failures at once
+        errors: list[tuple[str, Exception]] = []
+        for use_case_name, import_path, cfg in specs:
+            try:
+                # Load the router factory, call it to get the router and register it
+                router = load_callable(import_path)(cfg)
+                app.include_router(router)
+                logger.info(f"✅ Registered router for use case: {use_case_name}")
+            except Exception as e:
+                logger.error(f"❌ Failed to register router for {use_case_name}: {e}")
+                errors.append((use_case_name, e))
+
+        if errors:
+            failed = ", ".join(f"{name} ({error})" for name, error in errors)
+            raise RuntimeError(f"Failed to register routers for: {failed}") from errors[0][1]
+
+    logger.info("✅ All routers registered")
+
+    # Register discovery router (not in use_cases but always available)
+    from learn_ai_agents.infrastructure.inbound.controllers.discovery.discovery import router as discovery_router
+
+    app.include_router(discovery_router)
+    logger.info("✅ Discovery router registered")
+
+
 def create_app(app_settings: AppSettings) -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -93,45 +250,24 @@ def create_app(app_settings: AppSettings) -> FastAPI:
 
             logger.info("✅ Application shutdown complete")
 
+    # Disable the OpenAPI schema and docs pages when not needed (e.g., production)
+    docs_kwargs: dict[str, str | None] = {}
+    if not app_settings.enable_openapi:
+        logger.info("📕 OpenAPI schema and docs disabled")
+        docs_kwargs = {"openapi_url": None, "docs_url": None, "redoc_url": None}
+
     # Create FastAPI app with lifecycle management
     app = FastAPI(
         title="Learn AI Agents",
         description="A didactic project for learning AI agent development with Hexagonal Architecture",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        **docs_kwargs,  # type: ignore[arg-type]
     )
 
-    # Dynamically register routers from settings
-    logger.info("🔌 Registering routers...")
+    _register_routers(app, app_settings)
 
-    for use_case_name, use_case_cfg in app_settings.use_cases.items():
-        # Skip if no router_factory defined
-        if not use_case_cfg.info.router_factory:
-            logger.debug(f"⏭️  Skipping {use_case_name} (no router_factory defined)")
-            continue
-
-        try:
-            # Load the router factory function dynamically
-            get_router = load_callable(use_case_cfg.info.router_factory)
-
-            # Get the use case configuration
-            cfg = app_settings.resolve_ref(use_case_name, "use_case")
-
-            # Call the factory to get the router and register it
-            router = get_router(cfg)
-            app.include_router(router)
-
-            logger.info(f"✅ Registered router for use case: {use_case_name}")
-        except Exception as e:
-            logger.error(f"❌ Failed to register router for {use_case_name}: {e}")
-            raise
-
-    logger.info("✅ All routers registered")
-    
-    # Register discovery router (not in use_cases but always available)
-    app.include_router(discovery_router)
-    logger.info("✅ Discovery router registered")
-    
     logger.info("✅ Application created successfully")
 
     return app
@@ -0,0 +1,26 @@
+"""Shared base class and field defaults for Pydantic DTOs."""
+
+from uuid import uuid4
+
+from pydantic import BaseModel, ConfigDict
+
+
+def uuid4_hex() -> str:
+    """Return a new UUID4 as a 32-character hex string, for ID fields' ``default_factory``.
+
+    ``.hex`` skips the dashed formatting of ``str(uuid4())``, which matters for
+    IDs generated on every request, such as conversation IDs.
+    """
+    return uuid4().hex
+
+
+class BaseDTO(BaseModel):
+    """Base class for all Pydantic DTOs.
+
+    DTOs are only read after construction, so they are frozen. Their core
+    schema is built on first use (validation, serialization or a FastAPI route
+    that references them) rather than when the DTO module is imported.
+    Subclasses may extend ``model_config``; Pydantic merges it with this one.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
@@ -1,39 +1,50 @@
-"""DTOs for basic answer use case."""
+"""DTOs for basic answer use case.
 
+The DTOs are only read after construction, so they are frozen. Result DTOs
+are built by the use cases from trusted agent output and only flow outwards,
+so they are slotted dataclasses that orjson encodes without validation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
 from typing import Literal
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from learn_ai_agents.application.dtos._base import BaseDTO, uuid4_hex
 
 
-class ConfigDTO(BaseModel):
+class ConfigDTO(BaseDTO):
     """Configuration for the answer request."""
 
-    conversation_id: str = Field(default_factory=lambda: str(uuid4()))
+    conversation_id: str = Field(default_factory=uuid4_hex)
 
 
-class AnswerRequestDTO(BaseModel):
+class AnswerRequestDTO(BaseDTO):
     """Request DTO for basic question-answering."""
 
     config: ConfigDTO = Field(default=..., description="Configuration for the answer request.")
     message: str = Field(default=..., description="The user's message to the assistant.")
 
 
-class AssistantMessageDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AssistantMessageDTO:
     """DTO representing a message from the assistant."""
 
     role: Literal["assistant"] = "assistant"
     content: str
 
 
-class AnswerResultDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AnswerResultDTO:
     """Result DTO containing the assistant's response."""
 
     conversation_id: str
     message: AssistantMessageDTO
 
 
-class AnswerStreamEventDTO(BaseModel):
+class AnswerStreamEventDTO(BaseDTO):
     """
     Stream event DTO for real-time streaming responses.
 
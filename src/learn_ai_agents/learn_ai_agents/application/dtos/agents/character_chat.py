@@ -2,28 +2,40 @@
 
 This module defines the DTOs (Data Transfer Objects) used for chatting with
 Baldur's Gate 3 characters using RAG (Retrieval-Augmented Generation).
+
+These DTOs sit on the per-request and per-stream-event path, so they are
+frozen and reject unknown fields. Result DTOs are built by the use cases from
+trusted agent output and only flow outwards, so they are slotted dataclasses
+that orjson encodes without validation.
 """
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from typing import Any, Literal
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, TypeAdapter
+
+from learn_ai_agents.application.dtos._base import BaseDTO, uuid4_hex
+
+_HOT_PATH_CONFIG = ConfigDict(frozen=True, extra="forbid", populate_by_name=True, validate_assignment=False)
 
 
-class CharacterChatConfigDTO(BaseModel):
+class CharacterChatConfigDTO(BaseDTO):
     """Configuration for the character chat request.
 
     Attributes:
         conversation_id: Unique identifier for the conversation thread.
-            Defaults to a new UUID if not provided.
+            Defaults to a new UUID hex string if not provided.
     """
 
-    conversation_id: str = Field(default_factory=lambda: str(uuid4()))
+    model_config = _HOT_PATH_CONFIG
 
+    conversation_id: str = Field(default_factory=uuid4_hex)
 
-class CharacterChatRequestDTO(BaseModel):
+
+class CharacterChatRequestDTO(BaseDTO):
     """Request DTO for BG3 character chat.
 
     This DTO crosses the API boundary and contains everything needed to
@@ -36,6 +48,8 @@ class CharacterChatRequestDTO(BaseModel):
         document_id: ID of the document/collection to use as knowledge source.
     """
 
+    model_config = _HOT_PATH_CONFIG
+
     config: CharacterChatConfigDTO = Field(
         default_factory=CharacterChatConfigDTO,
         description="Configuration for the chat request.",
@@ -48,7 +62,8 @@ class CharacterChatRequestDTO(BaseModel):
     )
 
 
-class ToolCallDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ToolCallDTO:
     """DTO representing a tool call made by the agent.
 
     Attributes:
@@ -62,7 +77,8 @@ class ToolCallDTO(BaseModel):
     output: Any | None = None
 
 
-class AssistantMessageDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AssistantMessageDTO:
     """DTO representing a message from the assistant.
 
     Attributes:
@@ -74,7 +90,8 @@ class AssistantMessageDTO(BaseModel):
     content: str
 
 
-class CharacterChatResultDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CharacterChatResultDTO:
     """Result DTO containing the character's response.
 
     Attributes:
@@ -90,7 +107,7 @@ class CharacterChatResultDTO(BaseModel):
     tool_calls: list[ToolCallDTO] | None = None
 
 
-class CharacterChatStreamEventDTO(BaseModel):
+class CharacterChatStreamEventDTO(BaseDTO):
     """Stream event DTO for real-time streaming responses.
 
     Used with Server-Sent Events (SSE) or NDJSON to stream partial
@@ -105,8 +122,23 @@ class CharacterChatStreamEventDTO(BaseModel):
         tool_output: Output from the tool (for "tool_end" events).
     """
 
+    model_config = _HOT_PATH_CONFIG
+
     kind: Literal["delta", "tool_start", "tool_end", "done"] = "delta"
     delta: str | None = None
     tool_name: str | None = None
     tool_input: Any | None = None
     tool_output: Any | None = None
+
+
+@functools.cache
+def get_stream_event_adapter() -> TypeAdapter[CharacterChatStreamEventDTO]:
+    """Get the cached TypeAdapter used to serialize stream events.
+
+    Built on first use rather than at import time, so importing the DTOs does
+    not pay for building the serializer (the models themselves defer_build).
+
+    Returns:
+        TypeAdapter for CharacterChatStreamEventDTO.
+    """
+    return TypeAdapter(CharacterChatStreamEventDTO)
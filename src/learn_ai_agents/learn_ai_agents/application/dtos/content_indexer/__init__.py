@@ -1,15 +1,35 @@
-"""Content indexer DTOs."""
-
-from .source_ingestion import (
-    SourceIngestionRequestDTO,
-    SourceIngestionResponseDTO,
-    DocumentMetadataDTO,
-)
-from .document_splitting import (
-    DocumentSplittingRequestDTO,
-    DocumentSplittingResponseDTO,
-    ChunkMetadataDTO,
-)
+"""Content indexer DTOs.
+
+The DTOs are re-exported lazily (PEP 562), so importing one of them only
+imports the submodule that defines it.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .document_splitting import (
+        ChunkMetadataDTO,
+        DocumentSplittingRequestDTO,
+        DocumentSplittingResponseDTO,
+    )
+    from .source_ingestion import (
+        DocumentMetadataDTO,
+        SourceIngestionRequestDTO,
+        SourceIngestionResponseDTO,
+    )
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS: dict[str, str] = {
+    "SourceIngestionRequestDTO": ".source_ingestion",
+    "SourceIngestionResponseDTO": ".source_ingestion",
+    "DocumentMetadataDTO": ".source_ingestion",
+    "DocumentSplittingRequestDTO": ".document_splitting",
+    "DocumentSplittingResponseDTO": ".document_splitting",
+    "ChunkMetadataDTO": ".document_splitting",
+}
 
 __all__ = [
     "SourceIngestionRequestDTO",
@@ -19,3 +39,17 @@ __all__ = [
     "DocumentSplittingResponseDTO",
     "ChunkMetadataDTO",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported DTO on first access and cache it in the package namespace."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,16 @@ This module defines the DTOs used for splitting documents into chunks
 for vector storage and retrieval.
 """
 
-from typing import List, Optional
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
+from pydantic import Field
 
-class DocumentSplittingRequestDTO(BaseModel):
+from learn_ai_agents.application.dtos._base import BaseDTO
+
+
+class DocumentSplittingRequestDTO(BaseDTO):
     """Request DTO for document splitting.
 
     This DTO contains the information needed to split a document
@@ -32,9 +36,13 @@ class DocumentSplittingRequestDTO(BaseModel):
     )
 
 
-class ChunkMetadataDTO(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChunkMetadataDTO:
     """DTO for chunk metadata.
 
+    A slotted, frozen dataclass rather than a BaseModel: one instance is created
+    per chunk, so large documents would otherwise allocate thousands of models.
+
     Attributes:
         chunk_id: Unique identifier combining document_id:splitter_approach:split_index.
         document_id: The ID of the parent document.
@@ -50,11 +58,11 @@ class ChunkMetadataDTO(BaseModel):
     split_index: int
     chunk_size: int
     splitter: str
-    h1_title: Optional[str] = None
-    h2_header: Optional[str] = None
+    h1_title: str | None = None
+    h2_header: str | None = None
 
 
-class DocumentSplittingResponseDTO(BaseModel):
+class DocumentSplittingResponseDTO(BaseDTO):
     """Response DTO for document splitting.
 
     This DTO is returned after successfully splitting document(s) into chunks.
@@ -69,5 +77,5 @@ class DocumentSplittingResponseDTO(BaseModel):
 
     document_id: str = Field(..., description="The document ID of processed documents")
     total_chunks_created: int = Field(..., description="Total number of chunks created")
-    chunks: List[ChunkMetadataDTO] = Field(..., description="Metadata for all created chunks")
+    chunks: list[ChunkMetadataDTO] = Field(..., description="Metadata for all created chunks")
     message: str = Field(default="Documents split successfully")
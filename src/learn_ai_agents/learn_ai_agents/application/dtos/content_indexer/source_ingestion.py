@@ -4,12 +4,16 @@ This module defines the DTOs used for content ingestion operations,
 including web scraping and document storage.
 """
 
+from __future__ import annotations
+
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from learn_ai_agents.application.dtos._base import BaseDTO
 
 
-class SourceIngestionRequestDTO(BaseModel):
+class SourceIngestionRequestDTO(BaseDTO):
     """Request DTO for content ingestion.
 
     This DTO crosses the API boundary and contains the information needed
@@ -41,7 +45,7 @@ class SourceIngestionRequestDTO(BaseModel):
     )
 
 
-class DocumentMetadataDTO(BaseModel):
+class DocumentMetadataDTO(BaseDTO):
     """DTO for document metadata.
 
     Attributes:
@@ -61,7 +65,7 @@ class DocumentMetadataDTO(BaseModel):
     character_name: str
 
 
-class SourceIngestionResponseDTO(BaseModel):
+class SourceIngestionResponseDTO(BaseDTO):
     """Response DTO for content ingestion.
 
     This DTO is returned after successfully ingesting content.
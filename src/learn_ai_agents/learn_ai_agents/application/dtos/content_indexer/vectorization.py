@@ -4,10 +4,16 @@ This module defines the DTOs used for vectorizing document chunks
 and storing them in a vector database.
 """
 
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+from typing import Literal
 
-class VectorizationRequestDTO(BaseModel):
+from pydantic import Field
+
+from learn_ai_agents.application.dtos._base import BaseDTO
+
+
+class VectorizationRequestDTO(BaseDTO):
     """Request DTO for vectorization.
 
     This DTO contains the information needed to vectorize document chunks.
@@ -29,18 +35,26 @@ class VectorizationRequestDTO(BaseModel):
     )
 
 
-class VectorizationResponseDTO(BaseModel):
+class VectorizationResponseDTO(BaseDTO):
     """Response DTO for vectorization.
 
-    This DTO is returned after successfully vectorizing and storing chunks.
+    This DTO is returned after successfully vectorizing and storing chunks, or
+    while the embedding batch of a large document is still running.
 
     Attributes:
         document_id: The document ID of the processed chunks.
         total_vectors_created: Total number of vectors created and stored.
         vectors: List of metadata for each created vector.
         message: A success message.
+        status: "completed" once the vectors are stored, "pending" while an
+            embedding batch is still running (repeat the request to check again).
+        batch_id: ID of the embedding batch, for batch-embedded documents.
     """
 
     document_id: str = Field(..., description="The document ID of processed chunks")
     total_vectors_created: int = Field(..., description="Total number of vectors created and stored")
     message: str = Field(default="Chunks vectorized successfully")
+    status: Literal["completed", "pending"] = Field(
+        default="completed", description="Whether the vectors are stored or an embedding batch is still running"
+    )
+    batch_id: str | None = Field(default=None, description="ID of the embedding batch, if one was used")
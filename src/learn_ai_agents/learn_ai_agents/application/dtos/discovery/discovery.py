@@ -1,14 +1,20 @@
 """DTOs for discovery functionality.
 
 This module defines Data Transfer Objects for discovery endpoints.
+
+Discovery DTOs are built from the application's own settings and only flow
+outwards, so they are plain slotted, frozen dataclasses instead of Pydantic
+models: construction does no validation and orjson encodes them natively.
 """
 
-from typing import Any
+from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Any
 
 
-class ComponentInfoDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ComponentInfoDTO:
     """DTO for component information.
 
     Attributes:
@@ -22,7 +28,8 @@ class ComponentInfoDTO(BaseModel):
     instance: str
 
 
-class ComponentDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ComponentDTO:
     """DTO representing a component.
 
     Attributes:
@@ -38,17 +45,19 @@ class ComponentDTO(BaseModel):
     params: dict[str, Any]
 
 
-class ComponentsResponseDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ComponentsResponseDTO:
     """DTO for components discovery response.
 
     Attributes:
-        components: Dictionary mapping component type to list of components.
+        components: Dictionary mapping component type to the components of that type.
     """
 
-    components: dict[str, list[ComponentDTO]]
+    components: dict[str, tuple[ComponentDTO, ...]]
 
 
-class AgentInfoDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AgentInfoDTO:
     """DTO for agent information.
 
     Attributes:
@@ -60,7 +69,8 @@ class AgentInfoDTO(BaseModel):
     description: str
 
 
-class AgentDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AgentDTO:
     """DTO representing an agent.
 
     Attributes:
@@ -76,17 +86,19 @@ class AgentDTO(BaseModel):
     components: dict[str, str | dict[str, str]] | None = None
 
 
-class AgentsResponseDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AgentsResponseDTO:
     """DTO for agents discovery response.
 
     Attributes:
         agents: List of available agents.
     """
 
-    agents: list[AgentDTO]
+    agents: tuple[AgentDTO, ...]
 
 
-class UseCaseInfoDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UseCaseInfoDTO:
     """DTO for use case information.
 
     Attributes:
@@ -100,7 +112,8 @@ class UseCaseInfoDTO(BaseModel):
     path_prefix: str
 
 
-class UseCaseDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UseCaseDTO:
     """DTO representing a use case.
 
     Attributes:
@@ -116,17 +129,19 @@ class UseCaseDTO(BaseModel):
     components: dict[str, str | dict[str, str]] | None = None
 
 
-class UseCasesResponseDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UseCasesResponseDTO:
     """DTO for use cases discovery response.
 
     Attributes:
         use_cases: List of available use cases.
     """
 
-    use_cases: list[UseCaseDTO]
+    use_cases: tuple[UseCaseDTO, ...]
 
 
-class AllResourcesResponseDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AllResourcesResponseDTO:
     """DTO for all resources discovery response.
 
     Attributes:
@@ -135,6 +150,6 @@ class AllResourcesResponseDTO(BaseModel):
         use_cases: List of use cases.
     """
 
-    components: dict[str, list[ComponentDTO]]
-    agents: list[AgentDTO]
-    use_cases: list[UseCaseDTO]
+    components: dict[str, tuple[ComponentDTO, ...]]
+    agents: tuple[AgentDTO, ...]
+    use_cases: tuple[UseCaseDTO, ...]
@@ -1,5 +1,5 @@
 """
-Inbound Port: BasicAnswerPort
+Inbound Port: AgentAnswerPort
 
 HEXAGONAL ARCHITECTURE ROLE: INBOUND PORT (Entry Point Interface)
 ===================================================================
@@ -35,15 +35,22 @@ The Flow:
 
 In this file:
 -------------
-We define the BasicAnswerPort protocol which specifies:
-- invoke(): Synchronous question answering
-- stream(): Streaming question answering with real-time chunks
+We define the AgentAnswerPort protocol which specifies:
+- ainvoke(): Async question answering
+- astream(): Async streaming question answering with real-time chunks
 """
 
-from collections.abc import AsyncIterator, Iterable
-from typing import Protocol
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.agents.basic_answer import AnswerRequestDTO, AnswerResultDTO, AnswerStreamEventDTO
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.agents.basic_answer import (
+        AnswerRequestDTO,
+        AnswerResultDTO,
+        AnswerStreamEventDTO,
+    )
 
 
 class AgentAnswerPort(Protocol):
@@ -67,40 +74,10 @@ class AgentAnswerPort(Protocol):
 
     Methods:
     --------
-    invoke() : Synchronous request/response (deprecated)
-    stream() : Synchronous streaming (deprecated)
     ainvoke() : Async request/response
     astream() : Async streaming with Server-Sent Events
     """
 
-    def invoke(self, cmd: AnswerRequestDTO) -> AnswerResultDTO:
-        """
-        Handle a question synchronously and return a complete answer.
-
-        DEPRECATED: Use ainvoke() instead.
-
-        Args:
-            cmd (AnswerRequestDTO): Request containing the user's question
-
-        Returns:
-            AnswerResultDTO: Response containing the agent's answer
-        """
-        ...
-
-    def stream(self, cmd: AnswerRequestDTO) -> Iterable[AnswerStreamEventDTO]:
-        """
-        Handle a question with streaming response for real-time feedback.
-
-        DEPRECATED: Use astream() instead.
-
-        Args:
-            cmd (AnswerRequestDTO): Same as invoke(), but response streams
-
-        Yields:
-            AnswerStreamEventDTO: Stream events (deltas and completion signal)
-        """
-        ...
-
     async def ainvoke(self, cmd: AnswerRequestDTO) -> AnswerResultDTO:
         """
         Handle a question asynchronously and return a complete answer.
@@ -1,9 +1,16 @@
 """Inbound port for basic answer functionality."""
 
+from __future__ import annotations
+
 from collections.abc import AsyncIterable
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from learn_ai_agents.application.dtos.agents.basic_answer import AnswerRequestDTO, AnswerResultDTO, AnswerStreamEventDTO
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.agents.basic_answer import (
+        AnswerRequestDTO,
+        AnswerResultDTO,
+        AnswerStreamEventDTO,
+    )
 
 
 class BasicAnswerPort(Protocol):
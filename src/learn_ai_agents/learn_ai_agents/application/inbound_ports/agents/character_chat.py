@@ -40,14 +40,17 @@ We define the CharacterChatPort protocol which specifies:
 - astream(): Async streaming question answering with real-time chunks
 """
 
-from collections.abc import AsyncIterator
-from typing import Protocol
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.agents.character_chat import (
-    CharacterChatRequestDTO,
-    CharacterChatResultDTO,
-    CharacterChatStreamEventDTO,
-)
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.agents.character_chat import (
+        CharacterChatRequestDTO,
+        CharacterChatResultDTO,
+        CharacterChatStreamEventDTO,
+    )
 
 
 class CharacterChatPort(Protocol):
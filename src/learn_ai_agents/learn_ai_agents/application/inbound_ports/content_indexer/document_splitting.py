@@ -4,22 +4,24 @@ This module defines the port (interface) that controllers use to access
 document splitting functionality.
 """
 
-from abc import ABC, abstractmethod
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.content_indexer.document_splitting import (
-    DocumentSplittingRequestDTO,
-    DocumentSplittingResponseDTO,
-)
+from typing import TYPE_CHECKING, Protocol
 
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.content_indexer.document_splitting import (
+        DocumentSplittingRequestDTO,
+        DocumentSplittingResponseDTO,
+    )
 
-class DocumentSplittingInboundPort(ABC):
+
+class DocumentSplittingInboundPort(Protocol):
     """Port for document splitting use cases.
 
     This abstract interface defines the contract for document splitting
     operations exposed to the API layer.
     """
 
-    @abstractmethod
     async def split_documents(self, request: DocumentSplittingRequestDTO) -> DocumentSplittingResponseDTO:
         """Split documents into chunks and store them.
 
@@ -4,12 +4,15 @@ This module defines the port (interface) that controllers use to access
 content ingestion functionality.
 """
 
-from typing import Protocol
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.content_indexer.source_ingestion import (
-    SourceIngestionRequestDTO,
-    SourceIngestionResponseDTO,
-)
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.content_indexer.source_ingestion import (
+        SourceIngestionRequestDTO,
+        SourceIngestionResponseDTO,
+    )
 
 
 class SourceIngestionInboundPort(Protocol):
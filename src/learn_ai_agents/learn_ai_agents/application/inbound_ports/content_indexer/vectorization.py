@@ -4,22 +4,24 @@ This module defines the port (interface) that controllers use to access
 vectorization functionality.
 """
 
-from abc import ABC, abstractmethod
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.content_indexer.vectorization import (
-    VectorizationRequestDTO,
-    VectorizationResponseDTO,
-)
+from typing import TYPE_CHECKING, Protocol
 
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.content_indexer.vectorization import (
+        VectorizationRequestDTO,
+        VectorizationResponseDTO,
+    )
 
-class VectorizationInboundPort(ABC):
+
+class VectorizationInboundPort(Protocol):
     """Port for vectorization use cases.
 
     This abstract interface defines the contract for vectorization
     operations exposed to the API layer.
     """
 
-    @abstractmethod
     async def vectorize_chunks(self, request: VectorizationRequestDTO) -> VectorizationResponseDTO:
         """Vectorize document chunks and store them in the vector database.
 
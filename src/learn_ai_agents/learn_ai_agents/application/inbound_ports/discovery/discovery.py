@@ -4,24 +4,26 @@ This module defines the port (interface) that controllers use to access
 discovery functionality.
 """
 
-from abc import ABC, abstractmethod
+from __future__ import annotations
 
-from learn_ai_agents.application.dtos.discovery.discovery import (
-    AgentsResponseDTO,
-    AllResourcesResponseDTO,
-    ComponentsResponseDTO,
-    UseCasesResponseDTO,
-)
+from typing import TYPE_CHECKING, Protocol
 
+if TYPE_CHECKING:
+    from learn_ai_agents.application.dtos.discovery.discovery import (
+        AgentsResponseDTO,
+        AllResourcesResponseDTO,
+        ComponentsResponseDTO,
+        UseCasesResponseDTO,
+    )
 
-class DiscoveryPort(ABC):
+
+class DiscoveryPort(Protocol):
     """Port for discovery use cases.
 
     This abstract interface defines the contract for discovery operations
     exposed to the API layer.
     """
 
-    @abstractmethod
     def discover_components(self) -> ComponentsResponseDTO:
         """Discover all available components.
 
@@ -30,7 +32,6 @@ class DiscoveryPort(ABC):
         """
         ...
 
-    @abstractmethod
     def discover_agents(self) -> AgentsResponseDTO:
         """Discover all available agents.
 
@@ -39,7 +40,6 @@ class DiscoveryPort(ABC):
         """
         ...
 
-    @abstractmethod
     def discover_use_cases(self) -> UseCasesResponseDTO:
         """Discover all available use cases.
 
@@ -48,7 +48,6 @@ class DiscoveryPort(ABC):
         """
         ...
 
-    @abstractmethod
     def discover_all(self) -> AllResourcesResponseDTO:
         """Discover all system resources.
 
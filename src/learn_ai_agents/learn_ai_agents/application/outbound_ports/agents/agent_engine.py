@@ -1,6 +1,6 @@
 """Outbound port for AI agent engine."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from learn_ai_agents.domain.models.agents.config import Config
@@ -14,7 +14,10 @@ class AgentEngine(Protocol):
         """Process a message asynchronously and return the complete response."""
         ...
 
-    async def astream(self, new_message: Message, config: Config, **kwargs) -> AsyncGenerator[ChunkDelta, None]:
-        """Process a message and stream the response asynchronously in real-time chunks."""
-        yield ChunkDelta()  # Makes this an async generator for type checking
+    def astream(self, new_message: Message, config: Config, **kwargs) -> AsyncIterator[ChunkDelta]:
+        """Process a message and stream the response asynchronously in real-time chunks.
+
+        Declared with ``def`` returning an AsyncIterator: implementations are
+        ``async def`` generators, which is exactly that shape.
+        """
         ...
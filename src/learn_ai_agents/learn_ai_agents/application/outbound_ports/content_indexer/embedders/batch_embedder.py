@@ -0,0 +1,68 @@
+"""Outbound port for asynchronous batch embedder operations.
+
+This module defines the port (interface) for embedding large sets of texts
+through a provider's asynchronous batch API, where a job is submitted once
+and its results are collected later.
+"""
+
+from typing import Protocol
+
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
+
+
+class BatchEmbedderPort(Protocol):
+    """Protocol defining the interface for batch embedder operations.
+
+    Batch APIs trade latency for throughput: jobs may take minutes or hours
+    to complete, but they are cheaper and have much higher rate limits than
+    synchronous embedding calls. This suits offline ingestion of large documents.
+
+    Step 2 of the content indexing pipeline: Vectorization (batch path)
+    """
+
+    async def embed_batch_async(self, texts: list[str]) -> str:
+        """Submit a batch job that embeds the given texts.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            The batch ID to pass to ``poll_batch``.
+
+        Raises:
+            DomainException: If the batch cannot be submitted.
+        """
+        ...
+
+    async def poll_batch(self, batch_id: str) -> EmbeddingArray | None:
+        """Check a batch job and return its embeddings once it has completed.
+
+        Args:
+            batch_id: The batch ID returned by ``embed_batch_async``.
+
+        Returns:
+            float32 matrix with one row per submitted text, in submission order,
+            or None if the batch is still running.
+
+        Raises:
+            EmbeddingBatchFailedException: If the batch failed, expired or was cancelled,
+                so it will never produce embeddings.
+            DomainException: If the batch status or results cannot be retrieved right now.
+        """
+        ...
+
+    def get_dimensions(self) -> int:
+        """Get the dimensionality of embeddings produced by this embedder.
+
+        Returns:
+            The number of dimensions in each embedding vector.
+        """
+        ...
+
+    def get_model_name(self) -> str:
+        """Get the name/identifier of the embedding model.
+
+        Returns:
+            The model name (e.g., "text-embedding-3-small").
+        """
+        ...
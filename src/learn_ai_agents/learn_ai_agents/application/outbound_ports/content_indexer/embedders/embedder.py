@@ -6,6 +6,8 @@ using various embedding models.
 
 from typing import Protocol
 
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
+
 
 class EmbedderPort(Protocol):
     """Protocol defining the interface for embedder operations.
@@ -17,15 +19,14 @@ class EmbedderPort(Protocol):
     Step 2 of the content indexing pipeline: Vectorization
     """
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
         """Generate embeddings for a list of texts.
 
         Args:
             texts: List of text strings to embed.
 
         Returns:
-            List of embedding vectors, one per input text.
-            Each embedding is a list of floats.
+            float32 matrix of shape [len(texts), dimensions], one row per input text.
 
         Raises:
             DomainException: If embedding generation fails.
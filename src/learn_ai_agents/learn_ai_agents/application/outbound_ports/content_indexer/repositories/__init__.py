@@ -2,8 +2,10 @@
 
 from .chunk_repository import ChunkRepositoryPort
 from .document_repository import DocumentRepositoryPort
+from .embedding_batch_repository import EmbeddingBatchRepositoryPort
 
 __all__ = [
     "ChunkRepositoryPort",
     "DocumentRepositoryPort",
+    "EmbeddingBatchRepositoryPort",
 ]
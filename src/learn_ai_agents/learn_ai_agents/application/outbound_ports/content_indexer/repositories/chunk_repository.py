@@ -4,6 +4,7 @@ This module defines the port (interface) for document chunk persistence operatio
 in a traditional database (separate from vector storage).
 """
 
+from collections.abc import Sequence
 from typing import Protocol
 
 from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
@@ -30,11 +31,28 @@ class ChunkRepositoryPort(Protocol):
         """
         ...
 
-    async def save_chunks(self, chunks: list[DocumentChunk]) -> list[DocumentChunk]:
+    async def save_chunks(self, chunks: Sequence[DocumentChunk]) -> int:
         """Save multiple document chunks to the repository.
 
         Args:
-            chunks: List of DocumentChunks to save.
+            chunks: DocumentChunks to save (any sequence, e.g. list or tuple).
+
+        Returns:
+            Number of chunks saved.
+
+        Raises:
+            DomainException: If save fails.
+        """
+        ...
+
+    async def save_chunks_returning(self, chunks: Sequence[DocumentChunk]) -> list[DocumentChunk]:
+        """Save multiple document chunks and return them as stored.
+
+        Use this only when the saved chunks are needed back; save_chunks
+        avoids building the result list.
+
+        Args:
+            chunks: DocumentChunks to save.
 
         Returns:
             List of saved chunks with updated IDs.
@@ -86,13 +104,30 @@ class ChunkRepositoryPort(Protocol):
         """
         ...
 
-    async def upsert_chunks(self, chunks: list[DocumentChunk]) -> list[DocumentChunk]:
+    async def upsert_chunks(self, chunks: Sequence[DocumentChunk]) -> int:
         """Upsert multiple document chunks to the repository.
 
         Updates existing chunks (matched by chunk_id) or inserts new ones.
 
         Args:
-            chunks: List of DocumentChunks to upsert.
+            chunks: DocumentChunks to upsert (any sequence, e.g. list or tuple).
+
+        Returns:
+            Number of chunks upserted.
+
+        Raises:
+            DomainException: If upsert fails.
+        """
+        ...
+
+    async def upsert_chunks_returning(self, chunks: Sequence[DocumentChunk]) -> list[DocumentChunk]:
+        """Upsert multiple document chunks and return them as stored.
+
+        Use this only when the upserted chunks are needed back; upsert_chunks
+        avoids building the result list.
+
+        Args:
+            chunks: DocumentChunks to upsert.
 
         Returns:
             List of upserted chunks.
@@ -0,0 +1,57 @@
+"""Outbound port for embedding batch repository operations.
+
+This module defines the port (interface) for tracking embedding jobs submitted
+to an asynchronous batch API, so that an interrupted vectorization can resume
+polling its batch instead of submitting (and paying for) a new one.
+"""
+
+from typing import Protocol
+
+from learn_ai_agents.domain.models.content_indexer.embedding_batch import EmbeddingBatch
+
+
+class EmbeddingBatchRepositoryPort(Protocol):
+    """Protocol defining the interface for embedding batch tracking operations."""
+
+    async def save_batch(self, batch: EmbeddingBatch) -> EmbeddingBatch:
+        """Record a submitted embedding batch.
+
+        Args:
+            batch: The EmbeddingBatch to record.
+
+        Returns:
+            The recorded batch.
+
+        Raises:
+            DomainException: If save fails.
+        """
+        ...
+
+    async def find_pending_batch(self, document_id: str, vectorization_approach: str) -> EmbeddingBatch | None:
+        """Find the batch recorded for a document and embedder approach.
+
+        Args:
+            document_id: The document whose chunks are being embedded.
+            vectorization_approach: The embedder approach of the batch.
+
+        Returns:
+            The recorded EmbeddingBatch if found, None otherwise.
+
+        Raises:
+            DomainException: If retrieval fails.
+        """
+        ...
+
+    async def delete_batch(self, batch_id: str) -> bool:
+        """Delete the record of a batch once its results are consumed or it has failed.
+
+        Args:
+            batch_id: The ID of the batch.
+
+        Returns:
+            True if a record was deleted, False if none was found.
+
+        Raises:
+            DomainException: If deletion fails.
+        """
+        ...
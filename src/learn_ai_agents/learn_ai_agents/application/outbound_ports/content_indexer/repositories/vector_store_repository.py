@@ -4,9 +4,11 @@ This module defines the port (interface) for vector storage operations
 in a vector database like Qdrant.
 """
 
-from typing import Protocol, List, Dict
+from collections.abc import Sequence
+from typing import Literal, Protocol
 
 from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
 
 
 class VectorStoreRepositoryPort(Protocol):
@@ -16,26 +18,50 @@ class VectorStoreRepositoryPort(Protocol):
     chunks with embeddings in a vector database.
     """
 
-    async def upsert_vectors(self, document_id: str, chunks: List[DocumentChunk], vectors: List[List[float]]) -> None:
+    async def upsert_vectors(
+        self,
+        document_id: str,
+        chunks: Sequence[DocumentChunk],
+        vectors: EmbeddingArray,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> int:
         """Upsert document chunks with their vectors to the vector store.
 
+        Implementations validate the input before uploading anything, then upload
+        the points in batches, with several batches in flight at once, so callers
+        can pass whole documents in a single call.
+
         Args:
             document_id: The document ID to create collection for.
-            chunks: List of DocumentChunk domain objects.
-            vectors: List of embedding vectors corresponding to each chunk.
+            chunks: DocumentChunk domain objects.
+            vectors: float32 matrix of shape [chunk count, dimensions], one row per chunk.
+            batch_size: Points per upload request. Defaults to the adapter's configured value.
+            max_concurrency: Upload requests in flight at once. Defaults to the adapter's configured value.
+
+        Returns:
+            Number of points upserted.
 
         Raises:
             DomainException: If storage fails.
         """
         ...
 
-    async def search_similar(self, document_id: str, query_vector: list[float], limit: int = 5) -> List[Dict]:
+    async def search_similar(
+        self,
+        document_id: str,
+        query_vector: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[dict]:
         """Search for chunks similar to the query vector.
 
         Args:
             document_id: The document ID to search within.
-            query_vector: The embedding vector to search with.
+            query_vector: float32 embedding vector of shape [dimensions] to search with.
             limit: Maximum number of results to return.
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
 
         Returns:
             List of payload dictionaries containing chunk metadata.
@@ -45,6 +71,29 @@ class VectorStoreRepositoryPort(Protocol):
         """
         ...
 
+    async def batch_search_similar(
+        self,
+        document_id: str,
+        query_vectors: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[list[dict]]:
+        """Run several similarity searches against one document in a single round-trip.
+
+        Args:
+            document_id: The document ID to search within.
+            query_vectors: float32 matrix of shape [query count, dimensions] to search with.
+            limit: Maximum number of results to return per query.
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
+
+        Returns:
+            One list of payload dictionaries per query vector, in input order.
+
+        Raises:
+            DomainException: If search fails.
+        """
+        ...
+
     async def delete_collection(self, document_id: str) -> None:
         """Delete the entire collection for a specific document.
 
@@ -57,7 +106,11 @@ class VectorStoreRepositoryPort(Protocol):
         ...
 
     async def create_collection_if_not_exists(
-        self, document_id: str, vector_size: int, distance: str = "COSINE"
+        self,
+        document_id: str,
+        vector_size: int,
+        distance: str = "COSINE",
+        optimize_for: Literal["search", "bulk"] = "search",
     ) -> None:
         """Create collection if it doesn't exist.
 
@@ -65,12 +118,28 @@ class VectorStoreRepositoryPort(Protocol):
             document_id: The document ID to create collection for.
             vector_size: Dimensionality of the embedding vectors.
             distance: Distance metric (COSINE, DOT, EUCLID, MANHATTAN).
+            optimize_for: "bulk" defers index building until ``finalize_ingestion`` is
+                called, which speeds up large uploads; "search" indexes as data arrives.
 
         Raises:
             DomainException: If creation fails.
         """
         ...
 
+    async def finalize_ingestion(self, document_id: str) -> None:
+        """Re-enable indexing on a collection prepared with ``optimize_for="bulk"``.
+
+        Adapters may apply bulk upserts asynchronously; once this returns, every
+        vector upserted during the ingestion is visible to searches.
+
+        Args:
+            document_id: The document ID whose collection finished ingesting.
+
+        Raises:
+            DomainException: If the collection update fails.
+        """
+        ...
+
     async def get_personality(self, document_id: str) -> str:
         """Get the personality chunk for a character.
 
@@ -4,6 +4,7 @@ This module defines the port (interface) for splitting documents into smaller
 chunks using various strategies.
 """
 
+from collections.abc import Iterator
 from typing import Protocol
 
 from learn_ai_agents.domain.models.content_indexer.source_ingestion import Document
@@ -33,3 +34,21 @@ class ChunkSplitterPort(Protocol):
             DomainException: If splitting fails.
         """
         ...
+
+    def split_document_iter(self, document: Document, splitter_approach: str) -> Iterator[DocumentChunk]:
+        """Lazily split a document into smaller chunks.
+
+        Yields the same chunks as ``split_document``, one at a time, so callers
+        that stream chunks onward do not need the whole list in memory.
+
+        Args:
+            document: The Document to be split.
+            splitter_approach: The name/key of the splitter approach being used.
+
+        Yields:
+            DocumentChunk objects with sequential split_index values.
+
+        Raises:
+            DomainException: If splitting fails.
+        """
+        ...
@@ -3,8 +3,11 @@
 This module defines the port (interface) for database client operations.
 """
 
+from types import TracebackType
 from typing import Any, Protocol, runtime_checkable
 
+from typing_extensions import Self
+
 
 @runtime_checkable
 class DatabaseClient(Protocol):
@@ -12,6 +15,13 @@ class DatabaseClient(Protocol):
 
     This protocol defines the contract for database connection management
     and access to the underlying client/engine.
+
+    A client wraps a connection pool and is meant to be long-lived: the
+    application connects one instance per database at startup, injects that
+    same connected instance into every component that needs it, and closes it
+    at shutdown (``aclose``). Scripts and tests can use it as an async context
+    manager instead. Connecting per request would pay DNS, TCP and TLS setup
+    every time and defeat the driver's pooling.
     """
 
     async def connect(self) -> None:
@@ -29,6 +39,27 @@ class DatabaseClient(Protocol):
         """
         ...
 
+    async def aclose(self) -> None:
+        """Release the connection pool at application shutdown.
+
+        Equivalent to ``disconnect``; this is the hook the components
+        container calls when the application stops.
+        """
+        ...
+
+    async def __aenter__(self) -> Self:
+        """Connect and return the connected client."""
+        ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Disconnect, letting any exception propagate."""
+        ...
+
     def get_engine(self) -> Any:
         """Get the database engine/client instance.
 
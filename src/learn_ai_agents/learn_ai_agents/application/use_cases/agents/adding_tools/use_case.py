@@ -6,17 +6,21 @@ and the domain's agent engine with tool capabilities.
 """
 
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 from learn_ai_agents.application.dtos.agents.basic_answer import (
     AnswerRequestDTO,
     AnswerResultDTO,
     AnswerStreamEventDTO,
+    AssistantMessageDTO,
 )
 from learn_ai_agents.application.inbound_ports.agents.agent_answer import AgentAnswerPort
 from learn_ai_agents.application.outbound_ports.agents.agent_engine import AgentEngine
 from learn_ai_agents.logging import get_logger
 
 from learn_ai_agents.application.use_cases.mappers.agent_answer_mapper import Mapper
+from learn_ai_agents.application.use_cases.message_input import trim_request
+from learn_ai_agents.application.use_cases.streaming import coalesce_text_deltas
 
 logger = get_logger(__name__)
 
@@ -35,7 +39,6 @@ class AddingToolsUseCase(AgentAnswerPort):
 
     Attributes:
         agent: The agent engine responsible for generating responses using tools.
-        mapper: Utility for converting between DTOs and domain models.
     """
 
     def __init__(self, agent: AgentEngine):
@@ -45,7 +48,6 @@ class AddingToolsUseCase(AgentAnswerPort):
             agent: The agent engine to use for generating answers with tool support.
         """
         self.agent = agent
-        self.mapper = Mapper()
 
     async def ainvoke(self, cmd: AnswerRequestDTO) -> AnswerResultDTO:
         """Handle an asynchronous question-answering request with tool support.
@@ -60,10 +62,15 @@ class AddingToolsUseCase(AgentAnswerPort):
         Returns:
             The answer result containing the assistant's response.
         """
-        logger.info(f"Processing async invoke request with tools: {cmd.message[:100]}...")
+        logger.info("Processing async invoke request with tools: %.100s...", cmd.message)
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, answering without calling the agent")
+            return AnswerResultDTO(conversation_id=cmd.config.conversation_id, message=AssistantMessageDTO(content=""))
+        cmd = trimmed
+
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Calling agent.ainvoke with tool support...")
         response = await self.agent.ainvoke(
@@ -71,7 +78,7 @@ class AddingToolsUseCase(AgentAnswerPort):
             config=input_config,
         )
 
-        result = self.mapper.message_to_dto(
+        result = Mapper.message_to_dto(
             message=response,
             config=input_config,
         )
@@ -92,25 +99,34 @@ class AddingToolsUseCase(AgentAnswerPort):
         Yields:
             Stream events containing response deltas and completion signals.
         """
-        logger.info(f"Processing async stream request with tools: {cmd.message[:100]}...")
+        logger.info("Processing async stream request with tools: %.100s...", cmd.message)
+
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, ending the stream without calling the agent")
+            yield AnswerStreamEventDTO(kind="done", delta=None)
+            return
+        cmd = trimmed
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Starting agent async stream with tool support...")
         chunk_count = 0
-        async for chunk in self.agent.astream(  # type: ignore
-            new_message=input_message,
-            config=input_config,
-        ):
-            if chunk.text is not None:
-                chunk_count += 1
-                yield AnswerStreamEventDTO(
-                    kind="delta",
-                    delta=chunk.text,
+        async with aclosing(
+            coalesce_text_deltas(
+                self.agent.astream(  # type: ignore
+                    new_message=input_message,
+                    config=input_config,
                 )
-
-        logger.info(f"Async stream request with tools completed: {chunk_count} chunks sent")
+            )
+        ) as stream:
+            async for chunk in stream:
+                if chunk.text is not None:
+                    chunk_count += 1
+                    # trusted source: text produced by our own agent, skip re-validation per token
+                    yield AnswerStreamEventDTO.model_construct(kind="delta", delta=chunk.text)
+
+        logger.info("Async stream request with tools completed: %s chunks sent", chunk_count)
         yield AnswerStreamEventDTO(
             kind="done",
             delta=None,
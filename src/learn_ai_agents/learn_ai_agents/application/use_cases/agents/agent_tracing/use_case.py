@@ -5,9 +5,12 @@ using RAG (Retrieval-Augmented Generation). It orchestrates between the
 application's DTOs and the domain's agent engine with vector search capabilities.
 """
 
+import logging
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 from learn_ai_agents.application.dtos.agents.character_chat import (
+    AssistantMessageDTO,
     CharacterChatRequestDTO,
     CharacterChatResultDTO,
     CharacterChatStreamEventDTO,
@@ -20,6 +23,8 @@ from learn_ai_agents.application.outbound_ports.content_indexer.repositories.vec
 from learn_ai_agents.logging import get_logger
 
 from learn_ai_agents.application.use_cases.mappers.character_chat_mapper import Mapper
+from learn_ai_agents.application.use_cases.message_input import trim_request
+from learn_ai_agents.application.use_cases.streaming import coalesce_text_deltas
 
 logger = get_logger(__name__)
 
@@ -40,7 +45,6 @@ class AgentTracingUseCase(CharacterChatPort):
         agent: The agent engine responsible for generating character responses.
         embedder: Embedder for generating query vectors.
         vector_store: Vector store for retrieving personality information.
-        mapper: Utility for converting between DTOs and domain models.
     """
 
     def __init__(
@@ -57,7 +61,6 @@ class AgentTracingUseCase(CharacterChatPort):
         """
         self.agent = agent
         self.vector_store = vector_store
-        self.mapper = Mapper()
         logger.info("Initialized CharacterChatUseCase")
 
     async def ainvoke(self, cmd: CharacterChatRequestDTO) -> CharacterChatResultDTO:
@@ -74,14 +77,23 @@ class AgentTracingUseCase(CharacterChatPort):
         Returns:
             The chat result containing the character's response.
         """
-        logger.info(f"Processing async invoke for character '{cmd.character_name}': {cmd.message[:100]}...")
-        logger.debug(f"Using document_id: {cmd.document_id}")
+        logger.info("Processing async invoke for character '%s': %.100s...", cmd.character_name, cmd.message)
+        logger.debug("Using document_id: %s", cmd.document_id)
+
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, answering without calling the agent")
+            return CharacterChatResultDTO(
+                conversation_id=cmd.config.conversation_id,
+                message=AssistantMessageDTO(content=""),
+                character_name=cmd.character_name,
+            )
+        cmd = trimmed
 
         # Retrieve character personality
         personality = await self.get_personality(cmd.document_id)
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Calling agent.ainvoke with vector search support...")
         response = await self.agent.ainvoke(
@@ -92,13 +104,13 @@ class AgentTracingUseCase(CharacterChatPort):
             personality=personality,
         )
 
-        result = self.mapper.message_to_dto(
+        result = Mapper.message_to_dto(
             message=response,
             config=input_config,
             character_name=cmd.character_name,
         )
 
-        logger.info(f"Async invoke for character '{cmd.character_name}' completed successfully")
+        logger.info("Async invoke for character '%s' completed successfully", cmd.character_name)
         return result
 
     async def astream(self, cmd: CharacterChatRequestDTO) -> AsyncIterator[CharacterChatStreamEventDTO]:  # type: ignore
@@ -115,50 +127,63 @@ class AgentTracingUseCase(CharacterChatPort):
         Yields:
             Stream events containing response deltas and completion signals.
         """
-        logger.info(f"Processing async stream for character '{cmd.character_name}': {cmd.message[:100]}...")
-        logger.debug(f"Using document_id: {cmd.document_id}")
+        logger.info("Processing async stream for character '%s': %.100s...", cmd.character_name, cmd.message)
+        logger.debug("Using document_id: %s", cmd.document_id)
+
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, ending the stream without calling the agent")
+            yield CharacterChatStreamEventDTO(kind="done", delta=None)
+            return
+        cmd = trimmed
 
         # Retrieve character personality
         personality = await self.get_personality(cmd.document_id)
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Starting agent async stream with vector search support...")
+        # Checked once per stream rather than inside logger.debug for every event
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         chunk_count = 0
-        async for chunk in self.agent.astream(  # type: ignore
-            new_message=input_message,
-            config=input_config,
-            character_name=cmd.character_name,
-            document_id=cmd.document_id,
-            personality=personality,
-        ):
-            # Handle different chunk kinds
-            if chunk.kind == "text" and chunk.text is not None:
-                chunk_count += 1
-                yield CharacterChatStreamEventDTO(
-                    kind="delta",
-                    delta=chunk.text,
-                )
-            elif chunk.kind == "tool_start":
-                logger.debug(f"Tool started: {chunk.tool_name}")
-                yield CharacterChatStreamEventDTO(
-                    kind="tool_start",
-                    tool_name=chunk.tool_name,
-                    tool_input=chunk.tool_input,
+        async with aclosing(
+            coalesce_text_deltas(
+                self.agent.astream(  # type: ignore
+                    new_message=input_message,
+                    config=input_config,
+                    character_name=cmd.character_name,
+                    document_id=cmd.document_id,
+                    personality=personality,
                 )
-            elif chunk.kind == "tool_end":
-                logger.debug(f"Tool ended: {chunk.tool_name}")
-                yield CharacterChatStreamEventDTO(
-                    kind="tool_end",
-                    tool_name=chunk.tool_name,
-                    tool_output=chunk.tool_output,
-                )
-            elif chunk.kind == "done":
-                logger.debug("Stream marked as done by agent")
-                break
-
-        logger.info(f"Async stream for character '{cmd.character_name}' completed: {chunk_count} chunks sent")
+            )
+        ) as stream:
+            async for chunk in stream:
+                # Handle different chunk kinds
+                if chunk.kind == "text" and chunk.text is not None:
+                    chunk_count += 1
+                    # trusted source: text produced by our own agent, skip re-validation per token
+                    yield CharacterChatStreamEventDTO.model_construct(kind="delta", delta=chunk.text)
+                elif chunk.kind == "tool_start":
+                    if debug_enabled:
+                        logger.debug("Tool started: %s", chunk.tool_name)
+                    yield CharacterChatStreamEventDTO(
+                        kind="tool_start",
+                        tool_name=chunk.tool_name,
+                        tool_input=chunk.tool_input,
+                    )
+                elif chunk.kind == "tool_end":
+                    if debug_enabled:
+                        logger.debug("Tool ended: %s", chunk.tool_name)
+                    yield CharacterChatStreamEventDTO(
+                        kind="tool_end",
+                        tool_name=chunk.tool_name,
+                        tool_output=chunk.tool_output,
+                    )
+                elif chunk.kind == "done":
+                    logger.debug("Stream marked as done by agent")
+                    break
+
+        logger.info("Async stream for character '%s' completed: %s chunks sent", cmd.character_name, chunk_count)
         yield CharacterChatStreamEventDTO(
             kind="done",
             delta=None,
@@ -173,12 +198,12 @@ class AgentTracingUseCase(CharacterChatPort):
         Returns:
             The personality text retrieved from the vector store, or a default message.
         """
-        logger.debug(f"Retrieving personality from collection: {document_id}")
+        logger.debug("Retrieving personality from collection: %s", document_id)
         personality = await self.vector_store.get_personality(document_id=document_id)
 
         if personality is None:
-            logger.warning(f"No personality found for document_id: {document_id}")
+            logger.warning("No personality found for document_id: %s", document_id)
             return "No specific personality information available."
 
-        logger.debug(f"Retrieved personality: {len(personality)} characters")
+        logger.debug("Retrieved personality: %d characters", len(personality))
         return personality
@@ -1,14 +1,18 @@
 """Basic answer use case implementation."""
 
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 from learn_ai_agents.application.dtos.agents.basic_answer import (
     AnswerRequestDTO,
     AnswerResultDTO,
     AnswerStreamEventDTO,
+    AssistantMessageDTO,
 )
 from learn_ai_agents.application.inbound_ports.agents.basic_answer import BasicAnswerPort
 from learn_ai_agents.application.outbound_ports.agents.agent_engine import AgentEngine
+from learn_ai_agents.application.use_cases.message_input import trim_request
+from learn_ai_agents.application.use_cases.streaming import coalesce_text_deltas
 from learn_ai_agents.logging import get_logger
 
 from .mapper import Mapper
@@ -22,14 +26,18 @@ class BasicAnswerUseCase(BasicAnswerPort):
     def __init__(self, agent: AgentEngine):
         """Initialize with an injected agent engine."""
         self.agent = agent
-        self.mapper = Mapper()
 
     async def ainvoke(self, cmd: AnswerRequestDTO) -> AnswerResultDTO:
         """Handle an asynchronous question-answering request."""
-        logger.info(f"Processing async invoke request: {cmd.message[:100]}...")
+        logger.info("Processing async invoke request: %.100s...", cmd.message)
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, answering without calling the agent")
+            return AnswerResultDTO(conversation_id=cmd.config.conversation_id, message=AssistantMessageDTO(content=""))
+        cmd = trimmed
+
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Calling agent.ainvoke...")
         response = await self.agent.ainvoke(
@@ -37,7 +45,7 @@ class BasicAnswerUseCase(BasicAnswerPort):
             config=input_config,
         )
 
-        result = self.mapper.message_to_dto(
+        result = Mapper.message_to_dto(
             message=response,
             config=input_config,
         )
@@ -47,25 +55,34 @@ class BasicAnswerUseCase(BasicAnswerPort):
 
     async def astream(self, cmd: AnswerRequestDTO) -> AsyncIterator[AnswerStreamEventDTO]:  # type: ignore
         """Handle an asynchronous streaming question-answering request."""
-        logger.info(f"Processing async stream request: {cmd.message[:100]}...")
+        logger.info("Processing async stream request: %.100s...", cmd.message)
+
+        trimmed = trim_request(cmd)
+        if trimmed is None:
+            logger.info("Empty message, ending the stream without calling the agent")
+            yield AnswerStreamEventDTO(kind="done", delta=None)
+            return
+        cmd = trimmed
 
-        input_message = self.mapper.dto_to_message(dto=cmd)
-        input_config = self.mapper.config_dto_to_config(dto=cmd)
+        input_message, input_config = Mapper.dto_to_domain(dto=cmd)
 
         logger.debug("Starting agent async stream...")
         chunk_count = 0
-        async for chunk in self.agent.astream(  # type: ignore
-            new_message=input_message,
-            config=input_config,
-        ):
-            if chunk.text is not None:
-                chunk_count += 1
-                yield AnswerStreamEventDTO(
-                    kind="delta",
-                    delta=chunk.text,
+        async with aclosing(
+            coalesce_text_deltas(
+                self.agent.astream(  # type: ignore
+                    new_message=input_message,
+                    config=input_config,
                 )
-
-        logger.info(f"Async stream request completed: {chunk_count} chunks sent")
+            )
+        ) as stream:
+            async for chunk in stream:
+                if chunk.text is not None:
+                    chunk_count += 1
+                    # trusted source: text produced by our own agent, skip re-validation per token
+                    yield AnswerStreamEventDTO.model_construct(kind="delta", delta=chunk.text)
+
+        logger.info("Async stream request completed: %s chunks sent", chunk_count)
         yield AnswerStreamEventDTO(
             kind="done",
             delta=None,
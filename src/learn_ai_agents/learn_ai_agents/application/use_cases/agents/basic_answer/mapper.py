@@ -22,15 +22,19 @@ class Mapper:
             timestamp=Helper.generate_timestamp(),
         )
 
+    @staticmethod
+    def dto_to_domain(dto: AnswerRequestDTO) -> tuple[Message, Config]:
+        """Convert answer request DTO to a domain Message and Config in one pass."""
+        return (
+            Message(role=Role.USER, content=dto.message, timestamp=Helper.generate_timestamp()),
+            Config(conversation_id=dto.config.conversation_id),
+        )
+
     @staticmethod
     def message_to_dto(message: Message, config: Config) -> AnswerResultDTO:
         """Convert domain Message and Config to response DTO."""
-        assistant_message_dto = AssistantMessageDTO(
-            role="assistant",
-            content=message.content,
-        )
         return AnswerResultDTO(
-            message=assistant_message_dto,
+            message=AssistantMessageDTO(content=message.content),
             conversation_id=config.conversation_id,
         )
 
@@ -4,6 +4,8 @@ This module implements the business logic for splitting documents into
 chunks using various splitting strategies and storing them in the repository.
 """
 
+import asyncio
+from itertools import islice
 from typing import Dict
 
 from learn_ai_agents.application.dtos.content_indexer.document_splitting import (
@@ -25,11 +27,27 @@ from learn_ai_agents.application.outbound_ports.content_indexer.splitters.chunk_
 )
 
 from learn_ai_agents.domain.exceptions._base import BusinessRuleException
+from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.source_ingestion import Document
 from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _to_chunk_metadata(chunk: DocumentChunk) -> ChunkMetadataDTO:
+    """Build the response metadata of a stored chunk."""
+    metadata = chunk.metadata or {}
+    return ChunkMetadataDTO(
+        chunk_id=chunk.chunk_id,
+        document_id=chunk.document_id,
+        split_index=chunk.split_index,
+        chunk_size=metadata.get("chunk_size", len(chunk.content)),
+        splitter=metadata.get("splitter", "unknown"),
+        h1_title=metadata.get("h1_title"),
+        h2_header=metadata.get("h2_header"),
+    )
+
+
 class DocumentSplittingUseCase(DocumentSplittingInboundPort):
     """Use case for splitting documents into chunks.
 
@@ -38,10 +56,18 @@ class DocumentSplittingUseCase(DocumentSplittingInboundPort):
     2. Splitting each document using the specified splitter
     3. Storing the resulting chunks in the repository
 
+    Documents are split concurrently, up to ``max_parallel_splits`` at a time.
+    Splitters are synchronous, so chunks are pulled from the splitter's lazy
+    iterator in a worker thread, ``upsert_batch_size`` at a time, and each
+    batch is upserted before the next one is produced. Only the batches in
+    flight and the small per-chunk response metadata are held in memory.
+
     Attributes:
         document_repository: Port for retrieving documents.
         chunk_repository: Port for storing chunks.
         splitter: Port for splitting documents into chunks.
+        max_parallel_splits: Maximum number of documents split and stored at once.
+        upsert_batch_size: Number of chunks per ``upsert_chunks`` call.
     """
 
     def __init__(
@@ -49,6 +75,8 @@ class DocumentSplittingUseCase(DocumentSplittingInboundPort):
         document_repository: DocumentRepositoryPort,
         chunk_repository: ChunkRepositoryPort,
         document_splitters: Dict[str, ChunkSplitterPort],
+        max_parallel_splits: int = 4,
+        upsert_batch_size: int = 50,
     ):
         """Initialize the document splitting use case.
 
@@ -56,10 +84,14 @@ class DocumentSplittingUseCase(DocumentSplittingInboundPort):
             document_repository: Port for retrieving documents.
             chunk_repository: Port for storing chunks.
             splitter: Port for splitting documents into chunks.
+            max_parallel_splits: Maximum number of documents split and stored at once.
+            upsert_batch_size: Number of chunks per ``upsert_chunks`` call.
         """
         self.document_repository = document_repository
         self.chunk_repository = chunk_repository
         self.document_splitters: Dict[str, ChunkSplitterPort] = document_splitters
+        self.max_parallel_splits = max(1, max_parallel_splits)
+        self.upsert_batch_size = max(1, upsert_batch_size)
         logger.info("DocumentSplittingUseCase initialized")
 
     async def split_documents(self, request: DocumentSplittingRequestDTO) -> DocumentSplittingResponseDTO:
@@ -74,7 +106,7 @@ class DocumentSplittingUseCase(DocumentSplittingInboundPort):
         Raises:
             DomainException: If retrieval, splitting, or storage fails.
         """
-        logger.info(f"Starting document splitting for document_id: {request.document_id}")
+        logger.info("Starting document splitting for document_id: %s", request.document_id)
 
         # 1. Retrieve all documents with the given document_id
         documents = await self.document_repository.find_documents_by_document_id(request.document_id)
@@ -82,58 +114,88 @@ class DocumentSplittingUseCase(DocumentSplittingInboundPort):
         if not documents:
             raise BusinessRuleException(f"No documents found with document_id: {request.document_id}")
 
-        logger.debug(f"Found {len(documents)} document(s) to process")
+        logger.debug("Found %s document(s) to process", len(documents))
 
-        # 2. Split each document into chunks
-        all_chunks = []
-        chunk_metadata_list = []
+        # 2. Split each document into chunks and 3. upsert them (create or update)
         document_splitter = self.document_splitters.get(request.splitter_approach)
         if not document_splitter:
             raise BusinessRuleException(f"Splitter not found for approach: {request.splitter_approach}")
-        for document in documents:
-            logger.debug(f"Splitting document {document.document_id}")
-
-            try:
-                # Split the document using the configured splitter
-                chunks = document_splitter.split_document(document, request.splitter_approach)
-
-                logger.debug(f"Document {document.document_id} split into {len(chunks)} chunks")
-
-                # Collect chunks for batch storage
-                all_chunks.extend(chunks)
-
-                # Prepare metadata for response
-                for chunk in chunks:
-                    metadata = chunk.metadata or {}
-                    chunk_metadata = ChunkMetadataDTO(
-                        chunk_id=chunk.chunk_id,
-                        document_id=chunk.document_id,
-                        split_index=chunk.split_index,
-                        chunk_size=metadata.get("chunk_size", len(chunk.content)),
-                        splitter=metadata.get("splitter", "unknown"),
-                        h1_title=metadata.get("h1_title"),
-                        h2_header=metadata.get("h2_header"),
-                    )
-                    chunk_metadata_list.append(chunk_metadata)
-
-            except Exception as e:
-                logger.error(f"Failed to split document {document.document_id}: {str(e)}")
-                raise BusinessRuleException(f"Document splitting failed for document {document.document_id}: {str(e)}") from e
-
-        # 3. Upsert all chunks in the repository (create or update)
-        logger.debug(f"Upserting {len(all_chunks)} chunks in repository")
 
+        semaphore = asyncio.Semaphore(self.max_parallel_splits)
+        tasks = [
+            asyncio.ensure_future(
+                self._split_and_store(document, document_splitter, request.splitter_approach, semaphore)
+            )
+            for document in documents
+        ]
         try:
-            saved_chunks = await self.chunk_repository.upsert_chunks(all_chunks)
-            logger.info(f"Successfully upserted {len(saved_chunks)} chunks for document_id: {request.document_id}")
-        except Exception as e:
-            logger.error(f"Failed to upsert chunks: {str(e)}")
-            raise BusinessRuleException(f"Chunk upsert failed: {str(e)}") from e
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the other documents' upserts before the error is reported
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        saved_count = sum(saved for _, saved in results)
+        logger.info("Successfully upserted %s chunks for document_id: %s", saved_count, request.document_id)
+
+        # Metadata for the response, in document order
+        chunk_metadata_list = [chunk_metadata for metadata, _ in results for chunk_metadata in metadata]
 
         # 4. Return response
         return DocumentSplittingResponseDTO(
             document_id=request.document_id,
-            total_chunks_created=len(saved_chunks),
+            total_chunks_created=saved_count,
             chunks=chunk_metadata_list,
-            message=f"Successfully split {len(documents)} document(s) into {len(saved_chunks)} chunk(s)",
+            message=f"Successfully split {len(documents)} document(s) into {saved_count} chunk(s)",
         )
+
+    async def _split_and_store(
+        self,
+        document: Document,
+        document_splitter: ChunkSplitterPort,
+        splitter_approach: str,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[ChunkMetadataDTO], int]:
+        """Split one document in a worker thread, upserting each batch of chunks as it is produced.
+
+        Args:
+            document: The document to split.
+            document_splitter: The splitter for the requested approach.
+            splitter_approach: The splitting approach to use.
+            semaphore: Limits how many documents are processed at once.
+
+        Returns:
+            The metadata of the document's chunks and the number of chunks upserted.
+
+        Raises:
+            BusinessRuleException: If splitting or storing the chunks fails.
+        """
+        async with semaphore:
+            logger.debug("Splitting document %s", document.document_id)
+            chunks = document_splitter.split_document_iter(document, splitter_approach)
+            chunk_metadata: list[ChunkMetadataDTO] = []
+            saved_count = 0
+            while True:
+                try:
+                    batch = await asyncio.to_thread(list, islice(chunks, self.upsert_batch_size))
+                except Exception as e:
+                    error = str(e)
+                    logger.error("Failed to split document %s: %s", document.document_id, error)
+                    raise BusinessRuleException(
+                        f"Document splitting failed for document {document.document_id}: {error}"
+                    ) from e
+                if not batch:
+                    break
+
+                try:
+                    saved_count += await self.chunk_repository.upsert_chunks(batch)
+                except Exception as e:
+                    error = str(e)
+                    logger.error("Failed to upsert chunks: %s", error)
+                    raise BusinessRuleException(f"Chunk upsert failed: {error}") from e
+                chunk_metadata.extend(map(_to_chunk_metadata, batch))
+
+            logger.debug("Document %s split into %s chunks", document.document_id, len(chunk_metadata))
+
+        return chunk_metadata, saved_count
@@ -4,7 +4,6 @@ This module implements the business logic for ingesting content from
 various sources and storing it in the document repository.
 """
 
-from uuid import uuid4
 from learn_ai_agents.application.dtos.content_indexer.source_ingestion import (
     SourceIngestionRequestDTO,
     SourceIngestionResponseDTO,
@@ -20,6 +19,7 @@ from learn_ai_agents.application.outbound_ports.content_indexer.repositories.doc
     DocumentRepositoryPort,
 )
 from learn_ai_agents.domain.models.content_indexer.source_ingestion import ContentRequest
+from learn_ai_agents.infrastructure.helpers.generators import Helper
 from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
@@ -68,34 +68,32 @@ class SourceIngestionUseCase(SourceIngestionInboundPort):
 
         # Create domain ContentRequest
         content_request = ContentRequest(
-            document_id=request.document_id if request.document_id else str(uuid4()),
+            document_id=request.document_id or Helper.generate_uuid(),
             source=request.source,
             params=request.params,
             character_name=request.character_name,
         )
 
         # Retrieve content using the adapter
-        logger.debug(f"Retrieving content with document_id: {content_request.document_id}")
+        logger.debug("Retrieving content with document_id: %s", content_request.document_id)
         document = self.source_ingestion.retrieve_content(content_request)
 
         # Upsert document in MongoDB (create or update)
-        logger.debug(f"Upserting document for document_id: {document.document_id}")
+        logger.debug("Upserting document for document_id: %s", document.document_id)
         saved_document = await self.document_repository.upsert_document(document)
 
         # Prepare metadata DTO
+        metadata = saved_document.metadata or {}
         metadata_dto = DocumentMetadataDTO(
-            url=saved_document.metadata.get("url") if saved_document.metadata else None,
-            title=(saved_document.metadata.get("title") if saved_document.metadata else None),
-            description=(saved_document.metadata.get("description") if saved_document.metadata else None),
-            content_type=(saved_document.metadata.get("content_type") if saved_document.metadata else None),
-            source=(saved_document.metadata.get("source") if saved_document.metadata else None),
+            url=metadata.get("url"),
+            title=metadata.get("title"),
+            description=metadata.get("description"),
+            content_type=metadata.get("content_type"),
+            source=metadata.get("source"),
             character_name=saved_document.character_name,
         )
 
-        # Calculate content length
-        content_length = (
-            len(saved_document.content) if isinstance(saved_document.content, str) else len(saved_document.content)
-        )
+        content_length = len(saved_document.content)
 
         logger.info(
             f"Content ingestion completed. Document ID: {saved_document.document_id}, "
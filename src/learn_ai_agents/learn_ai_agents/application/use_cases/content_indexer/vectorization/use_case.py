@@ -4,7 +4,10 @@ This module implements the business logic for vectorizing document chunks
 and storing them in a vector database.
 """
 
-from typing import Dict
+import asyncio
+from collections.abc import Iterator, Sequence
+from dataclasses import replace
+from typing import Any
 
 from learn_ai_agents.application.dtos.content_indexer.vectorization import (
     VectorizationRequestDTO,
@@ -13,21 +16,36 @@ from learn_ai_agents.application.dtos.content_indexer.vectorization import (
 from learn_ai_agents.application.inbound_ports.content_indexer.vectorization import (
     VectorizationInboundPort,
 )
-from learn_ai_agents.application.outbound_ports.content_indexer.repositories.chunk_repository import (
-    ChunkRepositoryPort,
+from learn_ai_agents.application.outbound_ports.content_indexer.embedders.batch_embedder import (
+    BatchEmbedderPort,
 )
 from learn_ai_agents.application.outbound_ports.content_indexer.embedders.embedder import (
     EmbedderPort,
 )
+from learn_ai_agents.application.outbound_ports.content_indexer.repositories.chunk_repository import (
+    ChunkRepositoryPort,
+)
+from learn_ai_agents.application.outbound_ports.content_indexer.repositories.embedding_batch_repository import (
+    EmbeddingBatchRepositoryPort,
+)
 from learn_ai_agents.application.outbound_ports.content_indexer.repositories.vector_store_repository import (
     VectorStoreRepositoryPort,
 )
-
+from learn_ai_agents.domain.exceptions import EmbeddingBatchFailedException
 from learn_ai_agents.domain.exceptions._base import BusinessRuleException
+from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.embedding_batch import EmbeddingBatch
 from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Documents with more chunks than this are embedded through a batch embedder, if one is configured
+DEFAULT_BATCH_THRESHOLD = 500
+# Chunks per embed_texts call on the synchronous embedding path
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+# Micro-batches embedded and stored at the same time on the synchronous embedding path
+DEFAULT_EMBEDDING_CONCURRENCY = 8
+
 
 class VectorizationUseCase(VectorizationInboundPort):
     """Use case for vectorizing document chunks.
@@ -37,17 +55,40 @@ class VectorizationUseCase(VectorizationInboundPort):
     2. Generating embeddings for each chunk using the specified embedder
     3. Storing the chunks with their embeddings in the vector store
 
+    With a synchronous embedder, chunks are embedded in micro-batches of
+    ``embedding_batch_size`` by ``embedding_concurrency`` concurrent workers,
+    and each micro-batch is stored as soon as its embeddings arrive, so only
+    a few micro-batches of vectors are held in memory at once.
+
+    Documents with more than ``batch_threshold`` chunks (or approaches that only
+    have a batch embedder) are embedded through an asynchronous batch API. The
+    first request submits the job, records it in the batch repository and
+    returns a "pending" response; every later request for the same document
+    checks the recorded batch once and, when it has completed, stores its
+    embeddings. The record is only deleted once the vectors are stored, or
+    when the batch ended without results.
+
     Attributes:
         chunk_repository: Port for retrieving document chunks.
         embedders: Dictionary of embedders by approach name.
         vector_store: Repository port for storing chunks with embeddings in vector database.
+        batch_embedders: Dictionary of batch embedders by approach name.
+        batch_repository: Repository port for tracking submitted embedding batches.
+        batch_threshold: Chunk count above which the batch embedder is used.
+        embedding_batch_size: Chunks per ``embed_texts`` call.
+        embedding_concurrency: Micro-batches embedded and stored at the same time.
     """
 
     def __init__(
         self,
         chunk_repository: ChunkRepositoryPort,
-        embedders: Dict[str, EmbedderPort],
+        embedders: dict[str, EmbedderPort],
         vector_store: VectorStoreRepositoryPort,
+        batch_embedders: dict[str, BatchEmbedderPort] | None = None,
+        batch_repository: EmbeddingBatchRepositoryPort | None = None,
+        batch_threshold: int = DEFAULT_BATCH_THRESHOLD,
+        embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        embedding_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
     ):
         """Initialize the vectorization use case.
 
@@ -55,12 +96,139 @@ class VectorizationUseCase(VectorizationInboundPort):
             chunk_repository: Port for retrieving document chunks.
             embedders: Dictionary of embedders by approach name.
             vector_store: Port for storing chunks with embeddings.
+            batch_embedders: Dictionary of batch embedders by approach name.
+            batch_repository: Port for tracking submitted embedding batches; required
+                for the batch path.
+            batch_threshold: Chunk count above which the batch embedder is used.
+            embedding_batch_size: Chunks per ``embed_texts`` call.
+            embedding_concurrency: Micro-batches embedded and stored at the same time.
         """
         self.chunk_repository = chunk_repository
-        self.embedders: Dict[str, EmbedderPort] = embedders
+        self.embedders: dict[str, EmbedderPort] = embedders
         self.vector_store = vector_store
+        self.batch_embedders: dict[str, BatchEmbedderPort] = batch_embedders or {}
+        if self.batch_embedders and batch_repository is None:
+            logger.warning("Batch embedders configured without a batch repository; the batch path is disabled")
+            self.batch_embedders = {}
+        self.batch_repository = batch_repository
+        self.batch_threshold = batch_threshold
+        self.embedding_batch_size = max(1, embedding_batch_size)
+        self.embedding_concurrency = max(1, embedding_concurrency)
         logger.info("VectorizationUseCase initialized")
 
+    async def _vectorize_with_batch(
+        self,
+        batch_embedder: BatchEmbedderPort,
+        request: VectorizationRequestDTO,
+        chunks: Sequence[DocumentChunk],
+        embedding_model: dict[str, Any],
+    ) -> VectorizationResponseDTO:
+        """Embed chunks through a batch embedder, storing the vectors once the batch has completed.
+
+        Submits a new batch unless one is already recorded for the document and
+        approach, then checks it once. A batch that is still running yields a
+        "pending" response and stays recorded for the next request.
+
+        Args:
+            batch_embedder: The batch embedder to use.
+            request: The vectorization request.
+            chunks: The chunks to embed, in chunk order.
+            embedding_model: Embedding model description added to each chunk's metadata.
+
+        Returns:
+            VectorizationResponseDTO, with status "pending" while the batch is running.
+
+        Raises:
+            BusinessRuleException: If the batch cannot be submitted or checked, failed,
+                or its embeddings cannot be stored.
+        """
+        if self.batch_repository is None:
+            raise BusinessRuleException("Batch embedding requires a batch repository")
+
+        document_id = request.document_id
+        approach = request.vectorization_approach
+        batch = await self.batch_repository.find_pending_batch(document_id, approach)
+        if batch is not None and batch.chunk_count != len(chunks):
+            # The chunks changed since that batch was submitted
+            logger.info(f"Discarding stale embedding batch {batch.batch_id} for document_id: {document_id}")
+            await self.batch_repository.delete_batch(batch.batch_id)
+            batch = None
+
+        try:
+            if batch is None:
+                # Check the collection before paying for a batch whose vectors it would reject
+                await self.vector_store.create_collection_if_not_exists(
+                    document_id=document_id, vector_size=embedding_model["dimensions"]
+                )
+                logger.debug("Generating embeddings using %s", embedding_model["model_name"])
+                batch_id = await batch_embedder.embed_batch_async([chunk.content for chunk in chunks])
+                batch = await self.batch_repository.save_batch(
+                    EmbeddingBatch(
+                        batch_id=batch_id,
+                        document_id=document_id,
+                        vectorization_approach=approach,
+                        chunk_count=len(chunks),
+                    )
+                )
+            else:
+                logger.info(f"Checking embedding batch {batch.batch_id} for document_id: {document_id}")
+
+            embeddings = await batch_embedder.poll_batch(batch.batch_id)
+            if embeddings is not None and len(embeddings) != len(chunks):
+                raise EmbeddingBatchFailedException(
+                    component_type="embedder",
+                    message=f"Embedding count mismatch: expected {len(chunks)}, got {len(embeddings)}",
+                )
+        except EmbeddingBatchFailedException as e:
+            # The batch will never produce usable embeddings; the next request submits a new one
+            if batch is not None:
+                await self.batch_repository.delete_batch(batch.batch_id)
+            error = str(e)
+            logger.error(f"Failed to generate embeddings: {error}")
+            raise BusinessRuleException(f"Embedding generation failed: {error}") from e
+        except Exception as e:
+            # Anything else may be transient, so the recorded batch is checked again next time
+            error = str(e)
+            logger.error(f"Failed to generate embeddings: {error}")
+            raise BusinessRuleException(f"Embedding generation failed: {error}") from e
+
+        if embeddings is None:
+            logger.info(f"Embedding batch {batch.batch_id} for document_id {document_id} is still running")
+            return VectorizationResponseDTO(
+                document_id=document_id,
+                total_vectors_created=0,
+                message=f"Embedding batch {batch.batch_id} is still running; repeat the request to check it again",
+                status="pending",
+                batch_id=batch.batch_id,
+            )
+
+        try:
+            await self._start_ingestion(document_id, embedding_model["dimensions"])
+            try:
+                stored_count = await self.vector_store.upsert_vectors(
+                    document_id=document_id,
+                    chunks=self._enrich_chunks(chunks, embedding_model),
+                    vectors=embeddings,
+                )
+            except BaseException:
+                await self._finalize_after_failure(document_id)
+                raise
+            await self.vector_store.finalize_ingestion(document_id)
+        except Exception as e:
+            # The record is kept, so the next request downloads the results again and retries
+            error = str(e)
+            logger.error(f"Failed to store vectors: {error}")
+            raise BusinessRuleException(f"Vector storage failed: {error}") from e
+
+        await self.batch_repository.delete_batch(batch.batch_id)
+        logger.info(f"Successfully stored {stored_count} vectors for document_id: {document_id}")
+        return VectorizationResponseDTO(
+            document_id=document_id,
+            total_vectors_created=stored_count,
+            message=f"Successfully vectorized {len(chunks)} chunk(s) and stored in vector database",
+            batch_id=batch.batch_id,
+        )
+
     async def vectorize_chunks(self, request: VectorizationRequestDTO) -> VectorizationResponseDTO:
         """Vectorize chunks by document_id and store them in the vector database.
 
@@ -68,7 +236,8 @@ class VectorizationUseCase(VectorizationInboundPort):
             request: The vectorization request containing document_id and parameters.
 
         Returns:
-            VectorizationResponseDTO with vectorization results.
+            VectorizationResponseDTO with vectorization results, with status "pending"
+            while the embedding batch of a large document is still running.
 
         Raises:
             DomainException: If retrieval, embedding generation, or storage fails.
@@ -84,71 +253,140 @@ class VectorizationUseCase(VectorizationInboundPort):
         if not chunks:
             raise BusinessRuleException(f"No chunks found with document_id: {request.document_id}")
 
-        logger.debug(f"Found {len(chunks)} chunk(s) to vectorize")
+        logger.debug("Found %s chunk(s) to vectorize", len(chunks))
 
-        # 2. Get the appropriate embedder
-        embedder = self.embedders.get(request.vectorization_approach)
+        # 2. Get the appropriate embedder, preferring the batch API for large documents
+        sync_embedder = self.embedders.get(request.vectorization_approach)
+        batch_embedder = self.batch_embedders.get(request.vectorization_approach)
+        if batch_embedder is not None and (sync_embedder is None or len(chunks) > self.batch_threshold):
+            sync_embedder = None
+        embedder: EmbedderPort | BatchEmbedderPort | None = sync_embedder or batch_embedder
         if not embedder:
             raise BusinessRuleException(f"Embedder not found for approach: {request.vectorization_approach}")
 
-        # 3. Generate embeddings for all chunks
-        try:
-            logger.debug(f"Generating embeddings using {embedder.get_model_name()}")
-            texts = [chunk.content for chunk in chunks]
-            embeddings = await embedder.embed_texts(texts)
-
-            if len(embeddings) != len(chunks):
-                raise BusinessRuleException(f"Embedding count mismatch: expected {len(chunks)}, got {len(embeddings)}")
-
-            logger.debug(
-                f"Successfully generated {len(embeddings)} embeddings with {embedder.get_dimensions()} dimensions"
-            )
-        except Exception as e:
-            logger.error(f"Failed to generate embeddings: {str(e)}")
-            raise BusinessRuleException(f"Embedding generation failed: {str(e)}") from e
-
-        # 4. Enrich chunks with embedding model metadata
+        model_name = embedder.get_model_name()
+        dimensions = embedder.get_dimensions()
         embedding_model_metadata = {
-            "model_name": embedder.get_model_name(),
-            "dimensions": embedder.get_dimensions(),
+            "model_name": model_name,
+            "dimensions": dimensions,
             "vectorization_approach": request.vectorization_approach,
         }
 
-        # Add embedding metadata to each chunk's metadata
-        enriched_chunks = []
-        for chunk in chunks:
-            # Create a copy of metadata and add embedding info
-            chunk_metadata = chunk.metadata.copy() if chunk.metadata else {}
-            chunk_metadata["embedding_model"] = embedding_model_metadata
-
-            # Create new chunk with enriched metadata
-            from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
-
-            enriched_chunk = DocumentChunk(
-                chunk_id=chunk.chunk_id,
-                document_id=chunk.document_id,
-                split_index=chunk.split_index,
-                content=chunk.content,
-                metadata=chunk_metadata,
-                character_name=chunk.character_name,
-            )
-            enriched_chunks.append(enriched_chunk)
+        # 3. Generate embeddings, 4. enrich chunks with embedding model metadata and 5. store them
+        if sync_embedder is None:
+            return await self._vectorize_with_batch(batch_embedder, request, chunks, embedding_model_metadata)
 
-        # 5. Store enriched chunks with embeddings in the vector store
-        try:
-            logger.debug(f"Storing {len(enriched_chunks)} chunks in vector store")
-            await self.vector_store.upsert_vectors(
-                document_id=request.document_id, chunks=enriched_chunks, vectors=embeddings
-            )
-
-            logger.info(f"Successfully stored {len(enriched_chunks)} vectors for document_id: {request.document_id}")
-        except Exception as e:
-            logger.error(f"Failed to store vectors: {str(e)}")
-            raise BusinessRuleException(f"Vector storage failed: {str(e)}") from e
+        stored_count = await self._embed_and_store(sync_embedder, request.document_id, chunks, embedding_model_metadata)
+        logger.info(f"Successfully stored {stored_count} vectors for document_id: {request.document_id}")
 
         # 6. Return response
         return VectorizationResponseDTO(
             document_id=request.document_id,
-            total_vectors_created=len(enriched_chunks),
+            total_vectors_created=stored_count,
             message=f"Successfully vectorized {len(chunks)} chunk(s) and stored in vector database",
         )
+
+    async def _start_ingestion(self, document_id: str, vector_size: int) -> None:
+        """Create the document's collection if needed, deferring index building until every vector is uploaded."""
+        await self.vector_store.create_collection_if_not_exists(
+            document_id=document_id, vector_size=vector_size, optimize_for="bulk"
+        )
+
+    async def _finalize_after_failure(self, document_id: str) -> None:
+        """Finalize an ingestion whose upload failed, logging finalize errors so the upload error propagates."""
+        try:
+            await self.vector_store.finalize_ingestion(document_id)
+        except Exception as e:
+            logger.error(f"Failed to finalize ingestion for document_id {document_id}: {e}")
+
+    @staticmethod
+    def _enrich_chunks(chunks: Sequence[DocumentChunk], embedding_model: dict[str, Any]) -> list[DocumentChunk]:
+        """Copy chunks, adding the embedding model description to each chunk's metadata."""
+        return [
+            replace(chunk, metadata={**(chunk.metadata or {}), "embedding_model": embedding_model}) for chunk in chunks
+        ]
+
+    async def _embed_and_store(
+        self,
+        embedder: EmbedderPort,
+        document_id: str,
+        chunks: Sequence[DocumentChunk],
+        embedding_model: dict[str, Any],
+    ) -> int:
+        """Embed chunks in micro-batches and store each micro-batch as soon as it is embedded.
+
+        Args:
+            embedder: The synchronous embedder to use.
+            document_id: The document whose chunks are vectorized.
+            chunks: The chunks to embed, in chunk order.
+            embedding_model: Embedding model description added to each chunk's metadata; its
+                model name and dimensions are used instead of asking the embedder again.
+
+        Returns:
+            Number of vectors stored.
+
+        Raises:
+            BusinessRuleException: If embedding generation or storage fails.
+        """
+        logger.debug(
+            "Generating embeddings using %s (batch_size=%s, concurrency=%s)",
+            embedding_model["model_name"],
+            self.embedding_batch_size,
+            self.embedding_concurrency,
+        )
+        micro_batches: Iterator[Sequence[DocumentChunk]] = (
+            chunks[start : start + self.embedding_batch_size]
+            for start in range(0, len(chunks), self.embedding_batch_size)
+        )
+
+        async def embed_and_store_batches() -> int:
+            # Workers share the micro-batch iterator; it never awaits, so each batch goes to exactly one worker
+            stored = 0
+            for batch in micro_batches:
+                try:
+                    vectors = await embedder.embed_texts([chunk.content for chunk in batch])
+                    if len(vectors) != len(batch):
+                        raise BusinessRuleException(
+                            f"Embedding count mismatch: expected {len(batch)}, got {len(vectors)}"
+                        )
+                except Exception as e:
+                    error = str(e)
+                    logger.error(f"Failed to generate embeddings: {error}")
+                    raise BusinessRuleException(f"Embedding generation failed: {error}") from e
+
+                try:
+                    stored += await self.vector_store.upsert_vectors(
+                        document_id=document_id, chunks=self._enrich_chunks(batch, embedding_model), vectors=vectors
+                    )
+                except Exception as e:
+                    error = str(e)
+                    logger.error(f"Failed to store vectors: {error}")
+                    raise BusinessRuleException(f"Vector storage failed: {error}") from e
+            return stored
+
+        try:
+            await self._start_ingestion(document_id, embedding_model["dimensions"])
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Failed to store vectors: {error}")
+            raise BusinessRuleException(f"Vector storage failed: {error}") from e
+
+        workers = [asyncio.ensure_future(embed_and_store_batches()) for _ in range(self.embedding_concurrency)]
+        try:
+            stored_per_worker = await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the other workers before the ingestion is finalized
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self._finalize_after_failure(document_id)
+            raise
+
+        try:
+            await self.vector_store.finalize_ingestion(document_id)
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Failed to store vectors: {error}")
+            raise BusinessRuleException(f"Vector storage failed: {error}") from e
+
+        return sum(stored_per_worker)
@@ -16,8 +16,48 @@ from learn_ai_agents.application.dtos.discovery.discovery import (
     UseCasesResponseDTO,
 )
 from learn_ai_agents.application.inbound_ports.discovery.discovery import DiscoveryPort
+from learn_ai_agents.domain.models.agents.discovery import Agent, Component, UseCase
 from learn_ai_agents.domain.ports.agents.resource_discovery import ResourceDiscoveryPort
 
+# Shown instead of a component's API key
+_MASKED_API_KEY = "**********"
+
+
+def _to_component_dto(comp: Component) -> ComponentDTO:
+    """Convert a domain component to its DTO, masking the API key."""
+    info = comp.info
+    return ComponentDTO(
+        ref=comp.ref,
+        info=ComponentInfoDTO(framework=info.framework, family=info.family, instance=info.instance),
+        api_key=_MASKED_API_KEY if comp.api_key_present else None,
+        params=comp.params,
+    )
+
+
+def _to_agent_dto(agent: Agent) -> AgentDTO:
+    """Convert a domain agent to its DTO."""
+    info = agent.info
+    return AgentDTO(
+        ref=agent.ref,
+        info=AgentInfoDTO(name=info.name, description=info.description),
+        components=agent.components,
+    )
+
+
+def _to_use_case_dto(uc: UseCase) -> UseCaseDTO:
+    """Convert a domain use case to its DTO."""
+    info = uc.info
+    return UseCaseDTO(
+        ref=uc.ref,
+        info=UseCaseInfoDTO(name=info.name, description=info.description, path_prefix=info.path_prefix),
+        components=uc.components,
+    )
+
+
+def _convert_components(components_dict: dict[str, list[Component]]) -> dict[str, tuple[ComponentDTO, ...]]:
+    """Convert domain components grouped by type to DTOs."""
+    return {comp_type: tuple(map(_to_component_dto, components)) for comp_type, components in components_dict.items()}
+
 
 class DiscoveryUseCase(DiscoveryPort):
     """Use case for discovering system resources.
@@ -44,25 +84,7 @@ class DiscoveryUseCase(DiscoveryPort):
             ComponentsResponseDTO with all components organized by type.
         """
         components_dict = self.discovery_service.discover_components()
-
-        # Convert domain models to DTOs
-        dto_components = {}
-        for comp_type, components in components_dict.items():
-            dto_components[comp_type] = [
-                ComponentDTO(
-                    ref=comp.ref,
-                    info=ComponentInfoDTO(
-                        framework=comp.info.framework,
-                        family=comp.info.family,
-                        instance=comp.info.instance,
-                    ),
-                    api_key="**********" if comp.api_key_present else None,
-                    params=comp.params,
-                )
-                for comp in components
-            ]
-
-        return ComponentsResponseDTO(components=dto_components)
+        return ComponentsResponseDTO(components=_convert_components(components_dict))
 
     def discover_agents(self) -> AgentsResponseDTO:
         """Discover all available agents.
@@ -71,18 +93,7 @@ class DiscoveryUseCase(DiscoveryPort):
             AgentsResponseDTO with list of all agents.
         """
         agents = self.discovery_service.discover_agents()
-
-        # Convert domain models to DTOs
-        dto_agents = [
-            AgentDTO(
-                ref=agent.ref,
-                info=AgentInfoDTO(name=agent.info.name, description=agent.info.description),
-                components=agent.components,
-            )
-            for agent in agents
-        ]
-
-        return AgentsResponseDTO(agents=dto_agents)
+        return AgentsResponseDTO(agents=tuple(map(_to_agent_dto, agents)))
 
     def discover_use_cases(self) -> UseCasesResponseDTO:
         """Discover all available use cases.
@@ -91,22 +102,7 @@ class DiscoveryUseCase(DiscoveryPort):
             UseCasesResponseDTO with list of all use cases.
         """
         use_cases = self.discovery_service.discover_use_cases()
-
-        # Convert domain models to DTOs
-        dto_use_cases = [
-            UseCaseDTO(
-                ref=uc.ref,
-                info=UseCaseInfoDTO(
-                    name=uc.info.name,
-                    description=uc.info.description,
-                    path_prefix=uc.info.path_prefix,
-                ),
-                components=uc.components,
-            )
-            for uc in use_cases
-        ]
-
-        return UseCasesResponseDTO(use_cases=dto_use_cases)
+        return UseCasesResponseDTO(use_cases=tuple(map(_to_use_case_dto, use_cases)))
 
     def discover_all(self) -> AllResourcesResponseDTO:
         """Discover all system resources.
@@ -115,46 +111,8 @@ class DiscoveryUseCase(DiscoveryPort):
             AllResourcesResponseDTO with all resources.
         """
         all_resources = self.discovery_service.discover_all()
-
-        # Convert components
-        dto_components = {}
-        for comp_type, components in all_resources.components.items():
-            dto_components[comp_type] = [
-                ComponentDTO(
-                    ref=comp.ref,
-                    info=ComponentInfoDTO(
-                        framework=comp.info.framework,
-                        family=comp.info.family,
-                        instance=comp.info.instance,
-                    ),
-                    api_key="**********" if comp.api_key_present else None,
-                    params=comp.params,
-                )
-                for comp in components
-            ]
-
-        # Convert agents
-        dto_agents = [
-            AgentDTO(
-                ref=agent.ref,
-                info=AgentInfoDTO(name=agent.info.name, description=agent.info.description),
-                components=agent.components,
-            )
-            for agent in all_resources.agents
-        ]
-
-        # Convert use cases
-        dto_use_cases = [
-            UseCaseDTO(
-                ref=uc.ref,
-                info=UseCaseInfoDTO(
-                    name=uc.info.name,
-                    description=uc.info.description,
-                    path_prefix=uc.info.path_prefix,
-                ),
-                components=uc.components,
-            )
-            for uc in all_resources.use_cases
-        ]
-
-        return AllResourcesResponseDTO(components=dto_components, agents=dto_agents, use_cases=dto_use_cases)
+        return AllResourcesResponseDTO(
+            components=_convert_components(all_resources.components),
+            agents=tuple(map(_to_agent_dto, all_resources.agents)),
+            use_cases=tuple(map(_to_use_case_dto, all_resources.use_cases)),
+        )
@@ -38,6 +38,21 @@ class Mapper:
             timestamp=datetime.now(),
         )
 
+    @staticmethod
+    def dto_to_domain(dto: AnswerRequestDTO) -> tuple[Message, Config]:
+        """Convert an answer request DTO to the domain message and Config in one pass.
+
+        Args:
+            dto: The answer request DTO containing the user's message and configuration.
+
+        Returns:
+            A tuple of the domain Message with the user's content and the domain Config.
+        """
+        return (
+            Message(role=Role.USER, content=dto.message, timestamp=datetime.now()),
+            Config(conversation_id=dto.config.conversation_id),
+        )
+
     @staticmethod
     def message_to_dto(message: Message, config: Config) -> AnswerResultDTO:
         """Convert a domain message to an answer result DTO.
@@ -49,10 +64,9 @@ class Mapper:
         Returns:
             An AnswerResultDTO containing the formatted response.
         """
-        assistant_message_dto = AssistantMessageDTO(role="assistant", content=message.content)
         return AnswerResultDTO(
-            message=assistant_message_dto,
-            conversation_id=config.conversation_id,  # Adjust as needed based on your DTO structure
+            message=AssistantMessageDTO(content=message.content),
+            conversation_id=config.conversation_id,
         )
 
     @staticmethod
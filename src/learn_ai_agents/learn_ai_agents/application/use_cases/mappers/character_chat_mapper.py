@@ -4,7 +4,7 @@ This module provides mapping functions to translate between application-layer
 DTOs and domain-layer models for character chat functionality.
 """
 
-from datetime import datetime
+from typing import Any
 
 from learn_ai_agents.application.dtos.agents.character_chat import (
     AssistantMessageDTO,
@@ -17,6 +17,15 @@ from learn_ai_agents.domain.models.agents.messages import Message, Role
 from learn_ai_agents.infrastructure.helpers.generators import Helper
 
 
+def _to_tool_call_dto(tool_call: dict[str, Any]) -> ToolCallDTO:
+    """Convert a tool call recorded in message metadata to its DTO."""
+    return ToolCallDTO(
+        name=tool_call.get("name", "<unknown_tool>"),
+        args=tool_call.get("args"),
+        output=tool_call.get("output"),
+    )
+
+
 class Mapper:
     """Mapper class for converting between DTOs and domain models.
 
@@ -41,6 +50,21 @@ class Mapper:
             timestamp=Helper.generate_timestamp(),
         )
 
+    @staticmethod
+    def dto_to_domain(dto: CharacterChatRequestDTO) -> tuple[Message, Config]:
+        """Convert a character chat request DTO to the domain message and Config in one pass.
+
+        Args:
+            dto: The character chat request DTO containing the user's message and configuration.
+
+        Returns:
+            A tuple of the domain Message with the user's content and the domain Config.
+        """
+        return (
+            Message(role=Role.USER, content=dto.message, timestamp=Helper.generate_timestamp()),
+            Config(conversation_id=dto.config.conversation_id),
+        )
+
     @staticmethod
     def message_to_dto(
         message: Message,
@@ -57,30 +81,16 @@ class Mapper:
         Returns:
             A CharacterChatResultDTO containing the formatted response.
         """
-        assistant_message_dto = AssistantMessageDTO(
-            role="assistant",
-            content=message.content,
-        )
+        assistant_message_dto = AssistantMessageDTO(content=message.content)
 
         # Extract tool_calls from message metadata
-        raw_tool_calls = (message.metadata or {}).get("tool_calls") if message.metadata else None
-        tool_calls_dto: list[ToolCallDTO] | None = None
-
-        if raw_tool_calls:
-            tool_calls_dto = [
-                ToolCallDTO(
-                    name=tc.get("name", "<unknown_tool>"),
-                    args=tc.get("args"),
-                    output=tc.get("output"),
-                )
-                for tc in raw_tool_calls
-            ]
+        raw_tool_calls = message.metadata.get("tool_calls") if message.metadata else None
 
         return CharacterChatResultDTO(
             message=assistant_message_dto,
             conversation_id=config.conversation_id,
             character_name=character_name,
-            tool_calls=tool_calls_dto,
+            tool_calls=list(map(_to_tool_call_dto, raw_tool_calls)) if raw_tool_calls else None,
         )
 
     @staticmethod
@@ -0,0 +1,67 @@
+"""Input checks shared by the agent use cases.
+
+Every agent request ends in an LLM call, the slowest step of a request. The
+helpers here let the use cases answer empty messages without calling the
+agent and keep oversized messages from reaching it whole.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Protocol, TypeVar
+
+from typing_extensions import Self
+
+from learn_ai_agents.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Longest user message passed to the agent; longer messages are truncated
+MAX_MESSAGE_CHARS = 16_000
+
+
+class _MessageRequest(Protocol):
+    """Request DTO carrying the user's message."""
+
+    @property
+    def message(self) -> str: ...
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self: ...
+
+
+_RequestT = TypeVar("_RequestT", bound=_MessageRequest)
+
+
+def trim_message(message: str, max_chars: int = MAX_MESSAGE_CHARS) -> str:
+    """Strip surrounding whitespace from a user message and cap its length.
+
+    Args:
+        message: The user's message as received.
+        max_chars: Maximum number of characters kept.
+
+    Returns:
+        The trimmed message, empty if the message was empty or only whitespace.
+    """
+    text = message.strip()
+    if len(text) > max_chars:
+        logger.warning("Truncating message of %s characters to %s", len(text), max_chars)
+        text = text[:max_chars]
+    return text
+
+
+def trim_request(cmd: _RequestT, max_chars: int = MAX_MESSAGE_CHARS) -> _RequestT | None:
+    """Return a request whose message is trimmed with ``trim_message``.
+
+    The request is only copied when trimming changed its message.
+
+    Args:
+        cmd: The request DTO as received.
+        max_chars: Maximum number of characters kept.
+
+    Returns:
+        The request to pass on, or None if its message was empty or only whitespace.
+    """
+    message = trim_message(cmd.message, max_chars)
+    if not message:
+        return None
+    if message != cmd.message:
+        return cmd.model_copy(update={"message": message})
+    return cmd
@@ -0,0 +1,114 @@
+"""Streaming helpers shared by the agent use cases.
+
+LLMs stream one token at a time, so forwarding every ChunkDelta as its own
+stream event costs one DTO and one SSE frame per token. The helpers here
+merge text deltas that arrive close together before they reach the use case.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from learn_ai_agents.domain.models.agents.messages import ChunkDelta
+
+# Longest time a text delta waits for following deltas to be merged with it
+STREAM_COALESCE_WINDOW = 0.02
+# Merged text is flushed as soon as it reaches this many characters
+STREAM_COALESCE_MAX_CHARS = 256
+# Chunks read ahead from the agent before the producer waits for the consumer
+STREAM_READ_AHEAD = 64
+
+_END_OF_STREAM = object()
+
+
+class _StreamFailure:
+    """Carries an exception raised by the agent stream to the consuming task."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+async def coalesce_text_deltas(
+    chunks: AsyncIterator[ChunkDelta],
+    window: float = STREAM_COALESCE_WINDOW,
+    max_chars: int = STREAM_COALESCE_MAX_CHARS,
+) -> AsyncIterator[ChunkDelta]:
+    """Merge consecutive text deltas that arrive within ``window`` seconds.
+
+    The agent stream is consumed by a single background task that feeds a
+    bounded queue, so the agent's async generator always runs in one task
+    (context variables set by LangChain/LangGraph stay valid) and a slow
+    client applies backpressure to the agent. Non-text chunks flush any
+    buffered text first and are passed through unchanged, in order.
+
+    Closing the returned generator cancels the background task and waits for
+    it, so the agent's generator is closed before ``aclose()`` returns.
+
+    Args:
+        chunks: The agent's stream of chunks.
+        window: Maximum seconds the first buffered delta waits before being flushed.
+        max_chars: Buffered text length that triggers an immediate flush.
+
+    Yields:
+        Chunks in stream order, with runs of text deltas merged into one.
+
+    Raises:
+        Exception: Whatever the agent stream raises, re-raised in the consuming task.
+    """
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=STREAM_READ_AHEAD)
+
+    async def produce() -> None:
+        try:
+            async with aclosing(chunks) as stream:  # type: ignore[type-var]
+                async for chunk in stream:
+                    await queue.put(chunk)
+        except Exception as e:
+            await queue.put(_StreamFailure(e))
+        else:
+            await queue.put(_END_OF_STREAM)
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.ensure_future(produce())
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline = 0.0
+
+    try:
+        while True:
+            if buffer:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    yield ChunkDelta(kind="text", text="".join(buffer))
+                    buffer.clear()
+                    buffered_chars = 0
+                    continue
+            else:
+                item = await queue.get()
+
+            if isinstance(item, ChunkDelta) and item.kind == "text" and item.text is not None:
+                if not buffer:
+                    deadline = loop.time() + window
+                buffer.append(item.text)
+                buffered_chars += len(item.text)
+                if buffered_chars >= max_chars:
+                    yield ChunkDelta(kind="text", text="".join(buffer))
+                    buffer.clear()
+                    buffered_chars = 0
+                continue
+
+            if buffer:
+                yield ChunkDelta(kind="text", text="".join(buffer))
+                buffer.clear()
+                buffered_chars = 0
+
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, _StreamFailure):
+                raise item.error
+            yield item  # type: ignore[misc]
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
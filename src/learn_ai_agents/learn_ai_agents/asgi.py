@@ -4,16 +4,22 @@ This module creates the ASGI application instance used by production
 servers (uvicorn, gunicorn, etc.).
 """
 
-import logging
+from __future__ import annotations
+
+# Warm up async-library detection at startup rather than on the first requests:
+# httpx/httpcore call sniffio on every request and anyio loads its backend lazily.
+import anyio._backends._asyncio  # noqa: F401
+import sniffio  # noqa: F401
 
 from learn_ai_agents.app_factory import create_app
 from learn_ai_agents.logging import get_logger, setup_logging
 from learn_ai_agents.settings import AppSettings
 
 # Initialize logging before creating the app
-setup_logging(level=logging.INFO, use_colors=True)
+setup_logging(level="INFO", use_colors=True)
 logger = get_logger(__name__)
 
 # Production ASGI application instance
-# This is only executed when running the server, not during test imports
+# This is only executed when running the server, not during test imports.
+# The DI container is built in the lifespan, once the server starts.
 app = create_app(AppSettings())
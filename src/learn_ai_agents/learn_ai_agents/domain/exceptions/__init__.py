@@ -14,6 +14,7 @@ from .components import (
     ComponentOperationException,
     # Specific exceptions
     ComponentNotAvailableException,
+    EmbeddingBatchFailedException,
 )
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
 
     # Specific component exceptions
     "ComponentNotAvailableException",
+    "EmbeddingBatchFailedException",
 ]
\ No newline at end of file
@@ -2,13 +2,19 @@
 
 This module defines custom exception classes for domain-specific Exceptions.
 """
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Shared read-only details of exceptions raised without any
+_EMPTY_DETAILS: Mapping[str, object] = MappingProxyType({})
+
 # --- Base Exception ----------------------------------------------
 class AppException(Exception):
     """Base class for all app-specific Exceptions."""
     def __init__(self, message: str = "", *, details: dict[str, object] | None = None):
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details: Mapping[str, object] = details or _EMPTY_DETAILS
 
 
 # --- Domain / business rules ------------------------------------
@@ -34,8 +40,9 @@ class ComponentException(AppException):
     """
     
     def __init__(self, component_type: str, message: str = "", *, details: dict[str, object] | None = None):
-        details = details or {}
-        details["component_type"] = component_type
+        # component_type is kept as an attribute; it is only copied into details the caller supplied
+        if details is not None:
+            details["component_type"] = component_type
         super().__init__(message, details=details)
         self.component_type = component_type
 
@@ -53,8 +60,9 @@ class AgentException(AppException):
     """
     
     def __init__(self, agent_component: str, message: str = "", *, details: dict[str, object] | None = None):
-        details = details or {}
-        details["agent_component"] = agent_component
+        # agent_component is kept as an attribute; it is only copied into details the caller supplied
+        if details is not None:
+            details["agent_component"] = agent_component
         super().__init__(message, details=details)
         self.agent_component = agent_component
 
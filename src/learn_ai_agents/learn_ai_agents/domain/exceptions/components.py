@@ -42,4 +42,13 @@ class ComponentValidationException(ComponentException):
     Use this for cases like invalid settings, malformed input, or configuration validation failures.
     This is distinct from ComponentBuildingException which is for initialization failures.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class EmbeddingBatchFailedException(ComponentOperationException):
+    """
+    Exception raised when an asynchronous embedding batch ends without usable results.
+    Use this for terminal batch states (failed, expired, cancelled or completed with failed
+    requests), as opposed to transient errors while checking on a batch that is still running.
+    """
+    pass
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 from ._base import BusinessRuleException
@@ -6,11 +7,24 @@ from ._base import BusinessRuleException
 class ResourceNotFoundException(BusinessRuleException):
     """
     Exception raised when a requested resource is not found.
+
+    The message is only formatted when first read (``str(exc)`` or
+    ``exc.message``), since many of these are caught without being logged.
     """
 
     def __init__(self, resource_type: str, resource_id: str):
-        message = f"{resource_type} with ID '{resource_id}' not found."
-        super().__init__(message, details={"resource_type": resource_type, "resource_id": resource_id})
+        # args mirror the constructor so the exception still pickles
+        Exception.__init__(self, resource_type, resource_id)
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.details = {"resource_type": resource_type, "resource_id": resource_id}
+
+    @cached_property
+    def message(self) -> str:  # type: ignore[override]
+        return f"{self.resource_type} with ID '{self.resource_id}' not found."
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidRequestException(BusinessRuleException):
@@ -7,7 +7,7 @@ from .messages import Message, Role
 from learn_ai_agents.infrastructure.helpers.generators import Helper
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """
     Represents a conversation history with optional system instructions.
@@ -34,7 +34,7 @@ class Conversation:
     
     def __post_init__(self):
         if self.conversation_started_at is None:
-            object.__setattr__(self, 'conversation_started_at', Helper.generate_timestamp())
+            self.conversation_started_at = Helper.generate_timestamp()
 
     def add_message(self, role: Role, content: str) -> None:
         """
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentInfo:
     """Domain model for component discovery information.
 
@@ -23,7 +23,7 @@ class ComponentInfo:
     instance: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """Domain model representing a discoverable component.
 
@@ -40,7 +40,7 @@ class Component:
     params: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInfo:
     """Domain model for agent information.
 
@@ -53,7 +53,7 @@ class AgentInfo:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Domain model representing a discoverable agent.
 
@@ -70,7 +70,7 @@ class Agent:
     components: dict[str, str | dict[str, str]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UseCaseInfo:
     """Domain model for use case information.
 
@@ -85,7 +85,7 @@ class UseCaseInfo:
     path_prefix: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UseCase:
     """Domain model representing a discoverable use case.
 
@@ -102,7 +102,7 @@ class UseCase:
     components: dict[str, str | dict[str, str]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemResources:
     """Domain model for all system resources.
 
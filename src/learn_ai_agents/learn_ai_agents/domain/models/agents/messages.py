@@ -18,16 +18,18 @@ Key concepts:
 
 import enum
 from dataclasses import dataclass
-from typing import Any, Literal, Dict
+from typing import Any, Literal, Dict, NamedTuple
 from datetime import datetime
 
 
-class Role(enum.Enum):
+class Role(str, enum.Enum):
     """
     Represents the role/speaker in a conversation.
 
     This is a domain concept that transcends any specific LLM provider's format.
     We use this enum to maintain consistency across different LLM adapters.
+    Members are strings, so they serialize and compare as their value
+    (``Role.USER == "user"``) without going through ``.value``.
 
     Attributes:
         SYSTEM: System-level instructions that guide the agent's behavior
@@ -41,8 +43,12 @@ class Role(enum.Enum):
     ASSISTANT = "assistant"
     TOOL = "tool"
 
+    def __str__(self) -> str:
+        # Same as enum.StrEnum (Python 3.11+): str() and f-strings give the value
+        return self.value
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """
     A single message in a conversation.
@@ -67,8 +73,7 @@ class Message:
     metadata: Dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
-class ChunkDelta:
+class ChunkDelta(NamedTuple):
     """
     Streaming event from the agent.
 
@@ -85,8 +90,9 @@ class ChunkDelta:
         tool_input: Input arguments for the tool (for tool_start)
         tool_output: Output from the tool (for tool_end)
 
-    Design Note: We use frozen=True to make these immutable, as stream chunks
-    should not be modified after creation.
+    Design Note: One ChunkDelta is created per streamed token, so it is a
+    NamedTuple: immutable like a frozen dataclass, but built as a plain tuple,
+    which is cheaper to create and smaller in memory.
 
     Examples:
         # Text chunk:
@@ -4,12 +4,15 @@ This module contains domain entities and value objects for the content indexing
 """
 
 from .document_chunk import DocumentChunk
+from .embedding_batch import EmbeddingBatch
 from .source_ingestion import ContentRequest, Document
-from .vector_types import VectorDistanceMetric
+from .vector_types import EmbeddingArray, VectorDistanceMetric
 
 __all__ = [
     "ContentRequest",
     "Document",
     "DocumentChunk",
+    "EmbeddingArray",
+    "EmbeddingBatch",
     "VectorDistanceMetric",
 ]
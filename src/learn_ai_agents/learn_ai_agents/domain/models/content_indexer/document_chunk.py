@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentChunk:
     """
     Represents a chunk of a document.
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingBatch:
+    """
+    Represents an embedding job submitted to an asynchronous batch API.
+
+    Attributes:
+        batch_id: Identifier of the batch job returned by the provider.
+        document_id: The document whose chunks are being embedded.
+        vectorization_approach: The embedder approach the batch was submitted with.
+        chunk_count: Number of chunks (texts) in the batch, in chunk order.
+    """
+
+    batch_id: str
+    document_id: str
+    vectorization_approach: str
+    chunk_count: int
@@ -5,7 +5,7 @@ from datetime import datetime
 from learn_ai_agents.infrastructure.helpers.generators import Helper
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentRequest:
     """Domain-level description of the content you want."""
 
@@ -16,7 +16,7 @@ class ContentRequest:
     created_at: datetime = field(default_factory=Helper.generate_timestamp)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document:
     """Domain-level description of retrieved content."""
 
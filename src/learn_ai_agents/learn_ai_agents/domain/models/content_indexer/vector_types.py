@@ -5,6 +5,14 @@ that are independent of any specific vector database implementation.
 """
 
 from enum import Enum
+from typing import TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+# float32 embeddings: one vector has shape [dimensions], a batch of them [count, dimensions].
+# A contiguous float32 buffer takes 4 bytes per dimension, against ~32 for a list of Python floats.
+EmbeddingArray: TypeAlias = npt.NDArray[np.float32]
 
 
 class VectorDistanceMetric(Enum):
@@ -1,22 +1,23 @@
 from dataclasses import dataclass
-from typing import List
 
 from .document_chunk import DocumentChunk
+from .vector_types import EmbeddingArray
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VectorizedDocumentChunk(DocumentChunk):
     """
     Represents a vectorized chunk of a document.
 
     Attributes:
-        vector: The vector representation of the document chunk.
+        vector: The float32 embedding of the document chunk, of shape [dimensions].
+        dimensions: The dimensionality of the embedding.
     """
 
-    vector: List[float]
+    vector: EmbeddingArray
     dimensions: int
 
     def __post_init__(self):
         """Validate the embedding."""
-        if len(self.vector) != self.dimensions:
-            raise ValueError(f"Vector length {len(self.vector)} does not match declared dimensions {self.dimensions}")
+        if self.vector.shape != (self.dimensions,):
+            raise ValueError(f"Vector shape {self.vector.shape} does not match declared dimensions {self.dimensions}")
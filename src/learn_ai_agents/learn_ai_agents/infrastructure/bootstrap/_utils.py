@@ -5,14 +5,18 @@ bootstrap containers for dependency injection and component instantiation.
 """
 
 import importlib
+from functools import cache
 from typing import Any
 
 
+@cache
 def import_class_from_string(path: str) -> type[Any]:
     """Dynamically import and return a class from a fully qualified module path.
 
     This utility enables configuration-driven component instantiation by
-    loading classes specified as strings in configuration files.
+    loading classes specified as strings in configuration files. Results are
+    memoized per path, since the containers resolve the same adapter classes
+    for many agents, use cases and components; failed imports are not cached.
 
     Args:
         path: Fully qualified Python path to the class
@@ -8,6 +8,7 @@ AI agent instances with their dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from threading import RLock
 from typing import Any
 
 from learn_ai_agents.application.outbound_ports.agents.agent_engine import AgentEngine
@@ -26,79 +27,89 @@ logger = get_logger(__name__)
 class AgentsContainer:
     """Container for managing agent instances.
 
-    This container creates and manages AI agent instances based on
+    This container lazily creates and caches AI agent instances based on
     configuration, injecting required dependencies (LLMs, tools, etc.).
+    An agent (and the components it needs) is only built the first time
+    it is requested.
 
     Attributes:
         settings: The application settings to use for agent resolution.
-        _agents: Dictionary of agent instances keyed by name.
+        components: The components container for dependency injection.
+        _agents: Cache of agent instances keyed by 'framework.agent_name'.
+        _lock: Thread lock for safe concurrent access.
     """
 
     settings: AppSettings
+    components: ComponentsContainer
     _agents: dict[str, Any]
+    _lock: RLock
 
     @classmethod
     def create(cls, settings: AppSettings, components: ComponentsContainer) -> Self:
-        """Create the agents container with all configured agents.
-
-        Reads agent configurations from settings and instantiates each
-        agent with its required components.
+        """Create the agents container without building any agent yet.
 
         Args:
             settings: The application settings to use for agent resolution.
             components: The components container for dependency injection.
 
         Returns:
-            Initialized AgentsContainer with all agents.
+            AgentsContainer that builds agents on first access.
         """
-        agents: dict[str, Any] = {}
-
-        # Iterate through frameworks (e.g., 'langchain')
-        for framework, framework_agents in settings.agents.items():
-            # Iterate through agents in this framework
-            for agent_key, agent_cfg in framework_agents.items():
-                full_key = f"{framework}.{agent_key}"
-                logger.info(f"Initializing agent: {full_key} ({agent_cfg.info.name})")
-
-                agent_cls = import_class_from_string(agent_cfg.constructor.module_class)
-
-                # Build kwargs for agent constructor
-                kwargs: dict[str, Any] = {"config": {}}
-
-                # Merge additional config from constructor.config if present
-                if agent_cfg.constructor.config:
-                    kwargs["config"].update(agent_cfg.constructor.config)
-
-                # Resolve and inject all component types dynamically
-                if agent_cfg.constructor.components:
-                    components_dict = agent_cfg.constructor.components.model_dump(exclude_none=True)
-                    for component_type, component_refs in components_dict.items():
-                        # Check if component_refs is a dict (multiple components) or string (single component)
-                        if isinstance(component_refs, dict):
-                            # Multiple components: component_refs is like {'default': 'llms.langchain.groq.default'}
-                            resolved_components = {alias: components.get(ref) for alias, ref in component_refs.items()}
-                            kwargs[component_type] = resolved_components
-                        else:
-                            # Single component: component_refs is a string like 'checkpointers.mongo.saver.default'
-                            resolved_component = components.get(component_refs)
-                            kwargs[component_type] = resolved_component
-
-                # Instantiate agent with all components as kwargs
-                agent = agent_cls(**kwargs)
-
-                # Store with fully qualified key: framework.agent_name
-                agents[full_key] = agent
-                logger.debug(f"Agent initialized successfully: {full_key}")
-
-        return cls(settings, agents)
+        return cls(settings=settings, components=components, _agents={}, _lock=RLock())
 
     def get(self, name: str) -> AgentEngine:
-        """Retrieve an agent by name.
+        """Retrieve an agent by name, building it on first access.
 
         Args:
-            name: The agent identifier.
+            name: The agent identifier ('framework.agent_name').
 
         Returns:
             The requested agent instance.
         """
-        return self._agents[name]
+        with self._lock:
+            if name in self._agents:
+                return self._agents[name]
+
+            agent = self._build(name)
+            self._agents[name] = agent
+            return agent
+
+    def _build(self, name: str) -> AgentEngine:
+        """Instantiate an agent with all its configured components.
+
+        Args:
+            name: The agent identifier ('framework.agent_name').
+
+        Returns:
+            The new agent instance.
+        """
+        agent_cfg = self.settings.resolve_ref(name, "agent")
+        logger.info(f"Initializing agent: {name} ({agent_cfg.info.name})")
+
+        agent_cls = import_class_from_string(agent_cfg.constructor.module_class)
+
+        # Build kwargs for agent constructor
+        kwargs: dict[str, Any] = {"config": {}}
+
+        # Merge additional config from constructor.config if present
+        if agent_cfg.constructor.config:
+            kwargs["config"].update(agent_cfg.constructor.config)
+
+        # Resolve and inject all component types dynamically
+        if agent_cfg.constructor.components:
+            components_dict = agent_cfg.constructor.components.model_dump(exclude_none=True)
+            for component_type, component_refs in components_dict.items():
+                # Check if component_refs is a dict (multiple components) or string (single component)
+                if isinstance(component_refs, dict):
+                    # Multiple components: component_refs is like {'default': 'llms.langchain.groq.default'}
+                    resolved_components = {alias: self.components.get(ref) for alias, ref in component_refs.items()}
+                    kwargs[component_type] = resolved_components
+                else:
+                    # Single component: component_refs is a string like 'checkpointers.mongo.saver.default'
+                    resolved_component = self.components.get(component_refs)
+                    kwargs[component_type] = resolved_component
+
+        # Instantiate agent with all components as kwargs
+        agent = agent_cls(**kwargs)
+        logger.debug(f"Agent initialized successfully: {name}")
+        return agent
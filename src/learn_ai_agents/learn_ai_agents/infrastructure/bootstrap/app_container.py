@@ -45,6 +45,8 @@ class AppContainer:
 
         Creates all containers in the correct dependency order:
         components (with databases connected) → agents → use cases.
+        Only databases are initialized here; other components, agents and
+        use cases are built lazily the first time they are requested.
 
         Args:
             settings: AppSettings instance to use for building the container.
@@ -7,7 +7,10 @@ use case instances with their agent dependencies.
 # infrastructure/bootstrap/usecases_container.py
 from __future__ import annotations
 
+import asyncio
+import inspect
 from dataclasses import dataclass
+from threading import RLock
 from typing import Any
 
 from learn_ai_agents.logging import get_logger
@@ -18,7 +21,7 @@ from .agents_container import AgentsContainer
 
 
 from .components_container import ComponentsContainer
-from learn_ai_agents.settings import AppSettings
+from learn_ai_agents.settings import AppSettings, UseCaseConfig
 
 logger = get_logger(__name__)
 
@@ -27,23 +30,33 @@ logger = get_logger(__name__)
 class UseCasesContainer:
     """Container for managing use case instances.
 
-    This container creates and manages use case instances, injecting
-    the required agent dependencies.
+    This container lazily creates and caches use case instances, injecting
+    the required agent dependencies. A use case (and the agents and components
+    behind it) is only built the first time it is requested, so use cases that
+    are never hit pay nothing at startup. Request handlers use ``aget``, which
+    builds in a worker thread so the event loop is never blocked.
 
     Attributes:
         settings: The application settings to use for use case resolution.
-        _use_cases: Dictionary of use case instances keyed by name.
+        agents: The agents container for dependency injection.
+        components: The components container for dependency injection (optional).
+        _use_cases: Cache of use case instances keyed by name.
+        _lock: Thread lock for safe concurrent access.
+        _build_lock: Lets concurrent first requests wait for a single build.
     """
 
     settings: AppSettings
+    agents: AgentsContainer
+    components: ComponentsContainer | None
     _use_cases: dict[str, Any]
+    _lock: RLock
+    _build_lock: asyncio.Lock
 
     @classmethod
-    def create(cls, settings: AppSettings, agents: AgentsContainer, components: ComponentsContainer | None = None) -> Self:
-        """Create the use cases container with all configured use cases.
-
-        Instantiates all use cases with their required dependencies
-        based on configuration from settings.
+    def create(
+        cls, settings: AppSettings, agents: AgentsContainer, components: ComponentsContainer | None = None
+    ) -> Self:
+        """Create the use cases container without building any use case yet.
 
         Args:
             settings: The application settings to use for use case resolution.
@@ -51,59 +64,39 @@ class UseCasesContainer:
             components: The components container for dependency injection (optional).
 
         Returns:
-            Initialized UseCasesContainer with all use cases.
+            UseCasesContainer that builds use cases on first access.
         """
-        use_cases: dict[str, Any] = {}
+        return cls(
+            settings=settings,
+            agents=agents,
+            components=components,
+            _use_cases={},
+            _lock=RLock(),
+            _build_lock=asyncio.Lock(),
+        )
 
-        # Iterate through all configured use cases
-        for use_case_key, use_case_cfg in settings.use_cases.items():
-            logger.info(f"Setting up use case: {use_case_key} ({use_case_cfg.info.name})")
+    def get(self, name: str) -> Any:
+        """Retrieve a use case by name, building it on first access.
 
-            use_case_cls = import_class_from_string(use_case_cfg.constructor.module_class)
+        Args:
+            name: The use case identifier.
 
-            # Build kwargs for use case constructor dynamically
-            kwargs: dict[str, Any] = {}
-
-            # Resolve all component types dynamically
-            if use_case_cfg.constructor.components:
-                components_dict = use_case_cfg.constructor.components.model_dump(exclude_none=True)
-                for component_type, component_refs in components_dict.items():
-                    if component_type == "agents":
-                        # Special handling for agents - resolve from agents container
-                        resolved_components = {
-                            alias: agents.get(ref.replace("agents.", "")) for alias, ref in component_refs.items()
-                        }
-                        # If there's only one agent with alias 'agent', pass it directly
-                        if len(resolved_components) == 1 and "agent" in resolved_components:
-                            kwargs["agent"] = resolved_components["agent"]
-                        else:
-                            kwargs[component_type] = resolved_components
-                    else:
-                        # Handle other component types (content_retriever, document_repository, etc.)
-                        # Resolve from components container if available
-                        resolved_components = {}
-                        for alias, ref in component_refs.items():
-                            if components:
-                                resolved_components[alias] = components.get(ref)
-                            else:
-                                logger.warning(f"Components container not available, passing ref: {ref}")
-                                resolved_components[alias] = ref
-
-                        # If there's only one component with matching alias, pass it directly
-                        if len(resolved_components) == 1 and component_type in resolved_components:
-                            kwargs[component_type] = resolved_components[component_type]
-                        else:
-                            kwargs[component_type] = resolved_components
+        Returns:
+            The requested use case instance.
+        """
+        with self._lock:
+            if name in self._use_cases:
+                return self._use_cases[name]
 
-            # Instantiate the use case with all dependencies as kwargs
-            use_case = use_case_cls(**kwargs)
-            use_cases[use_case_key] = use_case
-            logger.debug(f"Use case initialized: {use_case_key}")
+            use_case = self._build(name)
+            self._use_cases[name] = use_case
+            return use_case
 
-        return cls(settings, use_cases)
+    async def aget(self, name: str) -> Any:
+        """Retrieve a use case by name, building it in a worker thread on first access.
 
-    def get(self, name: str) -> Any:
-        """Retrieve a use case by name.
+        Building a use case may load models, open clients and compile agent graphs,
+        so it runs off the event loop; concurrent first requests wait for one build.
 
         Args:
             name: The use case identifier.
@@ -111,29 +104,112 @@ class UseCasesContainer:
         Returns:
             The requested use case instance.
         """
-        return self._use_cases[name]
+        if name in self._use_cases:
+            return self._use_cases[name]
+
+        async with self._build_lock:
+            return await asyncio.to_thread(self.get, name)
+
+    def _build(self, name: str) -> Any:
+        """Instantiate a use case with all its configured dependencies.
 
-    def list_agent_answer_use_cases(self) -> dict[str, Any]:
+        Args:
+            name: The use case identifier.
+
+        Returns:
+            The new use case instance.
+        """
+        use_case_cfg = self.settings.resolve_ref(name, "use_case")
+        logger.info(f"Setting up use case: {name} ({use_case_cfg.info.name})")
+
+        use_case_cls = import_class_from_string(use_case_cfg.constructor.module_class)
+
+        # Build kwargs for use case constructor dynamically
+        kwargs: dict[str, Any] = {}
+
+        # Resolve all component types dynamically
+        if use_case_cfg.constructor.components:
+            components_dict = use_case_cfg.constructor.components.model_dump(exclude_none=True)
+            for component_type, component_refs in components_dict.items():
+                if component_type == "agents":
+                    # Special handling for agents - resolve from agents container
+                    resolved_components = {
+                        alias: self.agents.get(ref.replace("agents.", "")) for alias, ref in component_refs.items()
+                    }
+                    # If there's only one agent with alias 'agent', pass it directly
+                    if len(resolved_components) == 1 and "agent" in resolved_components:
+                        kwargs["agent"] = resolved_components["agent"]
+                    else:
+                        kwargs[component_type] = resolved_components
+                else:
+                    # Handle other component types (content_retriever, document_repository, etc.)
+                    # Resolve from components container if available
+                    resolved_components = {}
+                    for alias, ref in component_refs.items():
+                        if self.components:
+                            resolved_components[alias] = self.components.get(ref)
+                        else:
+                            logger.warning(f"Components container not available, passing ref: {ref}")
+                            resolved_components[alias] = ref
+
+                    # If there's only one component with matching alias, pass it directly
+                    if len(resolved_components) == 1 and component_type in resolved_components:
+                        kwargs[component_type] = resolved_components[component_type]
+                    else:
+                        kwargs[component_type] = resolved_components
+
+        # Additional configuration parameters are passed as keyword arguments too
+        if use_case_cfg.constructor.config:
+            kwargs.update(self._accepted_config(name, use_case_cls, use_case_cfg.constructor.config))
+
+        # Instantiate the use case with all dependencies as kwargs
+        use_case = use_case_cls(**kwargs)
+        logger.debug(f"Use case initialized: {name}")
+        return use_case
+
+    @staticmethod
+    def _accepted_config(name: str, use_case_cls: type[Any], config: dict[str, Any]) -> dict[str, Any]:
+        """Keep the configuration parameters the use case constructor declares.
+
+        Use case configs may carry settings meant for other layers (e.g. the agent's
+        retry_policy), so only keys matching a constructor parameter are forwarded.
+
+        Args:
+            name: The use case identifier, for logging.
+            use_case_cls: The use case class to instantiate.
+            config: The use case's constructor.config mapping.
+
+        Returns:
+            The configuration parameters to pass as keyword arguments.
+        """
+        parameters = inspect.signature(use_case_cls).parameters
+        if any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()):
+            return dict(config)
+
+        ignored = sorted(key for key in config if key not in parameters)
+        if ignored:
+            logger.debug(f"Use case {name} does not take config keys {ignored}; not passing them")
+        return {key: value for key, value in config.items() if key in parameters}
+
+    def list_agent_answer_use_cases(self) -> dict[str, UseCaseConfig]:
         """List all use cases that implement AgentAnswerPort.
 
-        This method filters the use cases to return only those that follow
-        the AgentAnswerPort protocol (duck typing check for required methods).
+        This method filters the configured use cases to return only those that
+        follow the AgentAnswerPort protocol (duck typing check for required methods).
+        Only the use case classes named in the settings are inspected; no use case
+        is built.
 
         Returns:
-            Dictionary of use case instances that implement AgentAnswerPort,
-            keyed by their identifiers.
+            Configuration of each use case that implements AgentAnswerPort,
+            keyed by its identifier.
         """
 
         agent_use_cases = {}
-        for name, use_case in self._use_cases.items():
+        for name, use_case_cfg in self.settings.use_cases.items():
+            use_case_cls = import_class_from_string(use_case_cfg.constructor.module_class)
             # Check if the use case implements the AgentAnswerPort protocol
             # by verifying it has the required methods
-            if (
-                hasattr(use_case, "invoke")
-                and hasattr(use_case, "stream")
-                and callable(use_case.invoke)
-                and callable(use_case.stream)
-            ):
-                agent_use_cases[name] = use_case
+            if callable(getattr(use_case_cls, "ainvoke", None)) and callable(getattr(use_case_cls, "astream", None)):
+                agent_use_cases[name] = use_case_cfg
 
         return agent_use_cases
@@ -15,6 +15,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_adding_memory_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -52,7 +53,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         result = await use_case.ainvoke(dto)
 
         logger.info(f"POST /invoke completed - conversation_id: {dto.config.conversation_id}")
-        return result
+        return dto_response(result)
 
     @router.post("/astream")
     async def astream(
@@ -14,6 +14,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_adding_tools_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -53,7 +54,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         result = await use_case.ainvoke(dto)
 
         logger.info(f"POST /ainvoke completed - conversation_id: {dto.config.conversation_id}")
-        return result
+        return dto_response(result)
 
     @router.post("/astream")
     async def astream(
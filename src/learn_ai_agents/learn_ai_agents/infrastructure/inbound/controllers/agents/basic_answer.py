@@ -1,6 +1,6 @@
 """FastAPI controller for basic answer endpoint."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from fastapi.responses import StreamingResponse
 
 from learn_ai_agents.application.dtos.agents.basic_answer import (
@@ -11,6 +11,7 @@ from learn_ai_agents.application.use_cases.agents.basic_answer.basic_answer impo
 from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 from ..dependencies import get_basic_answer_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -30,7 +31,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
     async def ainvoke(
         dto: AnswerRequestDTO,
         use_case: BasicAnswerUseCase = Depends(get_basic_answer_use_case),
-    ) -> AnswerResultDTO:
+    ) -> Response:
         """Answer a question with complete response.
 
         Args:
@@ -46,7 +47,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         result = await use_case.ainvoke(dto)
 
         logger.info(f"POST /ainvoke completed - conversation_id: {dto.config.conversation_id}")
-        return result
+        return dto_response(result)
 
     @router.post("/astream")
     async def astream(
@@ -15,6 +15,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_character_chat_use_case
+from ..responses import character_chat_sse_frame, dto_response
 
 logger = get_logger(__name__)
 
@@ -57,7 +58,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         logger.info(
             f"POST /ainvoke completed - conversation_id: {dto.config.conversation_id}, character: {dto.character_name}"
         )
-        return result
+        return dto_response(result)
 
     @router.post("/astream")
     async def astream(
@@ -83,7 +84,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
 
         async def _gen():
             async for ev in use_case.astream(dto):  # type: ignore
-                yield f"data: {ev.model_dump_json()}\n\n".encode()
+                yield character_chat_sse_frame(ev)
             logger.info(
                 f"POST /astream completed - conversation_id: {dto.config.conversation_id}, character: {dto.character_name}"
             )
@@ -4,7 +4,7 @@ This module provides endpoints for ingesting content from various sources
 (web, files, etc.) and storing them in the document repository.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from learn_ai_agents.application.dtos.content_indexer.document_splitting import (
     DocumentSplittingRequestDTO,
@@ -18,6 +18,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_document_splitting_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -37,7 +38,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
     async def split_document(
         request: DocumentSplittingRequestDTO,
         use_case: DocumentSplittingUseCase = Depends(get_document_splitting_use_case),
-    ) -> DocumentSplittingResponseDTO:
+    ) -> Response:
         """
         Endpoint to split documents into chunks for vector storage.
         Args:
@@ -58,7 +59,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         try:
             response = await use_case.split_documents(request)
             logger.info(f"Document splitting successful for document_id: {request.document_id}")
-            return response
+            return dto_response(response)
         except BusinessRuleException as e:
             logger.error(f"Document splitting failed for document_id: {request.document_id} - {e}")
             raise HTTPException(status_code=400, detail=str(e)) from e
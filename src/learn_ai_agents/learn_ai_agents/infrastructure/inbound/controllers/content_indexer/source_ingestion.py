@@ -4,7 +4,7 @@ This module provides endpoints for ingesting content from various sources
 (web, files, etc.) and storing them in the document repository.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from learn_ai_agents.application.dtos.content_indexer.source_ingestion import (
     SourceIngestionRequestDTO,
@@ -18,6 +18,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_source_ingestion_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -37,7 +38,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
     async def ingest_content(
         request: SourceIngestionRequestDTO,
         use_case: SourceIngestionUseCase = Depends(get_source_ingestion_use_case),
-    ) -> SourceIngestionResponseDTO:
+    ) -> Response:
         """
         Ingest content from a source and store it in the document repository.
 
@@ -83,7 +84,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         try:
             result = await use_case.ingest_content(request)
             logger.info(f"Content ingestion successful - document_id: {result.document_id}")
-            return result
+            return dto_response(result)
         except BusinessRuleException as e:
             logger.error(f"Domain error during content ingestion: {e}")
             raise HTTPException(status_code=400, detail=str(e))
@@ -4,7 +4,7 @@ This module provides endpoints for vectorizing document chunks
 and storing them in a vector database.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from learn_ai_agents.application.dtos.content_indexer.vectorization import (
     VectorizationRequestDTO,
@@ -18,6 +18,7 @@ from learn_ai_agents.logging import get_logger
 from learn_ai_agents.settings import UseCaseConfig
 
 from ..dependencies import get_vectorization_use_case
+from ..responses import dto_response
 
 logger = get_logger(__name__)
 
@@ -37,7 +38,7 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
     async def vectorize_chunks(
         request: VectorizationRequestDTO,
         use_case: VectorizationUseCase = Depends(get_vectorization_use_case),
-    ) -> VectorizationResponseDTO:
+    ) -> Response:
         """
         Vectorize document chunks and store them in a vector database.
 
@@ -46,12 +47,16 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
         2. Generates embeddings using the specified vectorization approach
         3. Stores the chunks with their embeddings in the vector database
 
+        Large documents are embedded through a batch API instead: the response
+        is 202 with status "pending" until the batch has completed, and the
+        same request has to be repeated to store the vectors.
+
         Args:
             request: Vectorization request with document_id and approach.
             use_case: Injected use case dependency.
 
         Returns:
-            VectorizationResponseDTO with vectorization results.
+            VectorizationResponseDTO with vectorization results (202 while an embedding batch is pending).
 
         Raises:
             HTTPException: If vectorization fails.
@@ -73,11 +78,14 @@ def get_router(use_case_config: UseCaseConfig) -> APIRouter:
 
         try:
             result = await use_case.vectorize_chunks(request)
+            if result.status == "pending":
+                logger.info(f"Vectorization pending - document_id: {result.document_id}, batch: {result.batch_id}")
+                return dto_response(result, status_code=202)
             logger.info(
                 f"Vectorization successful - document_id: {result.document_id}, "
                 f"vectors created: {result.total_vectors_created}"
             )
-            return result
+            return dto_response(result)
         except BusinessRuleException as e:
             logger.error(f"Domain error during vectorization: {e}")
             raise HTTPException(status_code=400, detail=str(e))
@@ -38,7 +38,7 @@ from learn_ai_agents.domain.services.agents.settings_resource_discovery import (
 )
 
 
-def get_basic_answer_use_case(request: Request) -> BasicAnswerUseCase:
+async def get_basic_answer_use_case(request: Request) -> BasicAnswerUseCase:
     """Get the Basic Answer use case instance.
 
     This dependency retrieves the BasicAnswerUseCase from the application container.
@@ -50,10 +50,10 @@ def get_basic_answer_use_case(request: Request) -> BasicAnswerUseCase:
         BasicAnswerUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("basic_answer")
+    return await container.use_cases.aget("basic_answer")
 
 
-def get_adding_memory_use_case(request: Request) -> AddingMemoryUseCase:
+async def get_adding_memory_use_case(request: Request) -> AddingMemoryUseCase:
     """Get the Adding Memory use case instance.
 
     This dependency retrieves the AddingMemoryUseCase from the application container.
@@ -65,10 +65,10 @@ def get_adding_memory_use_case(request: Request) -> AddingMemoryUseCase:
         AddingMemoryUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("adding_memory")
+    return await container.use_cases.aget("adding_memory")
 
 
-def get_adding_tools_use_case(request: Request) -> AddingToolsUseCase:
+async def get_adding_tools_use_case(request: Request) -> AddingToolsUseCase:
     """Get the Adding Tools use case instance.
 
     This dependency retrieves the AddingToolsUseCase from the application container.
@@ -80,10 +80,10 @@ def get_adding_tools_use_case(request: Request) -> AddingToolsUseCase:
         AddingToolsUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("adding_tools")
+    return await container.use_cases.aget("adding_tools")
 
 
-def get_character_chat_use_case(request: Request) -> CharacterChatUseCase:
+async def get_character_chat_use_case(request: Request) -> CharacterChatUseCase:
     """Get the Character Chat use case instance.
 
     This dependency retrieves the CharacterChatUseCase from the application container.
@@ -95,10 +95,10 @@ def get_character_chat_use_case(request: Request) -> CharacterChatUseCase:
         CharacterChatUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("character_chat")
+    return await container.use_cases.aget("character_chat")
 
 
-def get_agent_tracing_use_case(request: Request) -> AgentTracingUseCase:
+async def get_agent_tracing_use_case(request: Request) -> AgentTracingUseCase:
     """Get the Agent Tracing use case instance.
 
     This dependency retrieves the AgentTracingUseCase from the application container.
@@ -110,10 +110,10 @@ def get_agent_tracing_use_case(request: Request) -> AgentTracingUseCase:
         AgentTracingUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("agent_tracing")
+    return await container.use_cases.aget("agent_tracing")
 
 
-def get_robust_use_case(request: Request) -> RobustUseCase:
+async def get_robust_use_case(request: Request) -> RobustUseCase:
     """Get the Robust Agent use case instance.
 
     This dependency retrieves the RobustUseCase from the application container.
@@ -125,25 +125,25 @@ def get_robust_use_case(request: Request) -> RobustUseCase:
         RobustUseCase instance.
     """
     container = request.app.state.container
-    return container.use_cases.get("robust")
+    return await container.use_cases.aget("robust")
 
 
-def get_source_ingestion_use_case(request: Request) -> SourceIngestionUseCase:
+async def get_source_ingestion_use_case(request: Request) -> SourceIngestionUseCase:
     """Get the Source Ingestion use case instance."""
     container = request.app.state.container
-    return container.use_cases.get("source_ingestion")
+    return await container.use_cases.aget("source_ingestion")
 
 
-def get_document_splitting_use_case(request: Request) -> DocumentSplittingUseCase:
+async def get_document_splitting_use_case(request: Request) -> DocumentSplittingUseCase:
     """Get the Document Splitting use case instance."""
     container = request.app.state.container
-    return container.use_cases.get("document_splitting")
+    return await container.use_cases.aget("document_splitting")
 
 
-def get_vectorization_use_case(request: Request) -> VectorizationUseCase:
+async def get_vectorization_use_case(request: Request) -> VectorizationUseCase:
     """Get the Vectorization use case instance."""
     container = request.app.state.container
-    return container.use_cases.get("vectorization")
+    return await container.use_cases.aget("vectorization")
 
 
 def get_discovery_use_case(request: Request) -> DiscoveryUseCase:
@@ -4,7 +4,13 @@ This module provides endpoints to discover all available components,
 agents, and use cases in the system following hexagonal architecture.
 """
 
-from fastapi import APIRouter, Depends
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+
 from learn_ai_agents.application.dtos.discovery.discovery import (
     AgentsResponseDTO,
     AllResourcesResponseDTO,
@@ -18,11 +24,50 @@ from ..dependencies import get_discovery_use_case
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/discover", tags=["Discovery"])
+router = APIRouter(prefix="/discover", tags=["Discovery"], default_response_class=ORJSONResponse)
+
+
+class DiscoveryResponseCache:
+    """Encoded discovery responses, kept for the lifetime of the app container.
+
+    Discovery data is derived from the settings, which do not change while a
+    container is alive, so each response is built and encoded once. The
+    container acts as the cache generation: when a new container is built
+    (e.g. the lifespan runs again) the cached responses are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._generation: object | None = None
+        self._bodies: dict[str, bytes] = {}
+
+    def response(self, generation: object, key: str, build: Callable[[], Any]) -> Response:
+        """Return the cached JSON response for ``key``, building it on a miss.
+
+        Args:
+            generation: The object whose lifetime the cached data is valid for.
+            key: Name of the discovery response.
+            build: Callable producing the DTO to encode on a cache miss.
+
+        Returns:
+            JSON response with the encoded discovery DTO.
+        """
+        if generation is not self._generation:
+            self._generation = generation
+            self._bodies = {}
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = orjson.dumps(build())
+        return Response(content=body, media_type="application/json")
+
+
+_response_cache = DiscoveryResponseCache()
 
 
 @router.get("/components", response_model=ComponentsResponseDTO)
-async def discover_components(use_case: DiscoveryUseCase = Depends(get_discovery_use_case)) -> ComponentsResponseDTO:
+async def discover_components(
+    request: Request,
+    use_case: DiscoveryUseCase = Depends(get_discovery_use_case),
+) -> Response:
     """
     Discover all available components in the system.
 
@@ -53,13 +98,20 @@ async def discover_components(use_case: DiscoveryUseCase = Depends(get_discovery
         }
     """
     logger.info("GET /discover/components")
-    result = use_case.discover_components()
-    logger.debug(f"Returned {sum(len(comps) for comps in result.components.values())} components")
-    return result
+
+    def build() -> ComponentsResponseDTO:
+        result = use_case.discover_components()
+        logger.debug(f"Built {sum(len(comps) for comps in result.components.values())} components")
+        return result
+
+    return _response_cache.response(request.app.state.container, "components", build)
 
 
 @router.get("/agents", response_model=AgentsResponseDTO)
-async def discover_agents(use_case: DiscoveryUseCase = Depends(get_discovery_use_case)) -> AgentsResponseDTO:
+async def discover_agents(
+    request: Request,
+    use_case: DiscoveryUseCase = Depends(get_discovery_use_case),
+) -> Response:
     """
     Discover all available agents in the system.
 
@@ -88,13 +140,20 @@ async def discover_agents(use_case: DiscoveryUseCase = Depends(get_discovery_use
         }
     """
     logger.info("GET /discover/agents")
-    result = use_case.discover_agents()
-    logger.debug(f"Returned {len(result.agents)} agents")
-    return result
+
+    def build() -> AgentsResponseDTO:
+        result = use_case.discover_agents()
+        logger.debug(f"Built {len(result.agents)} agents")
+        return result
+
+    return _response_cache.response(request.app.state.container, "agents", build)
 
 
 @router.get("/use-cases", response_model=UseCasesResponseDTO)
-async def discover_use_cases(use_case: DiscoveryUseCase = Depends(get_discovery_use_case)) -> UseCasesResponseDTO:
+async def discover_use_cases(
+    request: Request,
+    use_case: DiscoveryUseCase = Depends(get_discovery_use_case),
+) -> Response:
     """
     Discover all available use cases in the system.
 
@@ -124,13 +183,20 @@ async def discover_use_cases(use_case: DiscoveryUseCase = Depends(get_discovery_
         }
     """
     logger.info("GET /discover/use-cases")
-    result = use_case.discover_use_cases()
-    logger.debug(f"Returned {len(result.use_cases)} use cases")
-    return result
+
+    def build() -> UseCasesResponseDTO:
+        result = use_case.discover_use_cases()
+        logger.debug(f"Built {len(result.use_cases)} use cases")
+        return result
+
+    return _response_cache.response(request.app.state.container, "use_cases", build)
 
 
 @router.get("/all", response_model=AllResourcesResponseDTO)
-async def discover_all(use_case: DiscoveryUseCase = Depends(get_discovery_use_case)) -> AllResourcesResponseDTO:
+async def discover_all(
+    request: Request,
+    use_case: DiscoveryUseCase = Depends(get_discovery_use_case),
+) -> Response:
     """
     Discover all available resources in the system.
 
@@ -147,10 +213,14 @@ async def discover_all(use_case: DiscoveryUseCase = Depends(get_discovery_use_ca
         }
     """
     logger.info("GET /discover/all")
-    result = use_case.discover_all()
-    total_components = sum(len(comps) for comps in result.components.values())
-    logger.debug(
-        f"Returned all resources: {total_components} components, "
-        f"{len(result.agents)} agents, {len(result.use_cases)} use cases"
-    )
-    return result
+
+    def build() -> AllResourcesResponseDTO:
+        result = use_case.discover_all()
+        total_components = sum(len(comps) for comps in result.components.values())
+        logger.debug(
+            f"Built all resources: {total_components} components, "
+            f"{len(result.agents)} agents, {len(result.use_cases)} use cases"
+        )
+        return result
+
+    return _response_cache.response(request.app.state.container, "all", build)
@@ -0,0 +1,66 @@
+"""Response helpers for FastAPI controllers.
+
+Use cases already return validated DTOs, so controllers can serialize them
+directly instead of letting FastAPI re-validate them against the route's
+response_model (which is kept on the route for the OpenAPI schema only).
+Streaming endpoints use the SSE framing helpers defined here.
+"""
+
+from dataclasses import is_dataclass
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from learn_ai_agents.application.dtos.agents.character_chat import (
+    CharacterChatStreamEventDTO,
+    get_stream_event_adapter,
+)
+
+# Pre-built SSE frames for the fixed-shape character chat events. Field order and
+# nulls match CharacterChatStreamEventDTO's JSON so clients see identical payloads.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_DELTA_FRAME_HEAD = b'data: {"kind":"delta","delta":'
+_DELTA_FRAME_TAIL = b',"tool_name":null,"tool_input":null,"tool_output":null}\n\n'
+_DONE_FRAME = b'data: {"kind":"done","delta":null,"tool_name":null,"tool_input":null,"tool_output":null}\n\n'
+
+
+def dto_response(dto: BaseModel | Any, status_code: int = 200) -> Response:
+    """Serialize a trusted DTO into a JSON response in a single encoder call.
+
+    Pydantic DTOs are encoded by pydantic-core and dataclass DTOs by orjson.
+    Returning a Response instance makes FastAPI skip response_model validation
+    and jsonable_encoder for the route.
+
+    Args:
+        dto: The already-validated Pydantic DTO or dataclass DTO to return.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        JSON response with the serialized DTO as body.
+    """
+    content = orjson.dumps(dto) if is_dataclass(dto) else dto.model_dump_json()
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def character_chat_sse_frame(event: CharacterChatStreamEventDTO) -> bytes:
+    """Frame a character chat stream event as a Server-Sent Events message.
+
+    Text deltas (the bulk of a stream) and the final "done" event only need
+    the delta string encoded; the rest of the frame is a constant. Tool events
+    carry arbitrary payloads and go through the DTO serializer.
+
+    Args:
+        event: The stream event to send.
+
+    Returns:
+        The complete SSE frame (``data: {...}`` plus the blank-line terminator) as bytes.
+    """
+    if event.tool_name is None and event.tool_input is None and event.tool_output is None:
+        if event.kind == "delta" and event.delta is not None:
+            return _DELTA_FRAME_HEAD + orjson.dumps(event.delta) + _DELTA_FRAME_TAIL
+        if event.kind == "done" and event.delta is None:
+            return _DONE_FRAME
+    return _SSE_PREFIX + get_stream_event_adapter().dump_json(event) + _SSE_SUFFIX
@@ -4,6 +4,7 @@ This module defines exception handlers that map domain exceptions to appropriate
 """
 
 import logging
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any
 
@@ -59,7 +60,7 @@ class ErrorType(str, Enum):
     INTERNAL_SERVER_ERROR = "InternalServerError"
 
 
-def _sanitize_details(details: dict[str, Any]) -> dict[str, Any]:
+def _sanitize_details(details: Mapping[str, Any]) -> dict[str, Any]:
     """
     Sanitize exception details for API responses.
     Removes sensitive information and ensures all values are JSON serializable.
@@ -84,7 +85,7 @@ def _create_error_response(
     status_code: int,
     error_type: ErrorType,
     message: str,
-    details: dict[str, Any] | None = None,
+    details: Mapping[str, Any] | None = None,
 ) -> JSONResponse:
     """
     Create a standardized error response.
@@ -4,7 +4,7 @@ This module provides the abstract base class for all LangChain agent implementat
 """
 
 from abc import abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
 from typing import Optional, Dict, Any
 
 from langchain_core.runnables import Runnable
@@ -102,14 +102,15 @@ class BaseLangChainAgent(AgentEngine):
         ...
 
     @abstractmethod
-    async def astream(self, new_message: Message, config: Config, **kwargs: Any) -> AsyncGenerator[ChunkDelta, None]:
+    def astream(self, new_message: Message, config: Config, **kwargs: Any) -> AsyncIterator[ChunkDelta]:
         """Process a message with async streaming response.
 
         Args:
             new_message: The user's message to process.
             config: Configuration for the stream.
 
-        Yields:
-            Response chunks as ChunkDelta objects.
+        Returns:
+            Async iterator of response chunks as ChunkDelta objects
+            (implement as an ``async def`` generator).
         """
-        yield ChunkDelta()  # Makes this an async generator for type checking
+        ...
@@ -4,6 +4,7 @@ This module provides a generic repository pattern implementation for MongoDB
 using Odmantic. It serves as a base class for all concrete repositories.
 """
 
+from collections.abc import Sequence
 from typing import Any, Generic, TypeVar
 
 from learn_ai_agents.domain.exceptions import ComponentOperationException
@@ -173,6 +174,53 @@ class BaseMongoModelRepository(Generic[TModel]):
                 details={"model_class": self._model_cls.__name__, "filters": filters, "error": str(e)}
             ) from e
 
+    async def find_fields_by(self, fields: Sequence[str], **filters: Any) -> list[dict[str, Any]]:
+        """Find documents matching the given filters, returning only some of their fields.
+
+        Unlike ``find_by``, the raw documents are returned without building model
+        instances, so no ODM validation runs and unrequested fields (including
+        ``_id``) never leave the database. Use it for bulk reads that map straight
+        to domain objects.
+
+        Args:
+            fields: Model field names to return.
+            **filters: Field-value pairs to filter by.
+
+        Returns:
+            One dictionary per matching document, keyed by field name. Fields
+            missing from a stored document are missing from its dictionary.
+
+        Raises:
+            ComponentOperationException: If database query operation fails.
+        """
+        try:
+            logger.debug(f"Finding {fields} of {self._model_cls.__name__} with filters: {filters}")
+
+            # Model field names may differ from the stored keys
+            key_names = {name: +getattr(self._model_cls, name) for name in fields}
+            query = {
+                +getattr(self._model_cls, field_name): value
+                for field_name, value in filters.items()
+                if hasattr(self._model_cls, field_name)
+            }
+            projection = {"_id": 0, **dict.fromkeys(key_names.values(), 1)}
+
+            collection = self._engine.get_collection(self._model_cls)
+            raw_documents = await collection.find(query, projection).to_list(length=None)
+
+            results = [
+                {name: raw[key] for name, key in key_names.items() if key in raw} for raw in raw_documents
+            ]
+            logger.debug(f"Found {len(results)} {self._model_cls.__name__} documents")
+            return results
+        except Exception as e:
+            logger.error(f"Failed to find {self._model_cls.__name__} with filters {filters}: {e}")
+            raise ComponentOperationException(
+                component_type="repository",
+                message=f"Failed to query {self._model_cls.__name__} from database: {e}",
+                details={"model_class": self._model_cls.__name__, "filters": filters, "error": str(e)}
+            ) from e
+
     async def delete_by_id(self, id_: str) -> bool:
         """Delete a model instance by its ID.
 
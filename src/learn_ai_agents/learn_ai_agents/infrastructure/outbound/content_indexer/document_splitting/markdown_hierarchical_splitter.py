@@ -6,6 +6,9 @@ This module implements document splitting using a hierarchical approach:
 """
 
 import re
+from collections.abc import Iterator
+from typing import Any
+
 from learn_ai_agents.application.outbound_ports.content_indexer.splitters.chunk_splitter import (
     ChunkSplitterPort,
 )
@@ -67,6 +70,23 @@ class MarkdownHierarchicalSplitter(ChunkSplitterPort):
         Returns:
             List of DocumentChunk objects with sequential split_index values.
 
+        Raises:
+            DomainException: If splitting fails or document content is invalid.
+        """
+        chunks = list(self.split_document_iter(document, splitter_approach))
+        logger.info(f"Split markdown document {document.document_id} into {len(chunks)} chunks")
+        return chunks
+
+    def split_document_iter(self, document: Document, splitter_approach: str) -> Iterator[DocumentChunk]:
+        """Lazily split a markdown document by H1 sections, then by H2 subsections.
+
+        Args:
+            document: The Document to be split.
+            splitter_approach: The name/key of the splitter approach being used.
+
+        Yields:
+            DocumentChunk objects with sequential split_index values.
+
         Raises:
             DomainException: If splitting fails or document content is invalid.
         """
@@ -77,16 +97,24 @@ class MarkdownHierarchicalSplitter(ChunkSplitterPort):
 
         if not document.content.strip():
             logger.warning(f"Document {document.document_id} has empty content")
-            return []
+            return
+
+        # Metadata shared by every chunk of the document, extracted once
+        doc_meta = document.metadata or {}
+        shared_metadata = {
+            "url": doc_meta.get("url"),
+            "source": doc_meta.get("source"),
+            "title": doc_meta.get("title"),
+            "character_name": doc_meta.get("character_name"),
+        }
+        chunk_id_prefix = f"{document.document_id}:{splitter_approach}:"
 
         # Split by H1 sections first
         h1_sections = self._split_by_h1(document.content)
         logger.debug(f"Split document into {len(h1_sections)} H1 sections")
 
         # For each H1 section, split by H2 subsections and create chunks
-        chunks = []
         chunk_index = 0
-
         for h1_section in h1_sections:
             h1_title = h1_section["h1_header"]
             h1_content = h1_section["content"]
@@ -97,66 +125,71 @@ class MarkdownHierarchicalSplitter(ChunkSplitterPort):
             if not h2_subsections:
                 # No H2 subsections, create a single chunk with just H1 + content
                 chunk_text = f"{h1_title}\n\n{h1_content}" if h1_content else h1_title
-                chunk_id = f"{document.document_id}:{splitter_approach}:{chunk_index}"
-
-                # Extract simplified metadata from document
-                doc_meta = document.metadata or {}
-                chunk = DocumentChunk(
-                    chunk_id=chunk_id,
-                    document_id=document.document_id,
-                    split_index=chunk_index,
-                    content=chunk_text,
-                    metadata={
-                        "chunk_size": len(chunk_text),
-                        "splitter": "markdown_h1_h2",
-                        "h1_title": h1_title,
-                        "h2_header": None,
-                        "url": doc_meta.get("url"),
-                        "source": doc_meta.get("source"),
-                        "title": doc_meta.get("title"),
-                        "character_name": doc_meta.get("character_name"),
-                    },
-                    character_name=document.character_name,
+                yield self._build_chunk(
+                    document, chunk_id_prefix, chunk_index, chunk_text, h1_title, None, shared_metadata
+                )
+                chunk_index += 1
+                continue
+
+            # Create a chunk for each H2 subsection
+            for h2_section in h2_subsections:
+                chunk_parts = [h1_title]
+
+                if h2_section["h2_header"]:
+                    chunk_parts.append(h2_section["h2_header"])
+                if h2_section["content"]:
+                    chunk_parts.append(h2_section["content"])
+
+                chunk_text = "\n\n".join(chunk_parts)
+                yield self._build_chunk(
+                    document,
+                    chunk_id_prefix,
+                    chunk_index,
+                    chunk_text,
+                    h1_title,
+                    h2_section["h2_header"],
+                    shared_metadata,
                 )
-                chunks.append(chunk)
                 chunk_index += 1
-            else:
-                # Create a chunk for each H2 subsection
-                for h2_section in h2_subsections:
-                    chunk_parts = [h1_title]
-
-                    if h2_section["h2_header"]:
-                        chunk_parts.append(h2_section["h2_header"])
-                    if h2_section["content"]:
-                        chunk_parts.append(h2_section["content"])
-
-                    chunk_text = "\n\n".join(chunk_parts)
-                    chunk_id = f"{document.document_id}:{splitter_approach}:{chunk_index}"
-
-                    # Extract simplified metadata from document
-                    doc_meta = document.metadata or {}
-                    chunk = DocumentChunk(
-                        chunk_id=chunk_id,
-                        document_id=document.document_id,
-                        split_index=chunk_index,
-                        content=chunk_text,
-                        metadata={
-                            "chunk_size": len(chunk_text),
-                            "splitter": "markdown_h1_h2",
-                            "h1_title": h1_title,
-                            "h2_header": h2_section["h2_header"],
-                            "url": doc_meta.get("url"),
-                            "source": doc_meta.get("source"),
-                            "title": doc_meta.get("title"),
-                            "character_name": doc_meta.get("character_name"),
-                        },
-                        character_name=document.character_name,
-                    )
-                    chunks.append(chunk)
-                    chunk_index += 1
 
-        logger.info(f"Split markdown document {document.document_id} into {len(chunks)} chunks")
-        return chunks
+    @staticmethod
+    def _build_chunk(
+        document: Document,
+        chunk_id_prefix: str,
+        chunk_index: int,
+        chunk_text: str,
+        h1_title: str,
+        h2_header: str | None,
+        shared_metadata: dict[str, Any],
+    ) -> DocumentChunk:
+        """Create the DocumentChunk for one H1/H2 section.
+
+        Args:
+            document: The Document being split.
+            chunk_id_prefix: ``"{document_id}:{splitter_approach}:"``.
+            chunk_index: Sequential index of the chunk within the document.
+            chunk_text: The chunk content.
+            h1_title: The H1 header the chunk belongs to.
+            h2_header: The H2 header the chunk belongs to, if any.
+            shared_metadata: Document-level metadata copied into every chunk.
+
+        Returns:
+            The DocumentChunk.
+        """
+        return DocumentChunk(
+            chunk_id=f"{chunk_id_prefix}{chunk_index}",
+            document_id=document.document_id,
+            split_index=chunk_index,
+            content=chunk_text,
+            metadata={
+                "chunk_size": len(chunk_text),
+                "splitter": "markdown_h1_h2",
+                "h1_title": h1_title,
+                "h2_header": h2_header,
+                **shared_metadata,
+            },
+            character_name=document.character_name,
+        )
 
     def _split_by_h1(self, text: str) -> list[dict[str, str]]:
         """Split text by H1 headers.
@@ -0,0 +1,232 @@
+"""OpenAI batch embedder adapter implementation.
+
+This module provides an adapter for OpenAI's Batch API, implementing the
+BatchEmbedderPort interface for embedding large documents offline: requests
+are uploaded as a JSONL file, processed asynchronously by OpenAI and their
+results downloaded once the batch has completed.
+"""
+
+import numpy as np
+import orjson
+from openai import AsyncOpenAI
+
+from learn_ai_agents.application.outbound_ports.content_indexer.embedders.batch_embedder import (
+    BatchEmbedderPort,
+)
+from learn_ai_agents.domain.exceptions import (
+    ComponentBuildingException,
+    ComponentOperationException,
+    EmbeddingBatchFailedException,
+)
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
+from learn_ai_agents.logging import get_logger
+
+logger = get_logger(__name__)
+
+_EMBEDDINGS_ENDPOINT = "/v1/embeddings"
+# Batch statuses after which no results will ever be produced
+_FAILED_STATUSES = frozenset({"failed", "expired", "cancelling", "cancelled"})
+
+
+class OpenAIBatchEmbedder(BatchEmbedderPort):
+    """Adapter for OpenAI embedding models through the Batch API.
+
+    Texts are grouped into embedding requests of up to ``texts_per_request``
+    inputs each, so one batch line embeds many chunks. The custom_id of each
+    request is the offset of its first text, which is how results (returned in
+    any order) are put back in submission order.
+
+    Attributes:
+        client: The async OpenAI client.
+        model_name: The OpenAI embedding model.
+        dimensions: Dimensionality requested from the model.
+        completion_window: Time OpenAI has to complete a batch.
+        texts_per_request: Maximum number of texts per embedding request.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "text-embedding-3-small",
+        dimensions: int = 1536,
+        completion_window: str = "24h",
+        texts_per_request: int = 256,
+    ):
+        """Initialize the OpenAI batch embedder.
+
+        Args:
+            api_key: OpenAI API key.
+            model_name: OpenAI embedding model; it must accept the ``dimensions``
+                parameter (text-embedding-3 models).
+            dimensions: Dimensionality requested from the model.
+            completion_window: Time OpenAI has to complete a batch (currently only "24h").
+            texts_per_request: Maximum number of texts per embedding request (at most 2048).
+
+        Raises:
+            ComponentBuildingException: If the request size is out of range.
+        """
+        if not 1 <= texts_per_request <= 2048:
+            raise ComponentBuildingException(
+                component_type="embedder",
+                message="texts_per_request must be between 1 and 2048",
+                details={"adapter": "OpenAIBatchEmbedder", "texts_per_request": texts_per_request},
+            )
+
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self.completion_window = completion_window
+        self.texts_per_request = texts_per_request
+        logger.info(f"Initialized OpenAIBatchEmbedder with model {model_name} ({dimensions} dimensions)")
+
+    async def aclose(self) -> None:
+        """Close the OpenAI client's HTTP connections."""
+        await self.client.close()
+
+    def _build_requests_file(self, texts: list[str]) -> bytes:
+        """Serialize the texts as Batch API embedding requests, one JSON line each."""
+        lines = []
+        for start in range(0, len(texts), self.texts_per_request):
+            lines.append(
+                orjson.dumps(
+                    {
+                        "custom_id": str(start),
+                        "method": "POST",
+                        "url": _EMBEDDINGS_ENDPOINT,
+                        "body": {
+                            "model": self.model_name,
+                            "input": texts[start : start + self.texts_per_request],
+                            "dimensions": self.dimensions,
+                        },
+                    }
+                )
+            )
+        return b"\n".join(lines)
+
+    async def embed_batch_async(self, texts: list[str]) -> str:
+        """Upload the texts and submit a batch job that embeds them.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            The OpenAI batch ID.
+
+        Raises:
+            ComponentOperationException: If no texts are given or the submission fails.
+        """
+        if not texts:
+            raise ComponentOperationException(
+                component_type="embedder",
+                message="No texts provided for embedding.",
+                details={"adapter": "OpenAIBatchEmbedder"},
+            )
+
+        try:
+            input_file = await self.client.files.create(
+                file=("embedding_requests.jsonl", self._build_requests_file(texts)),
+                purpose="batch",
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_EMBEDDINGS_ENDPOINT,
+                completion_window=self.completion_window,  # type: ignore[arg-type]
+            )
+        except Exception as e:
+            error_msg = f"Failed to submit embedding batch: {e}"
+            logger.error(error_msg)
+            raise ComponentOperationException(
+                component_type="embedder",
+                message=error_msg,
+                details={"adapter": "OpenAIBatchEmbedder", "model_name": self.model_name, "error": str(e)},
+            ) from e
+
+        logger.info(f"Submitted embedding batch {batch.id} with {len(texts)} texts")
+        return batch.id
+
+    async def poll_batch(self, batch_id: str) -> EmbeddingArray | None:
+        """Check a batch job and download its embeddings once it has completed.
+
+        Args:
+            batch_id: The OpenAI batch ID returned by ``embed_batch_async``.
+
+        Returns:
+            float32 matrix with one row per submitted text, in submission order,
+            or None if the batch is still running.
+
+        Raises:
+            EmbeddingBatchFailedException: If the batch failed, expired, was cancelled
+                or returned failed requests.
+            ComponentOperationException: If the batch or its results cannot be retrieved.
+        """
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+        except Exception as e:
+            raise ComponentOperationException(
+                component_type="embedder",
+                message=f"Failed to retrieve embedding batch {batch_id}: {e}",
+                details={"adapter": "OpenAIBatchEmbedder", "batch_id": batch_id, "error": str(e)},
+            ) from e
+
+        if batch.status in _FAILED_STATUSES:
+            raise EmbeddingBatchFailedException(
+                component_type="embedder",
+                message=f"Embedding batch {batch_id} ended with status '{batch.status}'",
+                details={"adapter": "OpenAIBatchEmbedder", "batch_id": batch_id, "errors": str(batch.errors)},
+            )
+        if batch.status != "completed":
+            logger.debug(f"Embedding batch {batch_id} is {batch.status}")
+            return None
+
+        failed = batch.request_counts.failed if batch.request_counts else 0
+        if failed or batch.output_file_id is None:
+            raise EmbeddingBatchFailedException(
+                component_type="embedder",
+                message=f"Embedding batch {batch_id} completed with {failed} failed request(s)",
+                details={"adapter": "OpenAIBatchEmbedder", "batch_id": batch_id, "error_file_id": batch.error_file_id},
+            )
+
+        try:
+            output = await self.client.files.content(batch.output_file_id)
+        except Exception as e:
+            raise ComponentOperationException(
+                component_type="embedder",
+                message=f"Failed to download results of embedding batch {batch_id}: {e}",
+                details={"adapter": "OpenAIBatchEmbedder", "batch_id": batch_id, "error": str(e)},
+            ) from e
+
+        embeddings = self._parse_results(output.content)
+        logger.info(f"Embedding batch {batch_id} completed with {len(embeddings)} embeddings")
+        return embeddings
+
+    @staticmethod
+    def _parse_results(content: bytes) -> EmbeddingArray:
+        """Rebuild the embeddings in submission order from a batch output file."""
+        by_offset: dict[int, list[list[float]]] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            result = orjson.loads(line)
+            data = sorted(result["response"]["body"]["data"], key=lambda item: item["index"])
+            by_offset[int(result["custom_id"])] = [item["embedding"] for item in data]
+
+        embeddings: list[list[float]] = []
+        for offset in sorted(by_offset):
+            embeddings.extend(by_offset[offset])
+        return np.array(embeddings, dtype=np.float32)
+
+    def get_dimensions(self) -> int:
+        """Get the dimensionality of embeddings produced by this embedder.
+
+        Returns:
+            The number of dimensions in each embedding vector.
+        """
+        return self.dimensions
+
+    def get_model_name(self) -> str:
+        """Get the name/identifier of the embedding model.
+
+        Returns:
+            The model name (e.g., "text-embedding-3-small").
+        """
+        return self.model_name
@@ -0,0 +1,114 @@
+"""OpenAI embedder adapter implementation.
+
+This module provides an adapter for OpenAI's embeddings endpoint,
+implementing the EmbedderPort interface for generating embeddings
+synchronously (one API call per group of texts).
+"""
+
+import numpy as np
+from openai import AsyncOpenAI
+
+from learn_ai_agents.application.outbound_ports.content_indexer.embedders.embedder import (
+    EmbedderPort,
+)
+from learn_ai_agents.domain.exceptions import ComponentOperationException
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
+from learn_ai_agents.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Most inputs the embeddings endpoint accepts in one request
+_MAX_TEXTS_PER_REQUEST = 2048
+
+
+class OpenAIEmbedder(EmbedderPort):
+    """Adapter for OpenAI embedding models through the embeddings endpoint.
+
+    Produces the same embeddings as OpenAIBatchEmbedder for the same model and
+    dimensions, so small documents can be embedded right away while large ones
+    go through the cheaper Batch API under the same vectorization approach.
+
+    Attributes:
+        client: The async OpenAI client.
+        model_name: The OpenAI embedding model.
+        dimensions: Dimensionality requested from the model.
+    """
+
+    def __init__(self, api_key: str, model_name: str = "text-embedding-3-small", dimensions: int = 1536):
+        """Initialize the OpenAI embedder.
+
+        Args:
+            api_key: OpenAI API key.
+            model_name: OpenAI embedding model; it must accept the ``dimensions``
+                parameter (text-embedding-3 models).
+            dimensions: Dimensionality requested from the model.
+        """
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.model_name = model_name
+        self.dimensions = dimensions
+        logger.info(f"Initialized OpenAIEmbedder with model {model_name} ({dimensions} dimensions)")
+
+    async def aclose(self) -> None:
+        """Close the OpenAI client's HTTP connections."""
+        await self.client.close()
+
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        """Generate embeddings for a list of texts.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            float32 matrix of shape [len(texts), dimensions], one row per input text.
+
+        Raises:
+            ComponentOperationException: If no texts are given or the API call fails.
+        """
+        if not texts:
+            logger.warning("Received empty texts list for embedding")
+            raise ComponentOperationException(
+                component_type="embedder",
+                message="No texts provided for embedding.",
+                details={"adapter": "OpenAIEmbedder"},
+            )
+
+        result = np.empty((len(texts), self.dimensions), dtype=np.float32)
+        try:
+            logger.debug(f"Generating embeddings for {len(texts)} texts")
+            for start in range(0, len(texts), _MAX_TEXTS_PER_REQUEST):
+                batch = texts[start : start + _MAX_TEXTS_PER_REQUEST]
+                response = await self.client.embeddings.create(
+                    model=self.model_name, input=batch, dimensions=self.dimensions
+                )
+                if len(response.data) != len(batch):
+                    raise ValueError(f"expected {len(batch)} embeddings, got {len(response.data)}")
+                # Results carry the index of their input, which is how they are put back in order
+                for item in response.data:
+                    result[start + item.index] = item.embedding
+        except Exception as e:
+            error_msg = f"Failed to generate embeddings: {e}"
+            logger.error(error_msg)
+            raise ComponentOperationException(
+                component_type="embedder",
+                message=error_msg,
+                details={"adapter": "OpenAIEmbedder", "model_name": self.model_name, "error": str(e)},
+            ) from e
+
+        logger.debug(f"Successfully generated {len(result)} embeddings")
+        return result
+
+    def get_dimensions(self) -> int:
+        """Get the dimensionality of embeddings produced by this embedder.
+
+        Returns:
+            The number of dimensions in each embedding vector.
+        """
+        return self.dimensions
+
+    def get_model_name(self) -> str:
+        """Get the name/identifier of the embedding model.
+
+        Returns:
+            The model name (e.g., "text-embedding-3-small").
+        """
+        return self.model_name
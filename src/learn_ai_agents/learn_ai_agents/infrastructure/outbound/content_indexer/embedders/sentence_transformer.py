@@ -4,6 +4,7 @@ This module provides an adapter for the Sentence Transformers library,
 implementing the EmbedderPort interface for generating embeddings.
 """
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from learn_ai_agents.application.outbound_ports.content_indexer.embedders.embedder import (
@@ -13,6 +14,7 @@ from learn_ai_agents.domain.exceptions import (
     ComponentBuildingException,
     ComponentOperationException,
 )
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
 from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
@@ -59,15 +61,14 @@ class SentenceTransformerEmbedder(EmbedderPort):
                 details={"adapter": "SentenceTransformerEmbedder", "model_name": model_name, "device": device, "error": str(e)}
             ) from e
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
         """Generate embeddings for a list of texts.
 
         Args:
             texts: List of text strings to embed.
 
         Returns:
-            List of embedding vectors, one per input text.
-            Each embedding is a list of floats.
+            float32 matrix of shape [len(texts), dimensions], one row per input text.
 
         Raises:
             DomainException: If embedding generation fails.
@@ -90,8 +91,8 @@ class SentenceTransformerEmbedder(EmbedderPort):
                 show_progress_bar=False,
             )
 
-            # Convert numpy arrays to lists
-            result = embeddings.tolist()
+            # Keep the float32 matrix as is (no-op unless the model returns another dtype)
+            result = np.asarray(embeddings, dtype=np.float32)
 
             logger.debug(f"Successfully generated {len(result)} embeddings")
             return result
@@ -6,6 +6,7 @@ accessed by any adapter that needs document or chunk persistence.
 
 from .documents import MongoDocumentRepository, DocumentModel
 from .chunks import MongoChunkRepository, ChunkModel
+from .embedding_batches import MongoEmbeddingBatchRepository, EmbeddingBatchModel
 from .vector_stores import QdrantVectorStoreRepository
 
 __all__ = [
@@ -13,5 +14,7 @@ __all__ = [
     "MongoChunkRepository",
     "DocumentModel",
     "ChunkModel",
+    "MongoEmbeddingBatchRepository",
+    "EmbeddingBatchModel",
     "QdrantVectorStoreRepository",
 ]
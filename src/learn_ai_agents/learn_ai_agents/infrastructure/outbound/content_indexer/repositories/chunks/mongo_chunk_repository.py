@@ -4,6 +4,7 @@ This module implements chunk persistence using the repository pattern
 with Odmantic for type-safe MongoDB operations.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 
 from learn_ai_agents.application.outbound_ports.content_indexer.repositories.chunk_repository import (
@@ -19,6 +20,9 @@ from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Model fields that make up the domain object; timestamps and _id are not read back
+_DOMAIN_FIELDS = ("chunk_id", "document_id", "split_index", "content", "metadata", "character_name")
+
 
 class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepositoryPort):
     """MongoDB implementation of the ChunkRepositoryPort using Odmantic.
@@ -71,11 +75,26 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
             character_name=saved_model.character_name,
         )
 
-    async def save_chunks(self, chunks: list[DocumentChunk]) -> list[DocumentChunk]:
+    async def save_chunks(self, chunks: Sequence[DocumentChunk]) -> int:
         """Save multiple document chunks to the repository.
 
         Args:
-            chunks: List of domain DocumentChunks to save.
+            chunks: Domain DocumentChunks to save.
+
+        Returns:
+            Number of chunks saved.
+        """
+        if not chunks:
+            return 0
+
+        saved_models = await self._save_chunk_models(chunks)
+        return len(saved_models)
+
+    async def save_chunks_returning(self, chunks: Sequence[DocumentChunk]) -> list[DocumentChunk]:
+        """Save multiple document chunks and return them as stored.
+
+        Args:
+            chunks: Domain DocumentChunks to save.
 
         Returns:
             List of saved chunks with updated IDs.
@@ -83,6 +102,11 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
         if not chunks:
             return []
 
+        saved_models = await self._save_chunk_models(chunks)
+        return [self._to_domain(model) for model in saved_models]
+
+    async def _save_chunk_models(self, chunks: Sequence[DocumentChunk]) -> list[ChunkModel]:
+        """Map domain chunks to ODM models and save them in one batch."""
         logger.debug(f"Saving {len(chunks)} chunks")
 
         # Map domain DocumentChunks to ODM ChunkModels
@@ -99,20 +123,19 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
         ]
 
         # Save using base repository
-        saved_models = await self.save_many(chunk_models)
+        return await self.save_many(chunk_models)
 
-        # Map back to domain DocumentChunks
-        return [
-            DocumentChunk(
-                chunk_id=model.chunk_id,
-                document_id=model.document_id,
-                split_index=model.split_index,
-                content=model.content,
-                metadata=model.metadata,
-                character_name=model.character_name,
-            )
-            for model in saved_models
-        ]
+    @staticmethod
+    def _to_domain(model: ChunkModel) -> DocumentChunk:
+        """Map an ODM ChunkModel back to a domain DocumentChunk."""
+        return DocumentChunk(
+            chunk_id=model.chunk_id,
+            document_id=model.document_id,
+            split_index=model.split_index,
+            content=model.content,
+            metadata=model.metadata,
+            character_name=model.character_name,
+        )
 
     async def get_chunk_by_id(self, chunk_id: str) -> DocumentChunk | None:
         """Retrieve a chunk by its ID.
@@ -150,19 +173,19 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
         """
         logger.debug(f"Finding chunks for document_id={document_id}")
 
-        chunk_models = await self.find_by(document_id=document_id)
+        # Read only the domain fields and map the raw documents directly, skipping ChunkModel validation
+        raw_chunks = await self.find_fields_by(_DOMAIN_FIELDS, document_id=document_id)
 
-        # Map ODM ChunkModels to domain DocumentChunks
         return [
             DocumentChunk(
-                chunk_id=chunk.chunk_id,
-                document_id=chunk.document_id,
-                split_index=chunk.split_index,
-                content=chunk.content,
-                metadata=chunk.metadata,
-                character_name=chunk.character_name,
+                chunk_id=chunk["chunk_id"],
+                document_id=chunk["document_id"],
+                split_index=chunk["split_index"],
+                content=chunk["content"],
+                metadata=chunk.get("metadata"),
+                character_name=chunk["character_name"],
             )
-            for chunk in chunk_models
+            for chunk in raw_chunks
         ]
 
     async def delete_chunks_by_document_id(self, document_id: str) -> int:
@@ -189,13 +212,34 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
         logger.info(f"Deleted {delete_count} chunks for document_id={document_id}")
         return delete_count
 
-    async def upsert_chunks(self, chunks: list[DocumentChunk]) -> list[DocumentChunk]:
+    async def upsert_chunks(self, chunks: Sequence[DocumentChunk]) -> int:
         """Upsert multiple document chunks to the repository.
 
         Updates existing chunks (matched by chunk_id) or inserts new ones.
 
         Args:
-            chunks: List of domain DocumentChunks to upsert.
+            chunks: Domain DocumentChunks to upsert.
+
+        Returns:
+            Number of chunks upserted.
+        """
+        if not chunks:
+            return 0
+
+        upserted_count = 0
+        async for _ in self._upsert_chunk_models(chunks):
+            upserted_count += 1
+
+        logger.info(f"Successfully upserted {upserted_count} chunks")
+        return upserted_count
+
+    async def upsert_chunks_returning(self, chunks: Sequence[DocumentChunk]) -> list[DocumentChunk]:
+        """Upsert multiple document chunks and return them as stored.
+
+        Updates existing chunks (matched by chunk_id) or inserts new ones.
+
+        Args:
+            chunks: Domain DocumentChunks to upsert.
 
         Returns:
             List of upserted chunks.
@@ -203,9 +247,15 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
         if not chunks:
             return []
 
+        upserted_chunks = [self._to_domain(model) async for model in self._upsert_chunk_models(chunks)]
+
+        logger.info(f"Successfully upserted {len(upserted_chunks)} chunks")
+        return upserted_chunks
+
+    async def _upsert_chunk_models(self, chunks: Sequence[DocumentChunk]) -> AsyncIterator[ChunkModel]:
+        """Update or insert each chunk, yielding the saved ODM model one at a time."""
         logger.debug(f"Upserting {len(chunks)} chunks")
 
-        upserted_chunks = []
         for chunk in chunks:
             # Find existing chunk by chunk_id
             existing_chunks = await self.find_by(chunk_id=chunk.chunk_id)
@@ -235,20 +285,7 @@ class MongoChunkRepository(BaseMongoModelRepository[ChunkModel], ChunkRepository
                 saved_model = await self.save_one(chunk_model)
                 logger.debug(f"Inserted new chunk with chunk_id={chunk.chunk_id}")
 
-            # Map back to domain
-            upserted_chunks.append(
-                DocumentChunk(
-                    chunk_id=saved_model.chunk_id,
-                    document_id=saved_model.document_id,
-                    split_index=saved_model.split_index,
-                    content=saved_model.content,
-                    metadata=saved_model.metadata,
-                    character_name=saved_model.character_name,
-                )
-            )
-
-        logger.info(f"Successfully upserted {len(upserted_chunks)} chunks")
-        return upserted_chunks
+            yield saved_model
 
     async def search_similar_chunks(
         self, query_vector: list[float], limit: int = 10, min_similarity: float = 0.0
@@ -4,6 +4,8 @@ This module implements document persistence using the repository pattern
 with Odmantic for type-safe MongoDB operations.
 """
 
+from datetime import datetime
+
 from learn_ai_agents.application.outbound_ports.content_indexer.repositories.document_repository import (
     DocumentRepositoryPort,
 )
@@ -17,6 +19,9 @@ from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Model fields that make up the domain object; timestamps and _id are not read back
+_DOMAIN_FIELDS = ("document_id", "content", "metadata", "character_name")
+
 
 class MongoDocumentRepository(BaseMongoModelRepository[DocumentModel], DocumentRepositoryPort):
     """MongoDB implementation of the DocumentRepositoryPort using Odmantic.
@@ -99,17 +104,17 @@ class MongoDocumentRepository(BaseMongoModelRepository[DocumentModel], DocumentR
         """
         logger.debug(f"Finding documents with document_id={document_id}")
 
-        doc_models = await self.find_by(document_id=document_id)
+        # Read only the domain fields and map the raw documents directly, skipping DocumentModel validation
+        raw_documents = await self.find_fields_by(_DOMAIN_FIELDS, document_id=document_id)
 
-        # Map ODM DocumentModels to domain Documents
         return [
             Document(
-                document_id=doc.document_id,
-                content=doc.content,
-                metadata=doc.metadata,
-                character_name=doc.character_name,
+                document_id=doc["document_id"],
+                content=doc["content"],
+                metadata=doc.get("metadata"),
+                character_name=doc["character_name"],
             )
-            for doc in doc_models
+            for doc in raw_documents
         ]
 
     async def delete_document(self, document_id: str) -> bool:
@@ -147,8 +152,6 @@ class MongoDocumentRepository(BaseMongoModelRepository[DocumentModel], DocumentR
             existing_model = existing_docs[0]
             existing_model.content = document.content
             existing_model.metadata = document.metadata
-            from datetime import datetime
-
             existing_model.updated_at = datetime.now()
 
             saved_model = await self.save_one(existing_model)
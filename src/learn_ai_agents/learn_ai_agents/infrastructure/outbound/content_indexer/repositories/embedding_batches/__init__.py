@@ -0,0 +1,9 @@
+"""Embedding batch repository implementations."""
+
+from .models import EmbeddingBatchModel
+from .mongo_embedding_batch_repository import MongoEmbeddingBatchRepository
+
+__all__ = [
+    "MongoEmbeddingBatchRepository",
+    "EmbeddingBatchModel",
+]
@@ -0,0 +1,30 @@
+"""Odmantic models for embedding batch tracking.
+
+This module defines the ODM models for embedding batch storage.
+"""
+
+from datetime import datetime, timezone
+
+from odmantic import Field, Model, config
+
+
+class EmbeddingBatchModel(Model):
+    """Odmantic model for tracking embedding jobs submitted to a batch API.
+
+    This model represents the storage structure for embedding batches in MongoDB.
+    It maps to the domain EmbeddingBatch model.
+
+    Attributes:
+        batch_id: Identifier of the batch job returned by the provider.
+        document_id: The document whose chunks are being embedded.
+        vectorization_approach: The embedder approach the batch was submitted with.
+        chunk_count: Number of chunks (texts) in the batch.
+    """
+
+    batch_id: str = Field(unique=True)
+    document_id: str
+    vectorization_approach: str
+    chunk_count: int
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    model_config = config.ODMConfigDict({"collection": "embedding_batches"})
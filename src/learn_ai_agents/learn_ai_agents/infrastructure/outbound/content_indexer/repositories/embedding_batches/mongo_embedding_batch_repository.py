@@ -0,0 +1,99 @@
+"""MongoDB repository implementation for embedding batches using Odmantic.
+
+This module implements embedding batch tracking using the repository pattern
+with Odmantic for type-safe MongoDB operations.
+"""
+
+from learn_ai_agents.application.outbound_ports.content_indexer.repositories.embedding_batch_repository import (
+    EmbeddingBatchRepositoryPort,
+)
+from learn_ai_agents.application.outbound_ports.database import DatabaseClient
+from learn_ai_agents.domain.models.content_indexer.embedding_batch import EmbeddingBatch
+from learn_ai_agents.infrastructure.outbound.base_persistence import (
+    BaseMongoModelRepository,
+)
+from learn_ai_agents.logging import get_logger
+
+from .models import EmbeddingBatchModel
+
+logger = get_logger(__name__)
+
+
+class MongoEmbeddingBatchRepository(BaseMongoModelRepository[EmbeddingBatchModel], EmbeddingBatchRepositoryPort):
+    """MongoDB implementation of the EmbeddingBatchRepositoryPort using Odmantic.
+
+    This adapter implements the EmbeddingBatchRepositoryPort by inheriting from
+    BaseMongoModelRepository and handling the mapping between domain
+    EmbeddingBatch objects and ODM EmbeddingBatchModel models.
+    """
+
+    def __init__(self, database: DatabaseClient):
+        """Initialize the MongoDB embedding batch repository.
+
+        Args:
+            database: The database client instance (MongoEngineAdapter).
+        """
+        super().__init__(database.get_engine(), EmbeddingBatchModel)
+        logger.info("MongoDB embedding batch repository initialized with Odmantic")
+
+    async def save_batch(self, batch: EmbeddingBatch) -> EmbeddingBatch:
+        """Record a submitted embedding batch.
+
+        Args:
+            batch: The domain EmbeddingBatch to record.
+
+        Returns:
+            The recorded batch.
+        """
+        logger.debug(f"Saving embedding batch {batch.batch_id} for document_id={batch.document_id}")
+
+        saved_model = await self.save_one(
+            EmbeddingBatchModel(  # type: ignore[call-arg]
+                batch_id=batch.batch_id,
+                document_id=batch.document_id,
+                vectorization_approach=batch.vectorization_approach,
+                chunk_count=batch.chunk_count,
+            )
+        )
+        return self._to_domain(saved_model)
+
+    async def find_pending_batch(self, document_id: str, vectorization_approach: str) -> EmbeddingBatch | None:
+        """Find the batch recorded for a document and embedder approach.
+
+        Args:
+            document_id: The document whose chunks are being embedded.
+            vectorization_approach: The embedder approach of the batch.
+
+        Returns:
+            The most recently recorded EmbeddingBatch if found, None otherwise.
+        """
+        models = await self.find_by(document_id=document_id, vectorization_approach=vectorization_approach)
+        if not models:
+            return None
+        return self._to_domain(max(models, key=lambda model: model.created_at))
+
+    async def delete_batch(self, batch_id: str) -> bool:
+        """Delete the record of a batch.
+
+        Args:
+            batch_id: The ID of the batch.
+
+        Returns:
+            True if a record was deleted, False if none was found.
+        """
+        models = await self.find_by(batch_id=batch_id)
+        deleted = False
+        for model in models:
+            deleted = await self.delete_by_id(str(model.id)) or deleted
+        logger.debug(f"Deleted embedding batch record {batch_id}: {deleted}")
+        return deleted
+
+    @staticmethod
+    def _to_domain(model: EmbeddingBatchModel) -> EmbeddingBatch:
+        """Map an ODM EmbeddingBatchModel to a domain EmbeddingBatch."""
+        return EmbeddingBatch(
+            batch_id=model.batch_id,
+            document_id=model.document_id,
+            vectorization_approach=model.vectorization_approach,
+            chunk_count=model.chunk_count,
+        )
@@ -1,7 +1,9 @@
 """Vector store repositories."""
 
 from .qdrant_vector_store_repository import QdrantVectorStoreRepository
+from .semantic_cached_vector_store_repository import SemanticCachedVectorStoreRepository
 
 __all__ = [
     "QdrantVectorStoreRepository",
+    "SemanticCachedVectorStoreRepository",
 ]
@@ -4,22 +4,58 @@ This module implements vector storage using Qdrant, following the repository pat
 Based on the Qdrant neural search tutorial.
 """
 
-from typing import Any
+import asyncio
+from collections.abc import Iterator, Sequence
+from typing import Any, Literal
 from uuid import uuid4
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+import httpx
+import numpy as np
+from cachetools import TTLCache
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Batch,
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    PayloadSelectorInclude,
+    PointIdsList,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
 
 from learn_ai_agents.application.outbound_ports.content_indexer.repositories.vector_store_repository import (
     VectorStoreRepositoryPort,
 )
-from learn_ai_agents.domain.exceptions import ComponentConnectionException, ResourceNotFoundException, ComponentNotAvailableException, ComponentOperationException
+from learn_ai_agents.domain.exceptions import (
+    ComponentBuildingException,
+    ComponentConnectionException,
+    ComponentNotAvailableException,
+    ComponentOperationException,
+    ResourceNotFoundException,
+)
 from learn_ai_agents.domain.models.content_indexer import VectorDistanceMetric
 from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
 from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Payload key of the chunk header that get_personality filters on
+_PERSONALITY_FIELD = "metadata.h2_header"
+_PERSONALITY_HEADER = "## Personality"
+
+# (document_id, limit, payload_fields) identifying searches that can share a batch request
+_SearchKey = tuple[str, int, tuple[str, ...] | None]
+
 
 class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
     """Qdrant implementation of the VectorStoreRepositoryPort.
@@ -33,10 +69,47 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
     Collections are created dynamically based on document_id passed to methods.
     Collection naming format: document_chunks_{document_id}
 
+    The adapter owns a single AsyncQdrantClient (or uses an injected one) that
+    is shared by every use case resolving this component. Its gRPC channel
+    multiplexes concurrent requests over HTTP/2, and the REST transport keeps
+    a bounded pool of keep-alive connections. ``aclose`` closes the client on
+    shutdown unless it was injected.
+
+    Upserts are split into batches of ``upsert_batch_size`` points, and up to
+    ``upsert_max_concurrency`` batches are in flight at once, so large documents
+    are uploaded as a pipeline of requests instead of one large request.
+    During a bulk ingestion (``optimize_for="bulk"`` until ``finalize_ingestion``)
+    upserts do not wait for each batch to be applied; ``finalize_ingestion``
+    waits once for all of them instead.
+
+    With a positive ``search_batch_window``, concurrent similarity searches
+    against the same document are coalesced into one batch request.
+
+    Each collection keeps the vector size it was created with, so documents
+    embedded by different models (e.g. 384-dimensional sentence-transformers
+    and 1536-dimensional OpenAI embeddings) can share one store. Upserts and
+    searches are validated against the size of their collection, read from
+    Qdrant once and then cached.
+
+    With ``scalar_quantization`` enabled, new collections also keep an int8
+    copy of every vector in RAM. Searches run on the int8 vectors and rescore
+    the candidates with the original float32 vectors, so recall is preserved.
+
+    Character personalities are cached per document_id for
+    ``personality_cache_ttl`` seconds, since they are read on every chat turn
+    but only change when a document is re-vectorized. Upserting into or
+    deleting a collection drops its cached personality.
+
     Attributes:
-        qdrant_client: The Qdrant client instance.
-        vector_size: Dimensionality of the embedding vectors.
+        qdrant_client: The async Qdrant client instance.
+        vector_size: Vector size of collections created by ``upsert_vectors`` itself.
         distance: Distance metric to use.
+        upsert_batch_size: Default number of points sent per upsert request.
+        upsert_max_concurrency: Default number of upsert requests in flight at once.
+        personality_cache: TTL/LRU cache of personality texts keyed by document_id.
+        search_batch_window: Seconds to buffer searches before sending them as one batch (0 disables).
+        indexing_threshold: Indexing threshold (in KB) restored after a bulk ingestion.
+        quantization_config: int8 scalar quantization applied to new collections, or None.
     """
 
     def __init__(
@@ -45,29 +118,109 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         port: int = 6333,
         vector_size: int = 384,
         distance: str = "COSINE",
+        upsert_batch_size: int = 64,
+        upsert_max_concurrency: int = 4,
+        personality_cache_size: int = 512,
+        personality_cache_ttl: float = 600.0,
+        search_batch_window_ms: float = 0.0,
+        indexing_threshold: int = 20000,
+        scalar_quantization: bool = False,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = False,
+        timeout: int = 30,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        client: AsyncQdrantClient | None = None,
     ):
         """Initialize the Qdrant vector store repository.
 
         Args:
             host: Qdrant server host.
             port: Qdrant server port.
-            vector_size: Dimensionality of the embedding vectors.
+            vector_size: Vector size of collections that ``upsert_vectors`` creates when
+                ``create_collection_if_not_exists`` was not called first.
             distance: Distance metric (COSINE, DOT, EUCLID, MANHATTAN).
+            upsert_batch_size: Default number of points sent per upsert request.
+            upsert_max_concurrency: Default number of upsert requests in flight at once.
+            personality_cache_size: Maximum number of cached personalities.
+            personality_cache_ttl: Seconds a cached personality stays valid.
+            search_batch_window_ms: Milliseconds to buffer concurrent searches on the same
+                document before sending them as one batch request. 0 disables coalescing.
+            indexing_threshold: Indexing threshold (in KB) restored by ``finalize_ingestion``.
+            scalar_quantization: Create collections with int8 scalar quantization and
+                rescore search results with the original vectors.
+            grpc_port: Qdrant gRPC port.
+            prefer_grpc: Use the gRPC API instead of REST where available.
+            timeout: Request timeout in seconds.
+            max_connections: Maximum pooled REST connections.
+            max_keepalive_connections: Maximum idle REST connections kept alive.
+            client: Pre-built client to use instead of creating one from the parameters above.
+
+        Raises:
+            ComponentBuildingException: If the batch size or concurrency is not positive.
         """
+        if upsert_batch_size < 1 or upsert_max_concurrency < 1:
+            raise ComponentBuildingException(
+                component_type="vector_store",
+                message="upsert_batch_size and upsert_max_concurrency must be positive",
+                details={"upsert_batch_size": upsert_batch_size, "upsert_max_concurrency": upsert_max_concurrency},
+            )
+
         self.host = host
         self.port = port
         self.vector_size = vector_size
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_max_concurrency = upsert_max_concurrency
+        self.search_batch_window = search_batch_window_ms / 1000
+        self.indexing_threshold = indexing_threshold
+        self.quantization_config = (
+            ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True))
+            if scalar_quantization
+            else None
+        )
+        self._search_params = (
+            SearchParams(quantization=QuantizationSearchParams(rescore=True)) if scalar_quantization else None
+        )
+        self._pending_searches: dict[_SearchKey, list[tuple[EmbeddingArray, asyncio.Future[list[dict]]]]] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        # Collections between create_collection_if_not_exists(optimize_for="bulk") and finalize_ingestion
+        self._bulk_collections: set[str] = set()
+        # Vector size of each collection this adapter created or looked up
+        self._vector_sizes: dict[str, int] = {}
+        self.personality_cache: TTLCache[str, str] = TTLCache(maxsize=personality_cache_size, ttl=personality_cache_ttl)
 
         # Convert string/enum distance to Qdrant Distance enum
         self.distance = self._convert_to_qdrant_distance(distance)
 
         # Initialize Qdrant client
+        self._owns_client = client is None
+        if client is not None:
+            self.qdrant_client = client
+            logger.info("Using injected Qdrant client")
+            return
         try:
-            self.qdrant_client = QdrantClient(host=host, port=port)
-            logger.info(f"Connected to Qdrant at {host}:{port}")
+            self.qdrant_client = AsyncQdrantClient(
+                host=host,
+                port=port,
+                grpc_port=grpc_port,
+                prefer_grpc=prefer_grpc,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections, max_keepalive_connections=max_keepalive_connections
+                ),
+            )
+            logger.info(f"Connected to Qdrant at {host}:{port} (prefer_grpc={prefer_grpc})")
         except Exception as e:
             logger.error(f"Failed to connect to Qdrant: {str(e)}")
-            raise ComponentConnectionException(component_type="vector_store", message=f"Qdrant connection failed: {str(e)}") from e
+            raise ComponentConnectionException(
+                component_type="vector_store", message=f"Qdrant connection failed: {str(e)}"
+            ) from e
+
+    async def aclose(self) -> None:
+        """Close the Qdrant client and its connection pool, unless it was injected."""
+        if self._owns_client:
+            await self.qdrant_client.close()
+            logger.info("Closed Qdrant client")
 
     def _convert_to_qdrant_distance(self, distance: str | VectorDistanceMetric) -> Distance:
         """Convert domain distance metric to Qdrant Distance enum.
@@ -85,10 +238,10 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         if isinstance(distance, str):
             try:
                 distance = VectorDistanceMetric(distance.upper())
-            except ValueError:
+            except ValueError as e:
                 raise ValueError(
                     f"Invalid distance metric '{distance}'. Must be one of: {[m.value for m in VectorDistanceMetric]}"
-                )
+                ) from e
 
         # Map domain metric to Qdrant Distance
         distance_map = {
@@ -111,141 +264,341 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         """
         return document_id
 
-    def _ensure_collection(self, document_id: str) -> None:
+    async def _get_vector_size(self, collection_name: str) -> int:
+        """Return the vector size of an existing collection, reading it from Qdrant on first use.
+
+        Args:
+            collection_name: The collection to look up.
+
+        Returns:
+            The dimensionality of the collection's vectors.
+        """
+        vector_size = self._vector_sizes.get(collection_name)
+        if vector_size is None:
+            info = await self.qdrant_client.get_collection(collection_name)
+            vectors_config = info.config.params.vectors
+            # Collections created here have a single unnamed vector
+            vector_size = vectors_config.size if isinstance(vectors_config, VectorParams) else self.vector_size
+            self._vector_sizes[collection_name] = vector_size
+        return vector_size
+
+    async def _ensure_collection(self, document_id: str) -> int:
         """Create the collection if it doesn't exist.
 
         Args:
             document_id: The document ID to create collection for.
+
+        Returns:
+            The vector size of the collection.
         """
         collection_name = self._get_collection_name(document_id)
         try:
-            if not self.qdrant_client.collection_exists(collection_name):
-                self.qdrant_client.create_collection(
+            if collection_name in self._vector_sizes:
+                return self._vector_sizes[collection_name]
+            if not await self.qdrant_client.collection_exists(collection_name):
+                await self.qdrant_client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=self.vector_size,
                         distance=self.distance,
                     ),
+                    quantization_config=self.quantization_config,
                 )
+                await self._create_payload_indexes(collection_name)
+                self._vector_sizes[collection_name] = self.vector_size
                 logger.info(
                     f"Created Qdrant collection '{collection_name}' "
                     f"with vector_size={self.vector_size}, distance={self.distance}"
                 )
-            else:
-                logger.debug(f"Collection '{collection_name}' already exists")
+                return self.vector_size
+            logger.debug(f"Collection '{collection_name}' already exists")
+            return await self._get_vector_size(collection_name)
         except Exception as e:
             logger.error(f"Failed to create collection: {str(e)}")
             raise ResourceNotFoundException(resource_type="vector_store_collection", resource_id=collection_name) from e
 
+    async def _create_payload_indexes(self, collection_name: str) -> None:
+        """Index the payload keys used in filters.
+
+        A keyword index on the chunk header turns the personality lookup into an
+        index lookup instead of a full scan of the collection's payloads. Creating
+        an index that already exists is a no-op in Qdrant.
+
+        Args:
+            collection_name: The collection to index.
+        """
+        await self.qdrant_client.create_payload_index(
+            collection_name=collection_name,
+            field_name=_PERSONALITY_FIELD,
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+
     async def create_collection_if_not_exists(
-        self, document_id: str, vector_size: int, distance: str = "COSINE"
+        self,
+        document_id: str,
+        vector_size: int,
+        distance: str = "COSINE",
+        optimize_for: Literal["search", "bulk"] = "search",
     ) -> None:
         """Create collection if it doesn't exist.
 
+        With ``optimize_for="bulk"`` the collection gets ``indexing_threshold=0``,
+        so Qdrant does not rebuild the HNSW index while points are still being
+        uploaded, and upserts into it return without waiting for each batch to
+        be applied. An existing collection is switched to the same mode.
+        ``finalize_ingestion`` waits for the pending writes and restores
+        indexing. The payload index used by ``get_personality`` is created in
+        both cases.
+
         Args:
             document_id: The document ID to create collection for.
             vector_size: Dimensionality of the embedding vectors.
             distance: Distance metric (COSINE, DOT, EUCLID, MANHATTAN).
+            optimize_for: "bulk" to defer indexing until ``finalize_ingestion``, or "search".
 
         Raises:
+            ComponentOperationException: If an existing collection has a different vector size.
             DomainException: If creation fails.
         """
+        if optimize_for not in ("search", "bulk"):
+            raise ComponentOperationException(
+                component_type="vector_store",
+                message=f"Invalid optimize_for '{optimize_for}'. Must be one of: ['search', 'bulk']",
+            )
+
         collection_name = self._get_collection_name(document_id)
+        optimizers_config = OptimizersConfigDiff(indexing_threshold=0) if optimize_for == "bulk" else None
         try:
-            if not self.qdrant_client.collection_exists(collection_name):
+            if not await self.qdrant_client.collection_exists(collection_name):
                 distance_enum = self._convert_to_qdrant_distance(distance)
-                self.qdrant_client.create_collection(
+                await self.qdrant_client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=vector_size,
                         distance=distance_enum,
                     ),
+                    optimizers_config=optimizers_config,
+                    quantization_config=self.quantization_config,
                 )
+                self._vector_sizes[collection_name] = vector_size
                 logger.info(
-                    f"Created collection '{collection_name}' with vector_size={vector_size}, distance={distance}"
+                    f"Created collection '{collection_name}' with vector_size={vector_size}, distance={distance}, "
+                    f"optimize_for={optimize_for}"
                 )
             else:
                 logger.debug(f"Collection '{collection_name}' already exists")
+                existing_size = await self._get_vector_size(collection_name)
+                if existing_size != vector_size:
+                    raise ComponentOperationException(
+                        component_type="vector_store",
+                        message=(
+                            f"Collection '{collection_name}' has vector_size={existing_size}, "
+                            f"expected {vector_size}; delete it before re-vectorizing with another model"
+                        ),
+                        details={"collection_name": collection_name, "document_id": document_id},
+                    )
+                if optimizers_config is not None:
+                    await self.qdrant_client.update_collection(
+                        collection_name=collection_name, optimizers_config=optimizers_config
+                    )
+                    logger.debug(f"Disabled indexing on '{collection_name}' for bulk ingestion")
+            await self._create_payload_indexes(collection_name)
+            if optimize_for == "bulk":
+                self._bulk_collections.add(collection_name)
+        except ComponentOperationException:
+            raise
         except Exception as e:
             logger.error(f"Failed to create collection: {str(e)}")
-            raise ComponentNotAvailableException(component_type="vector_store", message=f"Collection creation failed: {str(e)}", details={"collection_name": collection_name, "document_id": document_id}) from e
+            raise ComponentNotAvailableException(
+                component_type="vector_store",
+                message=f"Collection creation failed: {str(e)}",
+                details={"collection_name": collection_name, "document_id": document_id},
+            ) from e
+
+    async def finalize_ingestion(self, document_id: str) -> None:
+        """Wait for a bulk ingestion's writes and restore ``indexing_threshold``.
+
+        Qdrant applies the updates of a collection in order, so one no-op delete
+        with ``wait=True`` returns only after every earlier un-awaited upsert has
+        been applied; searches issued afterwards see all ingested points.
+
+        Args:
+            document_id: The document ID whose collection finished ingesting.
+
+        Raises:
+            DomainException: If the collection update fails.
+        """
+        collection_name = self._get_collection_name(document_id)
+        try:
+            if collection_name in self._bulk_collections:
+                await self.qdrant_client.delete(
+                    collection_name=collection_name, points_selector=PointIdsList(points=[]), wait=True
+                )
+                self._bulk_collections.discard(collection_name)
+                self.invalidate_personality(document_id)
+                logger.debug(f"All pending writes applied on '{collection_name}'")
+            await self.qdrant_client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=self.indexing_threshold),
+            )
+            logger.info(f"Re-enabled indexing on '{collection_name}' (indexing_threshold={self.indexing_threshold})")
+        except Exception as e:
+            logger.error(f"Failed to finalize ingestion: {str(e)}")
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Finalizing ingestion failed: {str(e)}"
+            ) from e
+
+    def _iter_point_batches(
+        self, chunks: Sequence[DocumentChunk], vectors: EmbeddingArray, batch_size: int
+    ) -> Iterator[Batch]:
+        """Lazily build batches of Qdrant points from chunks and their vectors.
 
-    async def upsert_vectors(self, document_id: str, chunks: list[DocumentChunk], vectors: list[list[float]]) -> None:
-        """Upsert document chunks with their vectors to Qdrant.
+        Each batch is a column-oriented ``Batch`` (ids, vectors and payloads as
+        parallel lists), so the client validates one model per request instead of
+        one ``PointStruct`` per point. Payloads are plain dicts built straight from
+        the chunk fields, and the vector matrix is converted to Python floats with
+        a single ``tolist()`` call per batch.
+
+        Args:
+            chunks: DocumentChunk domain objects.
+            vectors: Embedding matrix with one row per chunk, already validated.
+            batch_size: Maximum number of points per batch.
 
-        This method follows the Qdrant tutorial pattern for uploading data.
+        Yields:
+            Batches of at most ``batch_size`` points.
+        """
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start : start + batch_size]
+            yield Batch.model_construct(
+                ids=[str(uuid4()) for _ in batch],
+                vectors=vectors[start : start + batch_size].tolist(),
+                payloads=[
+                    {
+                        "chunk_id": chunk.chunk_id,
+                        "document_id": chunk.document_id,
+                        "split_index": chunk.split_index,
+                        "content": chunk.content,
+                        "character_name": chunk.character_name,
+                        "metadata": chunk.metadata or {},
+                    }
+                    for chunk in batch
+                ],
+            )
+
+    async def upsert_vectors(
+        self,
+        document_id: str,
+        chunks: Sequence[DocumentChunk],
+        vectors: EmbeddingArray,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> int:
+        """Upsert document chunks with their vectors to Qdrant in concurrent batches.
+
+        The chunks and vectors are validated before anything is uploaded. Points
+        are then built lazily, ``batch_size`` at a time, and uploaded by up to
+        ``max_concurrency`` workers that pull from the same batch iterator, so at
+        most that many requests (and batches) are in flight at once. If one
+        upload fails, the other workers are cancelled before the error is raised.
 
         Args:
             document_id: The document ID to create collection for.
-            chunks: List of DocumentChunk domain objects.
-            vectors: List of embedding vectors corresponding to each chunk.
+            chunks: DocumentChunk domain objects.
+            vectors: Embedding matrix of shape [chunk count, collection vector size], one row per chunk.
+            batch_size: Points per upsert request. Defaults to ``upsert_batch_size``.
+            max_concurrency: Upsert requests in flight at once. Defaults to ``upsert_max_concurrency``.
+
+        Returns:
+            Number of points upserted.
 
         Raises:
             DomainException: If storage fails or input validation fails.
         """
         if len(chunks) != len(vectors):
-            raise ComponentOperationException(f"Chunk and vector count mismatch: {len(chunks)} vs {len(vectors)}")
+            raise ComponentOperationException(
+                component_type="vector_store",
+                message=f"Chunk and vector count mismatch: {len(chunks)} vs {len(vectors)}",
+            )
 
         if not chunks:
             logger.warning("No chunks to upsert")
-            return
+            return 0
 
+        batch_size = batch_size or self.upsert_batch_size
+        max_concurrency = max_concurrency or self.upsert_max_concurrency
         collection_name = self._get_collection_name(document_id)
 
         # Ensure collection exists for this document_id
-        self._ensure_collection(document_id)
+        vector_size = await self._ensure_collection(document_id)
+        if vectors.ndim != 2 or vectors.shape[1] != vector_size:
+            raise ComponentOperationException(
+                component_type="vector_store",
+                message=f"Embedding dimension mismatch: expected (n, {vector_size}), got {vectors.shape}",
+            )
 
-        logger.info(f"Upserting {len(chunks)} chunks to Qdrant collection '{collection_name}'")
+        logger.info(
+            f"Upserting {len(chunks)} chunks to Qdrant collection '{collection_name}' "
+            f"(batch_size={batch_size}, max_concurrency={max_concurrency})"
+        )
 
-        try:
-            # Prepare points for upload
-            points = []
-            for chunk, vector in zip(chunks, vectors):
-                # Validate embedding dimensions
-                if len(vector) != self.vector_size:
-                    raise ComponentOperationException(
-                        f"Embedding dimension mismatch: expected {self.vector_size}, "
-                        f"got {len(vector)} for chunk {chunk.chunk_id}"
-                    )
+        batches = self._iter_point_batches(chunks, vectors, batch_size)
+        # During a bulk ingestion, finalize_ingestion waits for all batches at once
+        wait = collection_name not in self._bulk_collections
 
-                # Create payload with chunk data
-                payload = {
-                    "chunk_id": chunk.chunk_id,
-                    "document_id": chunk.document_id,
-                    "split_index": chunk.split_index,
-                    "content": chunk.content,
-                    "character_name": chunk.character_name,
-                    "metadata": chunk.metadata or {},
-                }
-
-                # Use chunk_id as the point ID for easy retrieval
-                point = PointStruct(
-                    id=str(uuid4()),
-                    vector=vector,
-                    payload=payload,
+        async def upload_batches() -> int:
+            # Workers share the batch iterator; it never awaits, so each batch goes to exactly one worker
+            upserted = 0
+            for points in batches:
+                await self.qdrant_client.upsert(
+                    collection_name=collection_name,
+                    points=points,
+                    wait=wait,
                 )
-                points.append(point)
+                upserted += len(points.ids)
+            return upserted
 
-            # Upload points to Qdrant (upsert = insert or update)
-            operation_info = self.qdrant_client.upsert(
-                collection_name=collection_name,
-                points=points,
-                wait=True,  # Wait for the operation to complete
-            )
-
-            logger.info(f"Successfully upserted {len(chunks)} chunks. Operation status: {operation_info.status}")
-
-        except Exception as e:
+        workers = [asyncio.ensure_future(upload_batches()) for _ in range(max_concurrency)]
+        try:
+            upserted_per_worker = await asyncio.gather(*workers)
+        except BaseException as e:
+            # Stop the other workers so no upload outlives the failed call
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if not isinstance(e, Exception):
+                raise
             logger.error(f"Failed to upsert vectors to Qdrant: {str(e)}")
-            raise ComponentOperationException(component_type="vector_store", message=f"Vector storage failed: {str(e)}") from e
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Vector storage failed: {str(e)}"
+            ) from e
+
+        total = sum(upserted_per_worker)
+        self.invalidate_personality(document_id)
+        if total:
+            logger.info(f"Successfully upserted {total} chunks to collection '{collection_name}'")
+        else:
+            logger.warning("No chunks to upsert")
+        return total
 
-    async def search_similar(self, document_id: str, query_vector: list[float], limit: int = 5) -> list[dict]:
+    async def search_similar(
+        self,
+        document_id: str,
+        query_vector: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[dict]:
         """Search for chunks similar to the query vector.
 
+        With a positive ``search_batch_window``, searches against the same
+        document, limit and payload fields that arrive within the window are
+        sent to Qdrant as one batch request.
+
         Args:
             document_id: The document ID to search within.
-            query_vector: The embedding vector to search with.
+            query_vector: Embedding vector of the collection's vector size to search with.
             limit: Maximum number of results to return (default: 5).
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
 
         Returns:
             List of payload dictionaries containing chunk metadata.
@@ -253,37 +606,137 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         Raises:
             DomainException: If search fails.
         """
-        if len(query_vector) != self.vector_size:
+        if self.search_batch_window <= 0:
+            return (await self.batch_search_similar(document_id, query_vector[np.newaxis], limit, payload_fields))[0]
+
+        # Reject bad vectors here so they cannot fail the other searches of their batch
+        await self._validate_query_vectors(document_id, query_vector[np.newaxis])
+        key: _SearchKey = (document_id, limit, tuple(payload_fields) if payload_fields is not None else None)
+        loop = asyncio.get_running_loop()
+        pending = self._pending_searches.get(key)
+        if pending is None:
+            pending = self._pending_searches[key] = []
+            task = loop.create_task(self._flush_pending_searches(key))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+        future: asyncio.Future[list[dict]] = loop.create_future()
+        pending.append((query_vector, future))
+        return await future
+
+    async def _validate_query_vectors(self, document_id: str, query_vectors: EmbeddingArray) -> None:
+        """Check that query vectors match the dimension of the document's collection.
+
+        Args:
+            document_id: The document ID whose collection is searched.
+            query_vectors: Embedding matrix of shape [query count, vector size] to check.
+
+        Raises:
+            ComponentOperationException: If the collection cannot be read or the shape does not match.
+        """
+        try:
+            vector_size = await self._get_vector_size(self._get_collection_name(document_id))
+        except Exception as e:
+            logger.error(f"Failed to search in Qdrant: {str(e)}")
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Vector search failed: {str(e)}"
+            ) from e
+        if query_vectors.ndim != 2 or query_vectors.shape[1] != vector_size:
             raise ComponentOperationException(
-                f"Query vector dimension mismatch: expected {self.vector_size}, got {len(query_vector)}"
+                component_type="vector_store",
+                message=f"Query vector dimension mismatch: expected (n, {vector_size}), got {query_vectors.shape}",
             )
 
+    async def _flush_pending_searches(self, key: _SearchKey) -> None:
+        """Wait for the batching window, then run the buffered searches for ``key`` as one batch.
+
+        Args:
+            key: The (document_id, limit, payload_fields) whose buffered searches to run.
+        """
+        try:
+            await asyncio.sleep(self.search_batch_window)
+        except asyncio.CancelledError:
+            for _, future in self._pending_searches.pop(key):
+                future.cancel()
+            raise
+        pending = self._pending_searches.pop(key)
+        document_id, limit, payload_fields = key
+        logger.debug(f"Flushing {len(pending)} coalesced searches for collection '{document_id}'")
+
+        try:
+            results = await self.batch_search_similar(
+                document_id, np.stack([vector for vector, _ in pending]), limit, payload_fields
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), payloads in zip(pending, results, strict=True):
+            if not future.done():  # The caller may have been cancelled meanwhile
+                future.set_result(payloads)
+
+    async def batch_search_similar(
+        self,
+        document_id: str,
+        query_vectors: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[list[dict]]:
+        """Run several similarity searches against one collection in a single request.
+
+        Only the requested payload fields are sent back, and vectors never are.
+
+        Args:
+            document_id: The document ID to search within.
+            query_vectors: Embedding matrix of shape [query count, collection vector size] to search with.
+            limit: Maximum number of results to return per query (default: 5).
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
+
+        Returns:
+            One list of payload dictionaries per query vector, in input order.
+
+        Raises:
+            DomainException: If search fails.
+        """
+        await self._validate_query_vectors(document_id, query_vectors)
+
         collection_name = self._get_collection_name(document_id)
-        logger.debug(f"Searching for similar chunks in collection '{collection_name}' (limit={limit})")
+        logger.debug(
+            f"Searching for similar chunks in collection '{collection_name}' "
+            f"({len(query_vectors)} queries, limit={limit})"
+        )
 
+        with_payload = PayloadSelectorInclude(include=list(payload_fields)) if payload_fields is not None else True
         try:
-            # Use query_points for search (as shown in your example)
-            search_result = self.qdrant_client.query_points(
+            responses = await self.qdrant_client.query_batch_points(
                 collection_name=collection_name,
-                query=query_vector,
-                query_filter=None,  # No filters for now
-                limit=limit,
-            ).points
+                requests=[
+                    QueryRequest(
+                        query=query_vector,
+                        limit=limit,
+                        params=self._search_params,
+                        with_payload=with_payload,
+                        with_vector=False,
+                    )
+                    for query_vector in query_vectors.tolist()
+                ],
+            )
 
             # Extract payloads from search results
-            payloads: list[dict[Any, Any]] = []
-            for hit in search_result:
-                if hit.payload:
-                    payloads.append(dict(hit.payload))
-                else:
-                    payloads.append({})
+            results: list[list[dict[Any, Any]]] = [
+                [dict(hit.payload) if hit.payload else {} for hit in response.points] for response in responses
+            ]
 
-            logger.info(f"Found {len(payloads)} similar chunks")
-            return payloads
+            logger.info(f"Found {sum(len(payloads) for payloads in results)} similar chunks for {len(results)} queries")
+            return results
 
         except Exception as e:
             logger.error(f"Failed to search in Qdrant: {str(e)}")
-            raise ComponentOperationException(component_type="vector_store", message=f"Vector search failed: {str(e)}") from e
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Vector search failed: {str(e)}"
+            ) from e
 
     async def delete_collection(self, document_id: str) -> None:
         """Delete the entire collection for a specific document.
@@ -298,18 +751,52 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         logger.info(f"Deleting collection '{collection_name}'")
 
         try:
-            self.qdrant_client.delete_collection(collection_name)
+            await self.qdrant_client.delete_collection(collection_name)
+            self._bulk_collections.discard(collection_name)
+            self._vector_sizes.pop(collection_name, None)
+            self.invalidate_personality(document_id)
             logger.info(f"Successfully deleted collection '{collection_name}'")
 
         except Exception as e:
             logger.error(f"Failed to delete collection: {str(e)}")
-            raise ComponentOperationException(component_type="vector_store", message=f"Collection deletion failed: {str(e)}") from e
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Collection deletion failed: {str(e)}"
+            ) from e
+
+    def invalidate_personality(self, document_id: str) -> None:
+        """Drop the cached personality for a document.
+
+        Args:
+            document_id: The document ID whose cached personality to drop.
+        """
+        self.personality_cache.pop(document_id, None)
 
     async def get_personality(self, document_id: str) -> str:
+        """Retrieve character personality, serving repeated lookups from the cache.
+
+        Args:
+            document_id: The document ID (collection name) to search.
+
+        Returns:
+            The personality content if found, or a default message.
+
+        Raises:
+            DomainException: If search fails.
+        """
+        personality = self.personality_cache.get(document_id)
+        if personality is None:
+            # Concurrent misses for the same document may both query Qdrant; the results are identical
+            personality = await self._fetch_personality(document_id)
+            self.personality_cache[document_id] = personality
+        else:
+            logger.debug(f"Personality cache hit for '{document_id}'")
+        return personality
+
+    async def _fetch_personality(self, document_id: str) -> str:
         """Retrieve character personality from the collection.
 
-        Searches for chunks with metadata.h2_header == "## Personality" and returns
-        the content of the first matching chunk.
+        Scrolls for the first chunk with metadata.h2_header == "## Personality"
+        (a keyword-indexed payload filter, no vector search) and returns its content.
 
         Args:
             document_id: The document ID (collection name) to search.
@@ -320,32 +807,29 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
         Raises:
             DomainException: If search fails.
         """
-        from qdrant_client.models import FieldCondition, Filter, MatchValue
-
         collection_name = self._get_collection_name(document_id)
         logger.debug(f"Searching for personality in collection '{collection_name}'")
 
         try:
             # Check if collection exists
-            if not self.qdrant_client.collection_exists(collection_name):
+            if not await self.qdrant_client.collection_exists(collection_name):
                 logger.error(f"Collection '{collection_name}' does not exist")
-                raise ResourceNotFoundException(
-                    resource_type="vector_store_collection",
-                    resource_id=collection_name
-                )
+                raise ResourceNotFoundException(resource_type="vector_store_collection", resource_id=collection_name)
 
             # Search for chunks with h2_header = "## Personality" in metadata
-            scroll_result = self.qdrant_client.scroll(
+            scroll_result = await self.qdrant_client.scroll(
                 collection_name=collection_name,
                 scroll_filter=Filter(
                     must=[
                         FieldCondition(
-                            key="metadata.h2_header",
-                            match=MatchValue(value="## Personality"),
+                            key=_PERSONALITY_FIELD,
+                            match=MatchValue(value=_PERSONALITY_HEADER),
                         )
                     ]
                 ),
                 limit=1,  # We only need the first match
+                with_payload=PayloadSelectorInclude(include=["content"]),
+                with_vectors=False,
             )
 
             if scroll_result[0]:  # Points found
@@ -366,4 +850,6 @@ class QdrantVectorStoreRepository(VectorStoreRepositoryPort):
             raise
         except Exception as e:
             logger.error(f"Failed to retrieve personality from Qdrant: {str(e)}")
-            raise ComponentOperationException(component_type="vector_store", message=f"Personality retrieval failed: {str(e)}") from e
\ No newline at end of file
+            raise ComponentOperationException(
+                component_type="vector_store", message=f"Personality retrieval failed: {str(e)}"
+            ) from e
@@ -0,0 +1,349 @@
+"""Semantic query cache in front of a vector store repository.
+
+This module implements a decorator over any VectorStoreRepositoryPort that
+answers similarity searches from recently seen, near-identical queries
+instead of going back to the vector database.
+"""
+
+import copy
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+
+from learn_ai_agents.application.outbound_ports.content_indexer.repositories.vector_store_repository import (
+    VectorStoreRepositoryPort,
+)
+from learn_ai_agents.domain.exceptions import ComponentBuildingException
+from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.vector_types import EmbeddingArray
+from learn_ai_agents.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (document_id, limit, payload_fields) whose searches share one query cache
+_CacheKey = tuple[str, int, tuple[str, ...] | None]
+
+# Rows allocated for a new query cache; the buffer doubles up to max_entries as it fills
+_INITIAL_CAPACITY = 16
+
+
+@dataclass(slots=True)
+class _QueryCache:
+    """Ring buffer of normalized query vectors and their search results.
+
+    Attributes:
+        vectors: Matrix of shape ``[capacity, dim]`` holding unit-length query vectors.
+        max_entries: Number of rows the buffer may grow to before FIFO eviction.
+        results: Search results for each row of ``vectors``.
+        size: Number of rows in use.
+        cursor: Row that the next insert overwrites (FIFO eviction once full).
+    """
+
+    vectors: np.ndarray
+    max_entries: int
+    results: list[list[dict]] = field(default_factory=list)
+    size: int = 0
+    cursor: int = 0
+
+    def lookup(self, query: np.ndarray, threshold: float) -> list[dict] | None:
+        """Return the results of the most similar cached query above ``threshold``."""
+        if not self.size:
+            return None
+        similarities = self.vectors[: self.size] @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        return self.results[best]
+
+    def insert(self, query: np.ndarray, results: list[dict]) -> None:
+        """Store a query and its results, evicting the oldest entry once full."""
+        if self.size == len(self.vectors) < self.max_entries:
+            # Grow the buffer instead of preallocating max_entries rows up front
+            grown = np.zeros((min(2 * len(self.vectors), self.max_entries), self.vectors.shape[1]), dtype=np.float32)
+            grown[: self.size] = self.vectors
+            self.vectors = grown
+        self.vectors[self.cursor] = query
+        if self.size < len(self.vectors):
+            self.results.append(results)
+            self.size += 1
+        else:
+            self.results[self.cursor] = results
+        self.cursor = (self.cursor + 1) % self.max_entries
+
+
+class SemanticCachedVectorStoreRepository(VectorStoreRepositoryPort):
+    """VectorStoreRepositoryPort decorator with a semantic cache for similarity searches.
+
+    For every (document_id, limit, payload_fields) the repository keeps the last
+    ``max_entries`` query vectors and their results, for at most ``max_keys``
+    keys (least recently used first out). A search whose query has cosine
+    similarity of at least ``similarity_threshold`` with a cached query returns
+    the cached results without calling the wrapped store. Cached results are
+    copied in and out, so callers may modify the payloads they get. Writes and
+    deletions for a document drop its cached queries, and searches that were in
+    flight when that happened do not cache their (possibly stale) results. All
+    other operations are forwarded unchanged.
+
+    Attributes:
+        vector_store: The wrapped vector store repository.
+        similarity_threshold: Minimum cosine similarity for a cache hit.
+        max_entries: Cached queries per search key before FIFO eviction.
+        max_keys: Search keys kept before the least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStoreRepositoryPort,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 1024,
+        max_keys: int = 64,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            vector_store: The vector store repository to wrap.
+            similarity_threshold: Minimum cosine similarity for a cache hit.
+            max_entries: Cached queries per search key before FIFO eviction.
+            max_keys: Search keys kept before the least recently used one is evicted.
+
+        Raises:
+            ComponentBuildingException: If the threshold or a cache size is out of range.
+        """
+        if not -1.0 <= similarity_threshold <= 1.0 or max_entries < 1 or max_keys < 1:
+            raise ComponentBuildingException(
+                component_type="vector_store",
+                message="similarity_threshold must be in [-1, 1] and max_entries and max_keys must be positive",
+                details={
+                    "similarity_threshold": similarity_threshold,
+                    "max_entries": max_entries,
+                    "max_keys": max_keys,
+                },
+            )
+
+        self.vector_store = vector_store
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.max_keys = max_keys
+        self._caches: OrderedDict[_CacheKey, _QueryCache] = OrderedDict()
+        # Searches running against the wrapped store, per document
+        self._in_flight: dict[str, int] = {}
+        # Bumped by invalidations while searches are in flight, so those searches don't cache stale
+        # results; a document's entry is dropped once it has no search in flight
+        self._generations: dict[str, int] = {}
+        logger.info(
+            f"Initialized SemanticCachedVectorStoreRepository "
+            f"(threshold={similarity_threshold}, max_entries={max_entries}, max_keys={max_keys})"
+        )
+
+    def invalidate(self, document_id: str) -> None:
+        """Drop all cached queries for a document.
+
+        Args:
+            document_id: The document ID whose cached queries to drop.
+        """
+        if document_id in self._in_flight:
+            self._generations[document_id] = self._generations.get(document_id, 0) + 1
+        for key in [key for key in self._caches if key[0] == document_id]:
+            del self._caches[key]
+
+    def _begin_search(self, document_id: str) -> int:
+        """Record a search sent to the wrapped store and return the document's current generation."""
+        self._in_flight[document_id] = self._in_flight.get(document_id, 0) + 1
+        return self._generations.get(document_id, 0)
+
+    def _end_search(self, document_id: str, generation: int) -> bool:
+        """Record the end of a search; return whether its results may be cached."""
+        cacheable = self._generations.get(document_id, 0) == generation
+        remaining = self._in_flight[document_id] - 1
+        if remaining:
+            self._in_flight[document_id] = remaining
+        else:
+            del self._in_flight[document_id]
+            self._generations.pop(document_id, None)
+        return cacheable
+
+    @staticmethod
+    def _normalize(query_vector: EmbeddingArray) -> np.ndarray | None:
+        """Return a unit-length float32 copy of the query, or None for a zero vector."""
+        norm = float(np.linalg.norm(query_vector))
+        if norm == 0.0:
+            return None
+        return np.divide(query_vector, norm, dtype=np.float32)
+
+    @staticmethod
+    def _cache_key(document_id: str, limit: int, payload_fields: Sequence[str] | None) -> _CacheKey:
+        """Build the cache key for a search."""
+        return (document_id, limit, tuple(payload_fields) if payload_fields is not None else None)
+
+    def _lookup_cache(self, key: _CacheKey) -> _QueryCache | None:
+        """Return the query cache for ``key``, marking it as recently used."""
+        cache = self._caches.get(key)
+        if cache is not None:
+            self._caches.move_to_end(key)
+        return cache
+
+    def _cache_for(self, key: _CacheKey, dim: int) -> _QueryCache:
+        """Return the query cache for ``key``, replacing it if its dimension differs.
+
+        Creating a cache evicts the least recently used one once ``max_keys`` are held.
+        """
+        cache = self._lookup_cache(key)
+        if cache is None or cache.vectors.shape[1] != dim:
+            capacity = min(_INITIAL_CAPACITY, self.max_entries)
+            cache = self._caches[key] = _QueryCache(
+                vectors=np.zeros((capacity, dim), dtype=np.float32), max_entries=self.max_entries
+            )
+            self._caches.move_to_end(key)
+            while len(self._caches) > self.max_keys:
+                self._caches.popitem(last=False)
+        return cache
+
+    async def search_similar(
+        self,
+        document_id: str,
+        query_vector: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[dict]:
+        """Search for chunks similar to the query vector, answering from the cache when possible.
+
+        Args:
+            document_id: The document ID to search within.
+            query_vector: Embedding vector of shape [dimensions] to search with.
+            limit: Maximum number of results to return.
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
+
+        Returns:
+            List of payload dictionaries containing chunk metadata.
+
+        Raises:
+            DomainException: If the wrapped store's search fails.
+        """
+        query = self._normalize(query_vector)
+        if query is None:
+            # Cosine similarity is undefined for a zero vector
+            return await self.vector_store.search_similar(document_id, query_vector, limit, payload_fields)
+
+        key = self._cache_key(document_id, limit, payload_fields)
+        cache = self._lookup_cache(key)
+        if cache is not None and cache.vectors.shape[1] == query.shape[0]:
+            cached = cache.lookup(query, self.similarity_threshold)
+            if cached is not None:
+                logger.debug(f"Semantic cache hit for document_id '{document_id}' (limit={limit})")
+                return copy.deepcopy(cached)
+
+        generation = self._begin_search(document_id)
+        try:
+            results = await self.vector_store.search_similar(document_id, query_vector, limit, payload_fields)
+        finally:
+            cacheable = self._end_search(document_id, generation)
+        if cacheable:
+            self._cache_for(key, query.shape[0]).insert(query, copy.deepcopy(results))
+        return results
+
+    async def batch_search_similar(
+        self,
+        document_id: str,
+        query_vectors: EmbeddingArray,
+        limit: int = 5,
+        payload_fields: Sequence[str] | None = None,
+    ) -> list[list[dict]]:
+        """Run several similarity searches, sending only the cache misses to the wrapped store.
+
+        Args:
+            document_id: The document ID to search within.
+            query_vectors: Embedding matrix of shape [query count, dimensions] to search with.
+            limit: Maximum number of results to return per query.
+            payload_fields: Payload keys to return for each hit; None returns the whole payload.
+
+        Returns:
+            One list of payload dictionaries per query vector, in input order.
+
+        Raises:
+            DomainException: If the wrapped store's search fails.
+        """
+        results: list[list[dict] | None] = [None] * len(query_vectors)
+        misses: list[int] = []
+        queries: list[np.ndarray | None] = []
+        key = self._cache_key(document_id, limit, payload_fields)
+        cache = self._lookup_cache(key)
+        for index, query_vector in enumerate(query_vectors):
+            query = self._normalize(query_vector)
+            queries.append(query)
+            if query is not None and cache is not None and cache.vectors.shape[1] == query.shape[0]:
+                cached = cache.lookup(query, self.similarity_threshold)
+                if cached is not None:
+                    results[index] = copy.deepcopy(cached)
+                    continue
+            misses.append(index)
+
+        hits = len(query_vectors) - len(misses)
+        logger.debug(f"Semantic cache: {hits}/{len(query_vectors)} hits for document_id '{document_id}'")
+        if misses:
+            generation = self._begin_search(document_id)
+            try:
+                fetched = await self.vector_store.batch_search_similar(
+                    document_id, query_vectors[misses], limit, payload_fields
+                )
+            finally:
+                # Skip caching if the document was written or deleted while the search ran
+                cacheable = self._end_search(document_id, generation)
+            for index, payloads in zip(misses, fetched, strict=True):
+                results[index] = payloads
+                query = queries[index]
+                if cacheable and query is not None:
+                    self._cache_for(key, query.shape[0]).insert(query, copy.deepcopy(payloads))
+
+        return [payloads if payloads is not None else [] for payloads in results]
+
+    async def upsert_vectors(
+        self,
+        document_id: str,
+        chunks: Sequence[DocumentChunk],
+        vectors: EmbeddingArray,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> int:
+        """Upsert vectors through the wrapped store and drop the document's cached queries."""
+        try:
+            return await self.vector_store.upsert_vectors(
+                document_id, chunks, vectors, batch_size=batch_size, max_concurrency=max_concurrency
+            )
+        finally:
+            self.invalidate(document_id)
+
+    async def delete_collection(self, document_id: str) -> None:
+        """Delete the collection through the wrapped store and drop the document's cached queries."""
+        try:
+            await self.vector_store.delete_collection(document_id)
+        finally:
+            self.invalidate(document_id)
+
+    async def create_collection_if_not_exists(
+        self,
+        document_id: str,
+        vector_size: int,
+        distance: str = "COSINE",
+        optimize_for: Literal["search", "bulk"] = "search",
+    ) -> None:
+        """Forward collection creation to the wrapped store."""
+        await self.vector_store.create_collection_if_not_exists(document_id, vector_size, distance, optimize_for)
+
+    async def finalize_ingestion(self, document_id: str) -> None:
+        """Finalize the bulk ingestion through the wrapped store and drop the document's cached queries.
+
+        Searches answered while the ingestion was still settling may have missed
+        the newly written points, so they must not be served from the cache.
+        """
+        try:
+            await self.vector_store.finalize_ingestion(document_id)
+        finally:
+            self.invalidate(document_id)
+
+    async def get_personality(self, document_id: str) -> str:
+        """Forward personality retrieval to the wrapped store."""
+        return await self.vector_store.get_personality(document_id)
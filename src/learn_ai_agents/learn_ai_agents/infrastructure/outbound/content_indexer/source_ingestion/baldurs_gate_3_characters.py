@@ -26,6 +26,11 @@ from learn_ai_agents.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Markdown clean-up patterns, compiled once for all sections
+_EDIT_LINK_RE = re.compile(r"\[edit(?:\s*\|\s*edit source)?\]", re.IGNORECASE)
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
 
 @dataclass
 class TopSection:
@@ -313,7 +318,7 @@ class BaldursGate3CharactersAdapter(SourceIngestionPort):
             span.decompose()
         text = clone.get_text(strip=True)
         # Extra safety: drop anything starting at '[' (e.g. 'Overview[edit | edit source]')
-        text = re.sub(r"\[.*$", "", text).strip()
+        text = text.partition("[")[0].strip()
         return text
 
     def _section_to_markdown(self, heading_tag: Tag, *, top_heading_level: int = 1) -> str:
@@ -386,11 +391,10 @@ class BaldursGate3CharactersAdapter(SourceIngestionPort):
         ).strip()
 
         # 5) Clean up any remaining '[edit | edit source]' or similar patterns
-        body_md = re.sub(r"\[edit\s*\|\s*edit source\]", "", body_md, flags=re.IGNORECASE)
-        body_md = re.sub(r"\[edit\]", "", body_md, flags=re.IGNORECASE)
+        body_md = _EDIT_LINK_RE.sub("", body_md)
         # Clean up any double spaces or extra newlines that might result
-        body_md = re.sub(r" {2,}", " ", body_md)
-        body_md = re.sub(r"\n{3,}", "\n\n", body_md)
+        body_md = _MULTI_SPACE_RE.sub(" ", body_md)
+        body_md = _MULTI_NEWLINE_RE.sub("\n\n", body_md)
         body_md = body_md.strip()
 
         # 6) Prepend our own heading as Markdown
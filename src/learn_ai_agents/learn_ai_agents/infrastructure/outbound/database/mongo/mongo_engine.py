@@ -5,9 +5,12 @@ It handles connection management and provides access to the Odmantic AIOEngine
 for use by repositories and the raw Motor client for components like checkpointers.
 """
 
+from types import TracebackType
+
 from motor.motor_asyncio import AsyncIOMotorClient
 from odmantic import AIOEngine
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from typing_extensions import Self
 
 from learn_ai_agents.application.outbound_ports.database import DatabaseClient
 from learn_ai_agents.domain.exceptions import ComponentConnectionException, ComponentOperationException
@@ -150,12 +153,20 @@ class MongoEngineAdapter(DatabaseClient):
             )
         return self._motor_client
 
-    async def __aenter__(self):
+    async def aclose(self) -> None:
+        """Close the MongoDB connection pool at application shutdown."""
+        await self.disconnect()
+
+    async def __aenter__(self) -> Self:
         """Async context manager entry - connects to MongoDB."""
         await self.connect()
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - disconnects from MongoDB."""
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Async context manager exit - disconnects from MongoDB without suppressing exceptions."""
         await self.disconnect()
-        return False  # Don't suppress exceptions
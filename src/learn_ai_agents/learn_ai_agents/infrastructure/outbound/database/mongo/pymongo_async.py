@@ -5,8 +5,11 @@ It's specifically designed for components that require PyMongo's async client,
 such as LangGraph's AsyncMongoDBSaver for checkpointing.
 """
 
+from types import TracebackType
+
 from pymongo import AsyncMongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from typing_extensions import Self
 
 from learn_ai_agents.application.outbound_ports.database import DatabaseClient
 from learn_ai_agents.domain.exceptions import ComponentConnectionException, ComponentOperationException
@@ -119,12 +122,20 @@ class PyMongoAsyncAdapter(DatabaseClient):
             )
         return self._client
 
-    async def __aenter__(self):
+    async def aclose(self) -> None:
+        """Close the MongoDB connection pool at application shutdown."""
+        await self.disconnect()
+
+    async def __aenter__(self) -> Self:
         """Async context manager entry - connects to MongoDB."""
         await self.connect()
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - disconnects from MongoDB."""
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Async context manager exit - disconnects from MongoDB without suppressing exceptions."""
         await self.disconnect()
-        return False  # Don't suppress exceptions
@@ -102,6 +102,7 @@ class LangChainVectorSearchToolAdapter(ToolPort):
                 document_id=document_id,
                 query_vector=query_vector,
                 limit=2,
+                payload_fields=["content", "character_name"],
             )
 
             if not results:
@@ -39,15 +39,21 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
-def setup_logging(level: int = logging.INFO, log_format: str | None = None, use_colors: bool = True) -> None:
+def setup_logging(level: int | str = "INFO", log_format: str | None = None, use_colors: bool = True) -> None:
     """
     Setup application-wide logging configuration.
 
     Args:
-        level: Logging level (default: INFO)
+        level: Logging level, as a name such as "INFO" or a numeric level (default: INFO)
         log_format: Custom log format string (optional)
-        use_colors: Whether to use colored output (default: True)
+        use_colors: Whether to use colored output on a TTY (default: True)
     """
+    if isinstance(level, str):
+        level_name = level
+        level = logging.getLevelName(level_name.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown logging level: {level_name}")
+
     if log_format is None:
         log_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 
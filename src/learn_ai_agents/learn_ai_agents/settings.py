@@ -379,12 +379,16 @@ class AppSettings(BaseSettings):
         use_cases: Registry of all available use cases
             (e.g., use_cases.basic_answer).
         agents: Configuration for all agents in the system, keyed by agent name.
+        enable_openapi: Whether to serve the OpenAPI schema and the /docs and /redoc pages.
+            Disable in production to skip building the schema and to import use case
+            routers on their first request instead of at startup.
     """
 
     # Provide defaults so we can instantiate AppSettings() without arguments
     components: ComponentsTree = Field(default_factory=dict)
     agents: AgentsTree = Field(default_factory=dict)
     use_cases: UseCasesTree = Field(default_factory=dict)
+    enable_openapi: bool = True
 
     model_config = SettingsConfigDict(extra="ignore", env_file=".env", case_sensitive=True)
 
@@ -0,0 +1,120 @@
+"""Tests for the use case routes whose routers are imported on their first request."""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from learn_ai_agents.app_factory import EAGER_ROUTERS_ENV, LazyUseCaseRoute, _register_routers, register_lazy_router
+from learn_ai_agents.settings import AppSettings, UseCaseConfig
+
+
+def make_config(router_factory: str, path_prefix: str = "/lazy") -> UseCaseConfig:
+    return UseCaseConfig.model_validate(
+        {
+            "info": {
+                "name": "Lazy",
+                "description": "Lazy use case",
+                "path_prefix": path_prefix,
+                "router_factory": router_factory,
+            },
+            "constructor": {"module_class": "tests.Lazy"},
+        }
+    )
+
+
+def get_router(use_case_config: UseCaseConfig) -> APIRouter:
+    router = APIRouter(prefix=use_case_config.info.path_prefix)
+
+    @router.get("/ping")
+    async def ping() -> dict:
+        return {"pong": True}
+
+    return router
+
+
+class TestLazyUseCaseRoute(unittest.IsolatedAsyncioTestCase):
+    """Test that routers resolve on first use and how import failures surface."""
+
+    async def test_router_is_resolved_on_first_request_only(self):
+        app = FastAPI()
+        factory = MagicMock(side_effect=get_router)
+        with patch("learn_ai_agents.app_factory.load_callable", return_value=factory) as load_callable:
+            register_lazy_router(app, "lazy", make_config("tests.lazy:get_router"))
+            (route,) = [route for route in app.router.routes if isinstance(route, LazyUseCaseRoute)]
+            load_callable.assert_not_called()
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+                first = await client.get("/lazy/ping")
+                second = await client.get("/lazy/ping")
+                outside = await client.get("/lazy-other/ping")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json(), {"pong": True})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(outside.status_code, 404)
+        load_callable.assert_called_once_with("tests.lazy:get_router")
+        factory.assert_called_once()
+        self.assertEqual(app.url_path_for("ping"), "/lazy/ping")
+        self.assertIsNotNone(route._router)
+
+    async def test_import_failure_surfaces_on_first_request(self):
+        app = FastAPI()
+        # Registering does not import anything, so a broken import path only fails once requested
+        register_lazy_router(app, "lazy", make_config("learn_ai_agents.does_not_exist:get_router"))
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+            with self.assertRaises(ModuleNotFoundError):
+                await client.get("/lazy/ping")
+            # The failure is not cached: the next request tries the import again
+            with self.assertRaises(ModuleNotFoundError):
+                await client.get("/lazy/ping")
+
+    async def test_concurrent_first_requests_import_once(self):
+        app = FastAPI()
+        factory = MagicMock(side_effect=get_router)
+        with patch("learn_ai_agents.app_factory.load_callable", return_value=factory) as load_callable:
+            register_lazy_router(app, "lazy", make_config("tests.lazy:get_router"))
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+                responses = await asyncio.gather(*(client.get("/lazy/ping") for _ in range(5)))
+
+        self.assertEqual([response.status_code for response in responses], [200] * 5)
+        load_callable.assert_called_once()
+        factory.assert_called_once()
+
+    def test_empty_prefix_is_rejected(self):
+        for path_prefix in ("", "/"):
+            with self.subTest(path_prefix=path_prefix), self.assertRaises(ValueError):
+                LazyUseCaseRoute("lazy", make_config("tests.lazy:get_router", path_prefix=path_prefix))
+
+
+class TestRegisterRouters(unittest.TestCase):
+    """Test when use case routers are registered lazily."""
+
+    def register(self, enable_openapi: bool) -> FastAPI:
+        app = FastAPI()
+        settings = AppSettings(use_cases={"lazy": make_config("tests.lazy:get_router")}, enable_openapi=enable_openapi)
+        with (
+            patch.dict("os.environ", {EAGER_ROUTERS_ENV: "0"}),
+            patch("learn_ai_agents.app_factory.load_callable", return_value=get_router),
+        ):
+            _register_routers(app, settings)
+        return app
+
+    def test_openapi_schema_lists_use_case_routes(self):
+        app = self.register(enable_openapi=True)
+
+        self.assertFalse(any(isinstance(route, LazyUseCaseRoute) for route in app.router.routes))
+        self.assertIn("/lazy/ping", app.openapi()["paths"])
+
+    def test_routers_are_lazy_without_openapi(self):
+        app = self.register(enable_openapi=False)
+
+        self.assertTrue(any(isinstance(route, LazyUseCaseRoute) for route in app.router.routes))
+
+
+if __name__ == "__main__":
+    unittest.main()
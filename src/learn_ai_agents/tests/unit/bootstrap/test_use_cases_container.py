@@ -0,0 +1,71 @@
+"""Tests for building the use cases configured in settings.yaml."""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from learn_ai_agents.infrastructure.bootstrap._utils import import_class_from_string
+from learn_ai_agents.infrastructure.bootstrap.use_cases_container import UseCasesContainer
+from learn_ai_agents.settings import AppSettings
+
+
+class TestUseCasesContainer(unittest.TestCase):
+    """Build every configured use case against mocked agents and components."""
+
+    def setUp(self):
+        self.settings = AppSettings()
+        self.container = UseCasesContainer.create(self.settings, agents=MagicMock(), components=MagicMock())
+
+    def test_every_configured_use_case_builds(self):
+        self.assertTrue(self.settings.use_cases)
+        for name, use_case_cfg in self.settings.use_cases.items():
+            with self.subTest(use_case=name):
+                use_case_cls = import_class_from_string(use_case_cfg.constructor.module_class)
+                self.assertIsInstance(self.container.get(name), use_case_cls)
+
+    def test_config_keys_reach_the_constructor(self):
+        vectorization = self.container.get("vectorization")
+
+        self.assertEqual(
+            vectorization.batch_threshold,
+            self.settings.use_cases["vectorization"].constructor.config["batch_threshold"],
+        )
+
+    def test_config_keys_the_constructor_does_not_take_are_skipped(self):
+        self.assertIn("retry_policy", self.settings.use_cases["robust"].constructor.config)
+
+        robust = self.container.get("robust")
+
+        self.assertFalse(hasattr(robust, "retry_policy"))
+
+    def test_listing_agent_use_cases_builds_nothing(self):
+        agent_use_cases = self.container.list_agent_answer_use_cases()
+
+        self.assertIn("robust", agent_use_cases)
+        self.assertNotIn("vectorization", agent_use_cases)
+        self.assertEqual(self.container._use_cases, {})
+
+
+class TestUseCasesContainerAget(unittest.IsolatedAsyncioTestCase):
+    """Test building use cases from request handlers."""
+
+    async def test_concurrent_first_requests_build_once_off_the_event_loop(self):
+        container = UseCasesContainer.create(AppSettings(), agents=MagicMock(), components=MagicMock())
+        build = container._build
+        build_threads: list[int] = []
+
+        def tracked_build(name: str):
+            build_threads.append(threading.get_ident())
+            return build(name)
+
+        with patch.object(container, "_build", side_effect=tracked_build):
+            use_cases = await asyncio.gather(*(container.aget("vectorization") for _ in range(5)))
+
+        self.assertTrue(all(use_case is use_cases[0] for use_case in use_cases))
+        self.assertEqual(len(build_threads), 1)
+        self.assertNotEqual(build_threads[0], threading.get_ident())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the OpenAI Batch API embedder with a mocked OpenAI client."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import orjson
+
+from learn_ai_agents.domain.exceptions import ComponentOperationException, EmbeddingBatchFailedException
+from learn_ai_agents.infrastructure.outbound.content_indexer.embedders.openai_batch import OpenAIBatchEmbedder
+
+
+def batch_output(results: dict[int, list[list[float]]]) -> bytes:
+    """Build a Batch API output file; ``results`` maps each request's first offset to its embeddings."""
+    lines = []
+    for offset, embeddings in results.items():
+        # The API does not promise any order for the data items either
+        data = [{"index": index, "embedding": embedding} for index, embedding in enumerate(embeddings)][::-1]
+        lines.append(orjson.dumps({"custom_id": str(offset), "response": {"body": {"data": data}}}))
+    return b"\n".join(lines)
+
+
+def batch_status(status: str, failed: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        status=status,
+        errors=None,
+        request_counts=SimpleNamespace(failed=failed),
+        output_file_id="file-out" if status == "completed" else None,
+        error_file_id=None,
+    )
+
+
+class TestOpenAIBatchEmbedder(unittest.IsolatedAsyncioTestCase):
+    """Test request building, result ordering and batch status handling."""
+
+    def setUp(self):
+        self.embedder = OpenAIBatchEmbedder(api_key="test", dimensions=2, texts_per_request=2)
+        self.embedder.client = AsyncMock()
+
+    async def test_requests_file_groups_texts_by_offset(self):
+        lines = [orjson.loads(line) for line in self.embedder._build_requests_file(["a", "b", "c"]).splitlines()]
+
+        self.assertEqual([line["custom_id"] for line in lines], ["0", "2"])
+        self.assertEqual([line["body"]["input"] for line in lines], [["a", "b"], ["c"]])
+        for line in lines:
+            self.assertEqual(line["method"], "POST")
+            self.assertEqual(line["url"], "/v1/embeddings")
+            self.assertEqual(line["body"]["model"], "text-embedding-3-small")
+            self.assertEqual(line["body"]["dimensions"], 2)
+
+    async def test_submit_uploads_requests_and_returns_batch_id(self):
+        self.embedder.client.files.create.return_value = SimpleNamespace(id="file-in")
+        self.embedder.client.batches.create.return_value = SimpleNamespace(id="batch-1")
+
+        batch_id = await self.embedder.embed_batch_async(["a", "b", "c"])
+
+        self.assertEqual(batch_id, "batch-1")
+        _, content = self.embedder.client.files.create.await_args.kwargs["file"]
+        self.assertEqual(len(content.splitlines()), 2)
+        self.assertEqual(self.embedder.client.batches.create.await_args.kwargs["input_file_id"], "file-in")
+
+    async def test_completed_batch_results_are_put_back_in_submission_order(self):
+        self.embedder.client.batches.retrieve.return_value = batch_status("completed")
+        # Requests come back out of order, and so do the embeddings inside each request
+        self.embedder.client.files.content.return_value = SimpleNamespace(
+            content=batch_output({2: [[3.0, 3.0]], 0: [[1.0, 1.0], [2.0, 2.0]]})
+        )
+
+        embeddings = await self.embedder.poll_batch("batch-1")
+
+        self.assertEqual(embeddings.dtype, np.float32)
+        np.testing.assert_array_equal(embeddings, [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+        self.embedder.client.files.content.assert_awaited_once_with("file-out")
+
+    async def test_running_batch_returns_none(self):
+        self.embedder.client.batches.retrieve.return_value = batch_status("in_progress")
+
+        self.assertIsNone(await self.embedder.poll_batch("batch-1"))
+        self.embedder.client.files.content.assert_not_awaited()
+
+    async def test_terminal_statuses_raise_batch_failed(self):
+        for status in ("failed", "expired", "cancelling", "cancelled"):
+            with self.subTest(status=status):
+                self.embedder.client.batches.retrieve.return_value = batch_status(status)
+                with self.assertRaises(EmbeddingBatchFailedException):
+                    await self.embedder.poll_batch("batch-1")
+
+    async def test_completed_batch_with_failed_requests_raises_batch_failed(self):
+        self.embedder.client.batches.retrieve.return_value = batch_status("completed", failed=1)
+
+        with self.assertRaises(EmbeddingBatchFailedException):
+            await self.embedder.poll_batch("batch-1")
+
+    async def test_retrieve_error_is_not_terminal(self):
+        self.embedder.client.batches.retrieve.side_effect = ConnectionError("timed out")
+
+        with self.assertRaises(ComponentOperationException) as ctx:
+            await self.embedder.poll_batch("batch-1")
+        self.assertNotIsInstance(ctx.exception, EmbeddingBatchFailedException)
+
+
+if __name__ == "__main__":
+    unittest.main()
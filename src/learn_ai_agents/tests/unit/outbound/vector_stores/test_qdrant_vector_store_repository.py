@@ -0,0 +1,28 @@
+"""Tests for the Qdrant vector store repository with a mocked Qdrant client."""
+
+import unittest
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+from learn_ai_agents.infrastructure.outbound.content_indexer.repositories.vector_stores.qdrant_vector_store_repository import (  # noqa: E501
+    QdrantVectorStoreRepository,
+)
+
+
+class TestQdrantUpsertVectors(unittest.IsolatedAsyncioTestCase):
+    """Test upserts that never reach Qdrant."""
+
+    async def test_empty_upsert_is_a_no_op(self):
+        client = AsyncMock()
+        repository = QdrantVectorStoreRepository(client=client, vector_size=384)
+
+        for vectors in (np.empty((0, 384), dtype=np.float32), np.array([], dtype=np.float32)):
+            with self.subTest(shape=vectors.shape):
+                self.assertEqual(await repository.upsert_vectors("doc-1", [], vectors), 0)
+
+        self.assertEqual(client.method_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
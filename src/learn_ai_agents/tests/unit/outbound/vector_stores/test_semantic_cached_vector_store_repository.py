@@ -0,0 +1,138 @@
+"""Tests for the semantic query cache in front of a vector store repository.
+
+The wrapped store is an AsyncMock, so these tests only check which searches
+reach it and what the cache answers on its own.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+from learn_ai_agents.infrastructure.outbound.content_indexer.repositories.vector_stores.semantic_cached_vector_store_repository import (  # noqa: E501
+    SemanticCachedVectorStoreRepository,
+)
+
+
+def _vector(*values: float) -> np.ndarray:
+    return np.array(values, dtype=np.float32)
+
+
+class TestSemanticCachedVectorStoreRepository(unittest.IsolatedAsyncioTestCase):
+    """Test cache hits, misses, eviction and invalidation."""
+
+    def setUp(self):
+        self.store = AsyncMock()
+        self.store.search_similar.side_effect = lambda document_id, query, limit, fields: [{"query": query.tolist()}]
+        self.store.batch_search_similar.side_effect = lambda document_id, queries, limit, fields: [
+            [{"query": query.tolist()}] for query in queries
+        ]
+        self.cache = SemanticCachedVectorStoreRepository(self.store, similarity_threshold=0.95, max_entries=2)
+
+    async def test_similar_query_is_a_hit(self):
+        first = await self.cache.search_similar("doc", _vector(1.0, 0.0))
+        second = await self.cache.search_similar("doc", _vector(0.99, 0.01))
+
+        self.assertEqual(second, first)
+        self.store.search_similar.assert_awaited_once()
+
+    async def test_dissimilar_query_or_other_key_is_a_miss(self):
+        await self.cache.search_similar("doc", _vector(1.0, 0.0))
+        await self.cache.search_similar("doc", _vector(0.0, 1.0))
+        await self.cache.search_similar("doc", _vector(1.0, 0.0), limit=10)
+        await self.cache.search_similar("other", _vector(1.0, 0.0))
+
+        self.assertEqual(self.store.search_similar.await_count, 4)
+
+    async def test_batch_search_only_sends_misses(self):
+        await self.cache.search_similar("doc", _vector(1.0, 0.0))
+
+        results = await self.cache.batch_search_similar("doc", np.stack([_vector(1.0, 0.0), _vector(0.0, 1.0)]))
+
+        self.assertEqual(results, [[{"query": [1.0, 0.0]}], [{"query": [0.0, 1.0]}]])
+        sent = self.store.batch_search_similar.await_args.args[1]
+        np.testing.assert_array_equal(sent, [[0.0, 1.0]])
+
+    async def test_oldest_entry_is_evicted_once_full(self):
+        for query in (_vector(1.0, 0.0), _vector(0.0, 1.0), _vector(-1.0, 0.0)):
+            await self.cache.search_similar("doc", query)
+
+        await self.cache.search_similar("doc", _vector(-1.0, 0.0))
+        self.assertEqual(self.store.search_similar.await_count, 3)
+        await self.cache.search_similar("doc", _vector(1.0, 0.0))
+        self.assertEqual(self.store.search_similar.await_count, 4)
+
+    async def test_least_recently_used_key_is_evicted(self):
+        cache = SemanticCachedVectorStoreRepository(self.store, max_keys=2)
+        query = _vector(1.0, 0.0)
+        await cache.search_similar("a", query)
+        await cache.search_similar("b", query)
+        await cache.search_similar("a", query)  # hit, "b" becomes least recently used
+        await cache.search_similar("c", query)
+
+        await cache.search_similar("a", query)
+        self.assertEqual(self.store.search_similar.await_count, 3)
+        await cache.search_similar("b", query)
+        self.assertEqual(self.store.search_similar.await_count, 4)
+
+    async def test_buffer_grows_lazily_up_to_max_entries(self):
+        cache = SemanticCachedVectorStoreRepository(self.store, similarity_threshold=0.9999, max_entries=40)
+        angles = np.linspace(0.0, np.pi / 2, 40)
+        await cache.search_similar("doc", _vector(1.0, 0.0))
+        (buffer,) = cache._caches.values()
+        self.assertLess(len(buffer.vectors), 40)
+
+        for angle in angles[1:]:
+            await cache.search_similar("doc", _vector(np.cos(angle), np.sin(angle)))
+        self.assertEqual(len(buffer.vectors), 40)
+        self.assertEqual(buffer.size, 40)
+
+    async def test_upsert_invalidates_the_document(self):
+        self.store.upsert_vectors.return_value = 1
+        await self.cache.search_similar("doc", _vector(1.0, 0.0))
+
+        await self.cache.upsert_vectors("doc", [], np.zeros((0, 2), dtype=np.float32))
+        await self.cache.search_similar("doc", _vector(1.0, 0.0))
+
+        self.assertEqual(self.store.search_similar.await_count, 2)
+
+    async def test_search_in_flight_during_invalidation_is_not_cached(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_search(document_id, query, limit, fields):
+            started.set()
+            await release.wait()
+            return [{"stale": True}]
+
+        self.store.search_similar.side_effect = slow_search
+        search = asyncio.create_task(self.cache.search_similar("doc", _vector(1.0, 0.0)))
+        await started.wait()
+        self.cache.invalidate("doc")
+        release.set()
+        self.assertEqual(await search, [{"stale": True}])
+
+        self.store.search_similar.side_effect = lambda document_id, query, limit, fields: [{"stale": False}]
+        self.assertEqual(await self.cache.search_similar("doc", _vector(1.0, 0.0)), [{"stale": False}])
+
+    async def test_generations_are_only_kept_while_searches_are_in_flight(self):
+        for document_id in ("a", "b", "c"):
+            await self.cache.search_similar(document_id, _vector(1.0, 0.0))
+            self.cache.invalidate(document_id)
+
+        self.assertEqual(self.cache._generations, {})
+        self.assertEqual(self.cache._in_flight, {})
+
+    async def test_modifying_returned_payloads_does_not_change_the_cache(self):
+        miss = await self.cache.search_similar("doc", _vector(1.0, 0.0))
+        miss[0]["query"].append(2.0)
+        hit = await self.cache.search_similar("doc", _vector(1.0, 0.0))
+        hit[0]["extra"] = True
+        (batch_hit,) = await self.cache.batch_search_similar("doc", np.stack([_vector(1.0, 0.0)]))
+
+        self.assertEqual(batch_hit, [{"query": [1.0, 0.0]}])
+        self.store.search_similar.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
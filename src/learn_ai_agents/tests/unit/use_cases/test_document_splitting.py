@@ -0,0 +1,82 @@
+"""Tests for the document splitting use case."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from learn_ai_agents.application.dtos.content_indexer.document_splitting import DocumentSplittingRequestDTO
+from learn_ai_agents.application.use_cases.content_indexer.document_splitting.use_case import (
+    DocumentSplittingUseCase,
+)
+from learn_ai_agents.domain.exceptions import BusinessRuleException
+from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.source_ingestion import Document
+
+DOCUMENT_ID = "doc-1"
+
+
+def split_document_iter(document: Document, splitter_approach: str):
+    """Split a document into a single chunk holding its whole content."""
+    yield DocumentChunk(
+        chunk_id=f"{document.document_id}:{splitter_approach}:0",
+        document_id=document.document_id,
+        split_index=0,
+        content=str(document.content),
+        metadata={},
+        character_name=document.character_name,
+    )
+
+
+class BlockingChunkRepository:
+    """Chunk repository that fails one upsert once every other upsert is in flight."""
+
+    def __init__(self, in_flight: int):
+        self.in_flight = in_flight
+        self.started = 0
+        self.all_started = asyncio.Event()
+        self.cancelled = 0
+
+    async def upsert_chunks(self, chunks: list[DocumentChunk]) -> int:
+        self.started += 1
+        if self.started == self.in_flight:
+            self.all_started.set()
+        if chunks[0].content == "fails":
+            await self.all_started.wait()
+            raise RuntimeError("mongo down")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return len(chunks)
+
+
+class TestDocumentSplittingUseCase(unittest.IsolatedAsyncioTestCase):
+    """Test how a failed document stops the others."""
+
+    async def test_failed_document_cancels_the_other_documents(self):
+        contents = ["fails", "second", "third"]
+        document_repository = AsyncMock()
+        document_repository.find_documents_by_document_id.return_value = [
+            Document(content=content, character_name="Astarion", document_id=DOCUMENT_ID) for content in contents
+        ]
+        splitter = MagicMock()
+        splitter.split_document_iter.side_effect = split_document_iter
+        chunk_repository = BlockingChunkRepository(in_flight=len(contents))
+        use_case = DocumentSplittingUseCase(
+            document_repository=document_repository,
+            chunk_repository=chunk_repository,
+            document_splitters={"markdown": splitter},
+            max_parallel_splits=len(contents),
+        )
+        request = DocumentSplittingRequestDTO(document_id=DOCUMENT_ID, splitter_approach="markdown")
+
+        with self.assertRaisesRegex(BusinessRuleException, "mongo down"):
+            await asyncio.wait_for(use_case.split_documents(request), timeout=5)
+
+        # The other documents were stopped by the time the error was raised
+        self.assertEqual(chunk_repository.cancelled, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for the message checks shared by the agent use cases."""
+
+import unittest
+
+from learn_ai_agents.application.dtos.agents.basic_answer import AnswerRequestDTO, ConfigDTO
+from learn_ai_agents.application.use_cases.message_input import trim_request
+
+
+def _request(message: str) -> AnswerRequestDTO:
+    return AnswerRequestDTO(config=ConfigDTO(conversation_id="conv-1"), message=message)
+
+
+class TestTrimRequest(unittest.TestCase):
+    """Test how requests are trimmed before reaching the agent."""
+
+    def test_clean_request_is_returned_as_is(self):
+        cmd = _request("Hello")
+
+        self.assertIs(trim_request(cmd), cmd)
+
+    def test_message_is_stripped_and_capped(self):
+        trimmed = trim_request(_request("  Hello there  "), max_chars=5)
+
+        self.assertEqual(trimmed, _request("Hello"))
+
+    def test_empty_or_blank_message_gives_none(self):
+        for message in ("", " \n\t "):
+            with self.subTest(message=message):
+                self.assertIsNone(trim_request(_request(message)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for the text delta coalescing used by the streaming agent use cases."""
+
+import asyncio
+import unittest
+from contextlib import aclosing
+
+from learn_ai_agents.application.use_cases.streaming import coalesce_text_deltas
+from learn_ai_agents.domain.models.agents.messages import ChunkDelta
+
+
+def _text(text: str) -> ChunkDelta:
+    return ChunkDelta(kind="text", text=text)
+
+
+async def _stream(*items: ChunkDelta | float | Exception):
+    """Yield chunks; a float sleeps that many seconds and an exception is raised."""
+    for item in items:
+        if isinstance(item, float):
+            await asyncio.sleep(item)
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield item
+
+
+async def _collect(chunks, **kwargs) -> list[ChunkDelta]:
+    async with aclosing(coalesce_text_deltas(chunks, **kwargs)) as stream:
+        return [chunk async for chunk in stream]
+
+
+class TestCoalesceTextDeltas(unittest.IsolatedAsyncioTestCase):
+    """Test how text deltas are merged, flushed and how failures surface."""
+
+    async def test_deltas_within_window_are_merged(self):
+        result = await _collect(_stream(_text("Hel"), _text("lo"), _text("!")), window=1.0)
+
+        self.assertEqual(result, [_text("Hello!")])
+
+    async def test_window_expiry_flushes_buffered_text(self):
+        result = await _collect(_stream(_text("a"), _text("b"), 0.2, _text("c")), window=0.05)
+
+        self.assertEqual(result, [_text("ab"), _text("c")])
+
+    async def test_max_chars_flushes_immediately(self):
+        result = await _collect(_stream(_text("abc"), _text("de"), _text("f")), window=1.0, max_chars=5)
+
+        self.assertEqual(result, [_text("abcde"), _text("f")])
+
+    async def test_non_text_chunk_flushes_and_passes_through(self):
+        tool_start = ChunkDelta(kind="tool_start", tool_name="search")
+        result = await _collect(_stream(_text("a"), tool_start, _text("b")), window=1.0)
+
+        self.assertEqual(result, [_text("a"), tool_start, _text("b")])
+
+    async def test_stream_error_is_raised_after_buffered_text(self):
+        received: list[ChunkDelta] = []
+
+        with self.assertRaisesRegex(RuntimeError, "agent failed"):
+            async with aclosing(
+                coalesce_text_deltas(_stream(_text("partial"), RuntimeError("agent failed")), window=1.0)
+            ) as stream:
+                async for chunk in stream:
+                    received.append(chunk)
+
+        self.assertEqual(received, [_text("partial")])
+
+    async def test_closing_early_stops_the_producer(self):
+        cancelled = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield ChunkDelta(kind="done")
+                    await asyncio.sleep(0)
+            finally:
+                cancelled.set()
+
+        async with aclosing(coalesce_text_deltas(endless())) as stream:
+            async for _ in stream:
+                break
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+    async def test_upstream_generator_is_closed_when_aclose_returns(self):
+        closed = False
+
+        async def agent_stream():
+            nonlocal closed
+            try:
+                # More chunks than the read-ahead queue holds, so the producer is left waiting on it
+                for _ in range(200):
+                    yield ChunkDelta(kind="done")
+            finally:
+                closed = True
+
+        stream = coalesce_text_deltas(agent_stream())
+        await anext(stream)
+        await asyncio.sleep(0)
+
+        await stream.aclose()
+
+        self.assertTrue(closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,252 @@
+"""Tests for the vectorization use case.
+
+The openai approach runs end to end through the real OpenAI embedders and
+the real Qdrant repository; only the OpenAI and Qdrant clients are mocked.
+The synchronous worker pool is tested with a fake embedder.
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import orjson
+
+from learn_ai_agents.application.dtos.content_indexer.vectorization import VectorizationRequestDTO
+from learn_ai_agents.application.use_cases.content_indexer.vectorization.use_case import VectorizationUseCase
+from learn_ai_agents.domain.exceptions import BusinessRuleException
+from learn_ai_agents.domain.models.content_indexer.document_chunk import DocumentChunk
+from learn_ai_agents.domain.models.content_indexer.embedding_batch import EmbeddingBatch
+from learn_ai_agents.infrastructure.outbound.content_indexer.embedders.openai_batch import OpenAIBatchEmbedder
+from learn_ai_agents.infrastructure.outbound.content_indexer.embedders.openai_embedder import OpenAIEmbedder
+from learn_ai_agents.infrastructure.outbound.content_indexer.repositories.vector_stores.qdrant_vector_store_repository import (  # noqa: E501
+    QdrantVectorStoreRepository,
+)
+
+DOCUMENT_ID = "doc-1"
+OPENAI_DIMENSIONS = 1536
+
+
+def make_chunks(count: int) -> list[DocumentChunk]:
+    return [
+        DocumentChunk(
+            chunk_id=f"{DOCUMENT_ID}:markdown:{index}",
+            document_id=DOCUMENT_ID,
+            split_index=index,
+            content=f"chunk {index}",
+            metadata={},
+            character_name="Astarion",
+        )
+        for index in range(count)
+    ]
+
+
+class InMemoryEmbeddingBatchRepository:
+    """Embedding batch repository keeping its records in a dict."""
+
+    def __init__(self):
+        self.batches: dict[str, EmbeddingBatch] = {}
+
+    async def save_batch(self, batch: EmbeddingBatch) -> EmbeddingBatch:
+        self.batches[batch.batch_id] = batch
+        return batch
+
+    async def find_pending_batch(self, document_id: str, vectorization_approach: str) -> EmbeddingBatch | None:
+        for batch in self.batches.values():
+            if batch.document_id == document_id and batch.vectorization_approach == vectorization_approach:
+                return batch
+        return None
+
+    async def delete_batch(self, batch_id: str) -> bool:
+        return self.batches.pop(batch_id, None) is not None
+
+
+class TestOpenAIVectorization(unittest.IsolatedAsyncioTestCase):
+    """Vectorize documents with the openai approach against mocked OpenAI and Qdrant clients."""
+
+    def setUp(self):
+        self.chunks = make_chunks(3)
+        self.chunk_repository = AsyncMock()
+        self.chunk_repository.find_chunks_by_document_id.return_value = self.chunks
+
+        self.batch_embedder = OpenAIBatchEmbedder(api_key="test", dimensions=OPENAI_DIMENSIONS)
+        self.batch_embedder.client = AsyncMock()
+        self.batch_embedder.client.files.create.return_value = SimpleNamespace(id="file-in")
+        self.batch_embedder.client.batches.create.return_value = SimpleNamespace(id="batch-1")
+        self.embedder = OpenAIEmbedder(api_key="test", dimensions=OPENAI_DIMENSIONS)
+        self.embedder.client = AsyncMock()
+
+        # The store's configured vector_size is the sentence-transformers one
+        self.qdrant = AsyncMock()
+        self.qdrant.collection_exists.return_value = False
+        self.vector_store = QdrantVectorStoreRepository(client=self.qdrant, vector_size=384)
+
+        self.batch_repository = InMemoryEmbeddingBatchRepository()
+        self.use_case = VectorizationUseCase(
+            chunk_repository=self.chunk_repository,
+            embedders={"openai": self.embedder},
+            vector_store=self.vector_store,
+            batch_embedders={"openai": self.batch_embedder},
+            batch_repository=self.batch_repository,
+            batch_threshold=2,
+        )
+        self.request = VectorizationRequestDTO(document_id=DOCUMENT_ID, vectorization_approach="openai")
+
+    def set_batch_status(self, status: str) -> None:
+        completed = status == "completed"
+        self.batch_embedder.client.batches.retrieve.return_value = SimpleNamespace(
+            status=status,
+            errors=None,
+            request_counts=SimpleNamespace(failed=0),
+            output_file_id="file-out" if completed else None,
+            error_file_id=None,
+        )
+        if completed:
+            data = [{"index": index, "embedding": [float(index)] * OPENAI_DIMENSIONS} for index in range(3)]
+            output = orjson.dumps({"custom_id": "0", "response": {"body": {"data": data}}})
+            self.batch_embedder.client.files.content.return_value = SimpleNamespace(content=output)
+
+    def upserted_vectors(self) -> list[list[float]]:
+        return [vector for call in self.qdrant.upsert.await_args_list for vector in call.kwargs["points"].vectors]
+
+    async def test_large_document_is_pending_until_the_batch_completes(self):
+        self.set_batch_status("in_progress")
+
+        pending = await self.use_case.vectorize_chunks(self.request)
+
+        self.assertEqual(pending.status, "pending")
+        self.assertEqual(pending.batch_id, "batch-1")
+        self.assertEqual(pending.total_vectors_created, 0)
+        self.assertIn("batch-1", self.batch_repository.batches)
+        self.assertEqual(self.qdrant.create_collection.await_args.kwargs["vectors_config"].size, OPENAI_DIMENSIONS)
+        self.qdrant.upsert.assert_not_awaited()
+
+        self.qdrant.collection_exists.return_value = True
+        self.set_batch_status("completed")
+
+        completed = await self.use_case.vectorize_chunks(self.request)
+
+        self.assertEqual(completed.status, "completed")
+        self.assertEqual(completed.total_vectors_created, 3)
+        self.batch_embedder.client.batches.create.assert_awaited_once()
+        self.assertEqual(self.batch_repository.batches, {})
+        vectors = self.upserted_vectors()
+        self.assertEqual([len(vector) for vector in vectors], [OPENAI_DIMENSIONS] * 3)
+        self.assertEqual([vector[0] for vector in vectors], [0.0, 1.0, 2.0])
+
+    async def test_failed_batch_is_discarded(self):
+        self.set_batch_status("expired")
+
+        with self.assertRaises(BusinessRuleException):
+            await self.use_case.vectorize_chunks(self.request)
+
+        self.assertEqual(self.batch_repository.batches, {})
+
+    async def test_transient_poll_error_keeps_the_batch(self):
+        self.batch_embedder.client.batches.retrieve.side_effect = ConnectionError("timed out")
+
+        with self.assertRaises(BusinessRuleException):
+            await self.use_case.vectorize_chunks(self.request)
+
+        self.assertIn("batch-1", self.batch_repository.batches)
+
+    async def test_storage_failure_keeps_the_batch(self):
+        self.set_batch_status("completed")
+        self.qdrant.upsert.side_effect = ConnectionError("qdrant down")
+
+        with self.assertRaises(BusinessRuleException):
+            await self.use_case.vectorize_chunks(self.request)
+
+        self.assertIn("batch-1", self.batch_repository.batches)
+
+    async def test_small_document_uses_the_synchronous_embedder(self):
+        chunks = make_chunks(2)
+        self.chunk_repository.find_chunks_by_document_id.return_value = chunks
+        self.embedder.client.embeddings.create.return_value = SimpleNamespace(
+            data=[SimpleNamespace(index=index, embedding=[0.5] * OPENAI_DIMENSIONS) for index in (1, 0)]
+        )
+
+        result = await self.use_case.vectorize_chunks(self.request)
+
+        self.assertEqual(result.status, "completed")
+        self.assertEqual(result.total_vectors_created, 2)
+        self.batch_embedder.client.batches.create.assert_not_awaited()
+        self.assertEqual([len(vector) for vector in self.upserted_vectors()], [OPENAI_DIMENSIONS] * 2)
+
+
+class BlockingEmbedder:
+    """Embedder that fails on the first chunk once every other micro-batch is in flight."""
+
+    def __init__(self, in_flight: int):
+        self.in_flight = in_flight
+        self.started = 0
+        self.all_started = asyncio.Event()
+        self.cancelled = 0
+
+    def get_model_name(self) -> str:
+        return "blocking"
+
+    def get_dimensions(self) -> int:
+        return 2
+
+    async def embed_texts(self, texts: list[str]):
+        self.started += 1
+        if self.started == self.in_flight:
+            self.all_started.set()
+        if texts == ["chunk 0"]:
+            await self.all_started.wait()
+            raise RuntimeError("rate limited")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+class TestEmbedAndStoreWorkers(unittest.IsolatedAsyncioTestCase):
+    """Test the synchronous embedding worker pool."""
+
+    async def test_failed_micro_batch_cancels_the_other_workers(self):
+        chunk_repository = AsyncMock()
+        chunk_repository.find_chunks_by_document_id.return_value = make_chunks(3)
+        embedder = BlockingEmbedder(in_flight=3)
+        cancelled_before_finalize = []
+        vector_store = AsyncMock()
+        vector_store.finalize_ingestion.side_effect = lambda _: cancelled_before_finalize.append(embedder.cancelled)
+        use_case = VectorizationUseCase(
+            chunk_repository=chunk_repository,
+            embedders={"blocking": embedder},
+            vector_store=vector_store,
+            embedding_batch_size=1,
+            embedding_concurrency=3,
+        )
+        request = VectorizationRequestDTO(document_id=DOCUMENT_ID, vectorization_approach="blocking")
+
+        with self.assertRaisesRegex(BusinessRuleException, "rate limited"):
+            await asyncio.wait_for(use_case.vectorize_chunks(request), timeout=5)
+
+        self.assertEqual(embedder.cancelled, 2)
+        vector_store.upsert_vectors.assert_not_awaited()
+        vector_store.finalize_ingestion.assert_awaited_once_with(DOCUMENT_ID)
+        self.assertEqual(cancelled_before_finalize, [2])
+
+    async def test_finalize_failure_does_not_hide_the_embedding_error(self):
+        chunk_repository = AsyncMock()
+        chunk_repository.find_chunks_by_document_id.return_value = make_chunks(1)
+        vector_store = AsyncMock()
+        vector_store.finalize_ingestion.side_effect = ConnectionError("qdrant down")
+        use_case = VectorizationUseCase(
+            chunk_repository=chunk_repository,
+            embedders={"blocking": BlockingEmbedder(in_flight=1)},
+            vector_store=vector_store,
+        )
+        request = VectorizationRequestDTO(document_id=DOCUMENT_ID, vectorization_approach="blocking")
+
+        with self.assertRaisesRegex(BusinessRuleException, "Embedding generation failed: rate limited"):
+            await use_case.vectorize_chunks(request)
+
+        vector_store.finalize_ingestion.assert_awaited_once_with(DOCUMENT_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()